@@ -0,0 +1,193 @@
+"""A local stand-in for the Notion API used by the benchmarks.
+
+Serves just enough of the API for the benchmark scenarios, with knobs for
+the things that dominate real-world performance:
+
+* ``latency`` – seconds slept before every response (plus uniform ``jitter``);
+* ``rows`` / ``payload_bytes`` – size of the paginated data source and search
+  results, and padding added to every row;
+* ``fanout`` / ``depth`` – shape of the synthetic block tree under any ID;
+* ``throttle_every`` – answer every Nth request with 429 and ``Retry-After``.
+
+Routes: ``POST /v1/data_sources/{id}/query``, ``POST /v1/search``,
+``GET /v1/blocks/{id}/children``, ``POST /v1/pages`` and ``GET /v1/pages/{id}``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class ServerConfig:
+    latency: float = 0.005
+    jitter: float = 0.002
+    rows: int = 1000
+    payload_bytes: int = 512
+    fanout: int = 5
+    depth: int = 3
+    throttle_every: int = 0
+    retry_after: float = 0.05
+
+
+def _row(index: int, padding: str) -> dict:
+    return {
+        "object": "page",
+        "id": f"row-{index:06d}",
+        "created_time": "2025-06-01T10:00:00.000Z",
+        "last_edited_time": "2025-06-01T10:00:00.000Z",
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": f"Row {index}"}]},
+            "Points": {"type": "number", "number": index % 17},
+            "Notes": {"type": "rich_text", "rich_text": [{"plain_text": padding}]},
+        },
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "MockNotionServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, payload: dict, headers: dict | None = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _admit(self) -> bool:
+        """Simulate latency and throttling; return False if a 429 was sent."""
+        config = self.server.config
+        time.sleep(config.latency + random.uniform(0, config.jitter))
+        if self.server.should_throttle():
+            self._reply(
+                429,
+                {"object": "error", "status": 429, "code": "rate_limited"},
+                {"Retry-After": str(config.retry_after)},
+            )
+            return False
+        return True
+
+    def _page_of(self, start: int, size: int) -> dict:
+        config = self.server.config
+        end = min(start + size, config.rows)
+        more = end < config.rows
+        return {
+            "object": "list",
+            "results": [_row(i, self.server.padding) for i in range(start, end)],
+            "has_more": more,
+            "next_cursor": str(end) if more else None,
+        }
+
+    def do_POST(self):
+        body = self._body()
+        if not self._admit():
+            return
+        path = urlsplit(self.path).path
+        if path.endswith("/query") or path == "/v1/search":
+            start = int(body.get("start_cursor") or 0)
+            return self._reply(200, self._page_of(start, int(body.get("page_size") or 100)))
+        if path == "/v1/pages":
+            page = {"object": "page", "id": f"new-{self.server.next_id()}", **body}
+            return self._reply(200, page)
+        self._reply(404, {"object": "error", "status": 404})
+
+    def do_GET(self):
+        if not self._admit():
+            return
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        if len(parts) == 4 and parts[1] == "blocks" and parts[3] == "children":
+            query = parse_qs(url.query)
+            start = int(query.get("start_cursor", ["0"])[0])
+            size = int(query.get("page_size", ["100"])[0])
+            return self._reply(200, self._children(parts[2], start, size))
+        if len(parts) == 3 and parts[1] == "pages":
+            return self._reply(200, _row(0, self.server.padding) | {"id": parts[2]})
+        self._reply(404, {"object": "error", "status": 404})
+
+    def _children(self, block_id: str, start: int, size: int) -> dict:
+        config = self.server.config
+        level = block_id.count(".")
+        kids = [f"{block_id}.{i}" for i in range(config.fanout)] if level < config.depth else []
+        page = kids[start : start + size]
+        more = start + size < len(kids)
+        return {
+            "object": "list",
+            "results": [
+                {
+                    "object": "block",
+                    "id": kid,
+                    "type": "paragraph",
+                    "has_children": level + 1 < config.depth,
+                    "paragraph": {"rich_text": [{"plain_text": self.server.padding}]},
+                }
+                for kid in page
+            ],
+            "has_more": more,
+            "next_cursor": str(start + size) if more else None,
+        }
+
+
+class MockNotionServer(ThreadingHTTPServer):
+    """Threaded mock Notion server; use as a context manager to run it in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, config: ServerConfig | None = None, port: int = 0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.config = config or ServerConfig()
+        self.padding = "x" * self.config.payload_bytes
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._ids = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/v1"
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self._requests += 1
+            every = self.config.throttle_every
+            return bool(every) and self._requests % every == 0
+
+    def next_id(self) -> int:
+        with self._lock:
+            self._ids += 1
+            return self._ids
+
+    def describe(self) -> dict:
+        return asdict(self.config)
+
+    def __enter__(self) -> "MockNotionServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    with MockNotionServer(port=8765) as server:
+        print(f"mock Notion API at {server.base_url}")
+        threading.Event().wait()
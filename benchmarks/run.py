@@ -0,0 +1,249 @@
+"""Run the client benchmarks against the local mock server and emit JSON.
+
+Usage::
+
+    python benchmarks/run.py                                # all scenarios, both clients
+    python benchmarks/run.py --scenarios scan,tree --clients sync --output base.json
+    python benchmarks/run.py --latency 0.02 --throttle-every 25 --compare base.json
+
+Each result records requests/sec (HTTP attempts, including retries, per
+wall-clock second), items/sec, p50/p99 per-attempt latency in milliseconds,
+the number of throttled attempts and the peak traced Python memory.  With
+``--compare``, scenarios whose requests/sec dropped by more than
+``--threshold`` against a previous output file are listed and the exit
+status is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import version
+from typing import Any, Callable
+
+from mock_server import MockNotionServer, ServerConfig
+
+from notion_sdk import AsyncNotionClient, NotionClient
+from notion_sdk.ratelimit import RetryPolicy
+
+SCENARIOS = ("scan", "tree", "bulk_create", "search")
+
+
+class LatencyRecorder:
+    """Hook that keeps the duration and status of every attempt."""
+
+    def __init__(self) -> None:
+        self.durations: list[float] = []
+        self.throttled = 0
+
+    def __call__(self, event: Any) -> None:
+        self.durations.append(event.total)
+        if event.status == 429:
+            self.throttled += 1
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# ---- scenarios: each returns the number of items it processed -------------
+
+
+def _pages(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "parent": {"data_source_id": "ds-bench"},
+            "properties": {"Name": {"title": [{"text": {"content": f"Item {i}"}}]}},
+        }
+        for i in range(n)
+    ]
+
+
+def scan(client: NotionClient, args: argparse.Namespace) -> int:
+    return sum(1 for _ in client.iter_query_data_source("ds-bench"))
+
+
+def tree(client: NotionClient, args: argparse.Namespace) -> int:
+    return sum(1 for _ in client.iter_block_tree("root", max_concurrency=args.concurrency))
+
+
+def bulk_create(client: NotionClient, args: argparse.Namespace) -> int:
+    results = client.bulk_create_pages(_pages(args.bulk_items), max_concurrency=args.concurrency)
+    return sum(1 for r in results if r.ok)
+
+
+def search(client: NotionClient, args: argparse.Namespace) -> int:
+    return sum(1 for _ in client.iter_search("Row"))
+
+
+async def ascan(client: AsyncNotionClient, args: argparse.Namespace) -> int:
+    return sum([1 async for _ in client.iter_query_data_source("ds-bench")])
+
+
+async def atree(client: AsyncNotionClient, args: argparse.Namespace) -> int:
+    return sum([1 async for _ in client.iter_block_tree("root", max_concurrency=args.concurrency)])
+
+
+async def abulk_create(client: AsyncNotionClient, args: argparse.Namespace) -> int:
+    results = client.bulk_create_pages(_pages(args.bulk_items), max_concurrency=args.concurrency)
+    return sum([1 async for r in results if r.ok])
+
+
+async def asearch(client: AsyncNotionClient, args: argparse.Namespace) -> int:
+    return sum([1 async for _ in client.iter_search("Row")])
+
+
+SYNC: dict[str, Callable[..., int]] = {
+    "scan": scan,
+    "tree": tree,
+    "bulk_create": bulk_create,
+    "search": search,
+}
+ASYNC: dict[str, Callable[..., Any]] = {
+    "scan": ascan,
+    "tree": atree,
+    "bulk_create": abulk_create,
+    "search": asearch,
+}
+
+
+def _client_kwargs(server: MockNotionServer, recorder: LatencyRecorder) -> dict[str, Any]:
+    return {
+        "api_key": "bench",
+        "base_url": server.base_url,
+        "rate_limit": None,
+        "retry_policy": RetryPolicy(max_retries=8, backoff_base=0.01),
+        "hooks": [recorder],
+    }
+
+
+def run_one(server: MockNotionServer, scenario: str, kind: str, args: argparse.Namespace) -> dict:
+    recorder = LatencyRecorder()
+    if args.memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    if kind == "sync":
+        client = NotionClient(**_client_kwargs(server, recorder))
+        try:
+            items = SYNC[scenario](client, args)
+        finally:
+            client.close()
+    else:
+
+        async def main() -> int:
+            async with AsyncNotionClient(**_client_kwargs(server, recorder)) as client:
+                return await ASYNC[scenario](client, args)
+
+        items = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    peak = None
+    if args.memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    requests = len(recorder.durations)
+    return {
+        "scenario": scenario,
+        "client": kind,
+        "items": items,
+        "requests": requests,
+        "throttled": recorder.throttled,
+        "seconds": round(elapsed, 4),
+        "req_per_sec": round(requests / elapsed, 2),
+        "items_per_sec": round(items / elapsed, 2),
+        "p50_ms": round(_percentile(recorder.durations, 0.50) * 1000, 3),
+        "p99_ms": round(_percentile(recorder.durations, 0.99) * 1000, 3),
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results: list[dict], baseline_path: str, threshold: float) -> list[str]:
+    """Describe scenarios whose req/s fell more than *threshold* below the baseline."""
+    with open(baseline_path) as f:
+        baseline = {(r["scenario"], r["client"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        old = baseline.get((r["scenario"], r["client"]))
+        if old and old["req_per_sec"] and r["req_per_sec"] < old["req_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{r['client']}/{r['scenario']}: {old['req_per_sec']} -> {r['req_per_sec']} req/s"
+            )
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--clients", default="sync,async")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--bulk-items", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=ServerConfig.latency)
+    parser.add_argument("--jitter", type=float, default=ServerConfig.jitter)
+    parser.add_argument("--rows", type=int, default=ServerConfig.rows)
+    parser.add_argument("--payload-bytes", type=int, default=ServerConfig.payload_bytes)
+    parser.add_argument("--fanout", type=int, default=ServerConfig.fanout)
+    parser.add_argument("--depth", type=int, default=ServerConfig.depth)
+    parser.add_argument("--throttle-every", type=int, default=ServerConfig.throttle_every)
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip tracemalloc (it slows the client down noticeably)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="previous output to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    config = ServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rows=args.rows,
+        payload_bytes=args.payload_bytes,
+        fanout=args.fanout,
+        depth=args.depth,
+        throttle_every=args.throttle_every,
+    )
+    results = []
+    with MockNotionServer(config) as server:
+        for scenario in args.scenarios.split(","):
+            for kind in args.clients.split(","):
+                for _ in range(args.repeat):
+                    results.append(run_one(server, scenario, kind, args))
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "notion_sdk": version("notion-sdk"),
+        "server": server.describe(),
+        "settings": {
+            "concurrency": args.concurrency,
+            "bulk_items": args.bulk_items,
+            "memory": args.memory,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
 from .client import NotionClient
+from .async_client import AsyncNotionClient
 
-__all__ = ["NotionClient"]
+__all__ = ["NotionClient", "AsyncNotionClient"]
@@ -0,0 +1,270 @@
+"""Asynchronous Notion API client.
+
+:class:`AsyncNotionClient` reuses the same endpoint mixins as
+:class:`~notion_sdk.client.NotionClient`.  The mixin methods only build a
+path and body and hand them to ``self._get``/``_post``/``_patch``/``_delete``;
+here those helpers are coroutines, so every endpoint method returns an
+awaitable without being redefined.  Methods that chain several requests
+(e.g. ``query_database``) are overridden by the ``Async*Mixin`` classes, and
+the ``iter_*`` and ``bulk_*`` helpers return async iterators through
+:meth:`_paginate` and :meth:`_bulk_map`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+import httpx
+
+from .pages import AsyncPagesMixin
+from .databases import AsyncDatabasesMixin
+from .blocks import AsyncBlocksMixin
+from .users import UsersMixin
+from .comments import CommentsMixin
+from .search import SearchMixin
+from .client import (
+    NOTION_BASE_URL,
+    _default_headers,
+    _make_rate_limiter,
+    _resolve_api_key,
+)
+from .bulk import ItemResult, _Fanout, abulk_map
+from .cache import ResponseCache, TTLCache, is_write
+from .codec import ListStreamDecoder, get_codec
+from .hooks import Hook, _AttemptTimer, emit
+from .pagination import apaginate, apaginate_stream
+from .ratelimit import DEFAULT_RATE_LIMIT, RateLimiter, RetryPolicy, _queue_wait
+from .singleflight import AsyncSingleFlight
+from .transport import DEFAULT_LIMITS, DEFAULT_TIMEOUT, AsyncPooledTransport
+
+
+class AsyncNotionClient(
+    AsyncPagesMixin,
+    AsyncDatabasesMixin,
+    AsyncBlocksMixin,
+    UsersMixin,
+    CommentsMixin,
+    SearchMixin,
+):
+    """Asynchronous Python client for the Notion API v2025-09-03.
+
+    Usage::
+
+        async with AsyncNotionClient() as client:
+            page = await client.get_page(page_id)
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = NOTION_BASE_URL,
+        transport: httpx.AsyncBaseTransport | None = None,
+        rate_limit: float | RateLimiter | None = DEFAULT_RATE_LIMIT,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        data_source_cache: TTLCache | None = None,
+        response_cache: ResponseCache | None = None,
+        hooks: list[Hook] | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        codec: str | Any | None = None,
+        coalesce: bool = True,
+    ):
+        self.api_key = _resolve_api_key(api_key)
+        self.base_url = base_url.rstrip("/")
+        self.rate_limiter = _make_rate_limiter(rate_limit)
+        self.retry_policy = retry_policy
+        self.data_source_cache = data_source_cache if data_source_cache is not None else TTLCache()
+        self.response_cache = response_cache
+        self.hooks = list(hooks or [])
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.codec = codec if codec is not None and not isinstance(codec, str) else get_codec(codec)
+        # A transport passed in may be shared with other clients; only close our own.
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else AsyncPooledTransport(limits, http2)
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=_default_headers(self.api_key),
+            timeout=timeout,
+            transport=self.transport,
+        )
+
+    # ---- low-level helpers ------------------------------------------------
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Coroutine variant of :meth:`NotionClient._request`."""
+        _queue_wait.set(0.0)
+        cache = self.response_cache
+        if cache is not None and method == "GET":
+            content = cache.lookup(path, params)
+            if content is not None:
+                return self.codec.loads(content)
+        if method != "GET" or self.single_flight is None:
+            return (await self._fetch(method, path, params, json))[1]
+        key = (path, str(httpx.QueryParams(params)))
+
+        async def fetch() -> tuple[tuple[bytes, dict[str, Any]], float]:
+            # The shared request runs in its own task, so its queue wait is
+            # handed back to the caller that started it.
+            return await self._fetch(method, path, params, json), _queue_wait.get()
+
+        ((content, data), waited), owner = await self.single_flight.do(key, fetch)
+        if owner:
+            _queue_wait.set(waited)
+            return data
+        return self.codec.loads(content)
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Coroutine variant of :meth:`NotionClient._fetch`."""
+        cache = self.response_cache
+        generation = cache.generation if cache is not None else None
+        try:
+            resp = await self._send(method, path, params, json)
+            resp.raise_for_status()
+        except Exception:
+            # A failed write may still have been applied server-side.
+            self._after_write(method, path)
+            raise
+        data = self.codec.loads(resp.content)
+        if cache is not None and method == "GET":
+            cache.store(path, params, resp.content, data, generation)
+        self._after_write(method, path, data)
+        if cache is not None:
+            cache.observe(data)
+        return resp.content, data
+
+    def _after_write(self, method: str, path: str, data: dict[str, Any] | None = None) -> None:
+        """Make reads issued after a write see it: drop cached and in-flight GETs."""
+        if not is_write(method, path):
+            return
+        if self.response_cache is not None:
+            self.response_cache.invalidate(method, path, data)
+        if self.single_flight is not None:
+            self.single_flight.forget()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Coroutine variant of :meth:`NotionClient._send`."""
+        content = self.codec.dumps(json) if json is not None else None
+        request = self._http.build_request(method, path, params=params, content=content)
+        attempt = 0
+        waited = 0.0
+        while True:
+            wait = await self.rate_limiter.acquire_async() if self.rate_limiter is not None else 0.0
+            waited += wait
+            timer = None
+            if self.hooks:
+                timer = _AttemptTimer()
+                request.extensions["trace"] = timer.atrace
+            try:
+                resp = await self._http.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if timer is not None:
+                    emit(self.hooks, timer.finish(request, attempt, wait, error=exc))
+                delay = self.retry_policy.delay_for(attempt, request=request, error=exc)
+                if delay is None:
+                    _queue_wait.set(waited)
+                    raise
+            else:
+                if timer is not None:
+                    emit(self.hooks, timer.finish(request, attempt, wait, response=resp))
+                delay = self.retry_policy.delay_for(attempt, resp, request)
+                if delay is None:
+                    break
+                await resp.aclose()
+                if resp.status_code in (429, 503) and self.rate_limiter is not None:
+                    self.rate_limiter.pause(delay)
+                    delay = 0.0
+            attempt += 1
+            if delay > 0:
+                await asyncio.sleep(delay)
+        _queue_wait.set(waited)
+        return resp
+
+    def _paginate(self, fetch: Any, *args: Any, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        return apaginate(fetch, *args, **kwargs)
+
+    async def _stream_list(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        key: str,
+        rest: dict[str, Any],
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async-generator variant of :meth:`NotionClient._stream_list`."""
+        resp = await self._send(method, path, params, json, stream=True)
+        try:
+            if resp.is_error:
+                await resp.aread()
+                resp.raise_for_status()
+            decoder = ListStreamDecoder(key, self.codec.loads)
+            async for chunk in resp.aiter_bytes():
+                for item in decoder.feed(chunk):
+                    yield item
+            rest.update(decoder.rest)
+        finally:
+            await resp.aclose()
+
+    def _paginate_stream(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        key: str = "results",
+    ) -> AsyncIterator[dict[str, Any]]:
+        return apaginate_stream(self._stream_list, method, path, params, json, key)
+
+    def _bulk_map(self, fn: Any, items: Any, *args: Any) -> AsyncIterator[ItemResult]:
+        return abulk_map(fn, items, *args)
+
+    async def _fetch_many(
+        self, fetch: Any, ids: Any, max_concurrency: int, retries: int, ordered: bool
+    ) -> AsyncIterator[ItemResult]:
+        fanout = _Fanout(ids, ordered)
+        async for result in abulk_map(fetch, fanout.unique, max_concurrency, retries):
+            for item in fanout.feed(result):
+                yield item
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        return await self._request("GET", path, params=params)
+
+    async def _post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        return await self._request("POST", path, json=json or {})
+
+    async def _patch(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
+        return await self._request("PATCH", path, json=json or {})
+
+    async def _delete(self, path: str) -> dict[str, Any]:
+        return await self._request("DELETE", path)
+
+    async def close(self) -> None:
+        if self._owns_transport:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncNotionClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
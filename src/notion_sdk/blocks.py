@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from .bulk import ItemResult
+from .pagination import MAX_PAGE_SIZE
+
+# Notion rejects append requests with more than 100 children in one array.
+MAX_APPEND_CHILDREN = 100
+
+# Block types whose children must be sent in the same request that creates them.
+_INLINE_CHILDREN_TYPES = frozenset({"table", "column_list"})
+
+# (input path, parent block ID, children, position of the first child)
+_FollowUp = tuple[tuple[int, ...], str, list[dict[str, Any]], int]
 
 
 class BlocksMixin:
@@ -12,6 +26,16 @@ class BlocksMixin:
         """GET /v1/blocks/{block_id} — Retrieve a block."""
         return self._get(f"/blocks/{block_id}")
 
+    def get_blocks(
+        self,
+        block_ids: Iterable[str],
+        max_concurrency: int = 4,
+        retries: int = 2,
+        ordered: bool = True,
+    ) -> Iterator[ItemResult]:
+        """Fetch many blocks concurrently; see :meth:`~notion_sdk.pages.PagesMixin.get_pages`."""
+        return self._fetch_many(self.get_block, block_ids, max_concurrency, retries, ordered)
+
     def get_block_children(
         self,
         block_id: str,
@@ -26,6 +50,77 @@ class BlocksMixin:
             params["page_size"] = page_size
         return self._get(f"/blocks/{block_id}/children", params=params or None)
 
+    def iter_block_children(
+        self,
+        block_id: str,
+        page_size: int | None = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every child block, fetching pages lazily.
+
+        With *stream*, each page is decoded incrementally (*prefetch* is then
+        ignored).
+        """
+        if stream:
+            params = {"page_size": page_size} if page_size is not None else None
+            return self._paginate_stream("GET", f"/blocks/{block_id}/children", params=params)
+        return self._paginate(
+            self.get_block_children, block_id, page_size=page_size, prefetch=prefetch
+        )
+
+    def iter_block_tree(
+        self,
+        block_id: str,
+        max_concurrency: int = 4,
+        max_depth: int | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Walk every descendant of a block, yielding ``(parent_id, block)`` events.
+
+        Children of each block with ``has_children`` are fetched (all pages)
+        on a pool of *max_concurrency* threads as soon as the block is seen,
+        so the walk proceeds level by level with several subtrees in flight.
+        Requests still go through the client's rate limiter.  Blocks deeper
+        than *max_depth* (direct children are depth 1) are not expanded.
+        Siblings are yielded in document order; different parents interleave.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="notion-tree")
+        pending: dict[Future, tuple[str, int]] = {}
+
+        def schedule(parent_id: str, depth: int) -> None:
+            future = executor.submit(lambda: list(self.iter_block_children(parent_id)))
+            pending[future] = (parent_id, depth)
+
+        try:
+            schedule(block_id, 1)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent_id, depth = pending.pop(future)
+                    for block in future.result():
+                        if block.get("has_children") and (max_depth is None or depth < max_depth):
+                            schedule(block["id"], depth + 1)
+                        yield parent_id, block
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_block_tree(
+        self,
+        block_id: str,
+        max_concurrency: int = 4,
+        max_depth: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch a block's descendants as a nested tree.
+
+        Returns the block's children; every block that was expanded carries
+        its own children under a ``"children"`` key, and blocks cut off by
+        *max_depth* have none (check ``has_children``).  See
+        :meth:`iter_block_tree` for the traversal and its arguments.
+        """
+        return _build_tree(
+            block_id, self.iter_block_tree(block_id, max_concurrency, max_depth), max_depth
+        )
+
     def append_block_children(
         self,
         block_id: str,
@@ -36,6 +131,85 @@ class BlocksMixin:
             f"/blocks/{block_id}/children", json={"children": children}
         )
 
+    def append_block_tree(
+        self,
+        block_id: str,
+        children: list[dict[str, Any]],
+        max_concurrency: int = 4,
+    ) -> dict[tuple[int, ...], str]:
+        """Append any number of (nested) blocks, splitting them into valid requests.
+
+        Each request carries at most :data:`MAX_APPEND_CHILDREN` blocks of a
+        single level: nested ``children`` (under the block's type object or a
+        top-level ``"children"`` key, as produced by :meth:`fetch_block_tree`)
+        are stripped and appended to the new block once its ID comes back.
+        Chunks for the same parent are sent in order; independent subtrees are
+        appended concurrently on up to *max_concurrency* threads.
+
+        ``table`` and ``column_list`` blocks must be created with their
+        children, so they are sent with the first :data:`MAX_APPEND_CHILDREN`
+        rows, or with their columns and the first blocks of each column; the
+        remaining rows and column content, and the children of blocks inside
+        columns, are appended afterwards (the IDs of blocks created inline are
+        looked up with one children listing per level).  No request nests
+        more than two levels: blocks inside columns are created without their
+        children (a table leading a column gets its rows appended
+        afterwards), and a column's content from the first later
+        ``table``/``column_list`` on is appended to the column separately.
+
+        Returns a mapping from input position -- a tuple path such as
+        ``(3,)`` or ``(3, 0, 1)`` -- to the created block ID; blocks created
+        inline inside a table or column list are not included.  If a request
+        fails the exception propagates; blocks appended before it remain.
+        """
+        created: dict[tuple[int, ...], str] = {}
+        executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="notion-append")
+        pending: dict[Future, tuple[str, Iterator[list]]] = {}
+
+        def schedule(parent_id: str, chunks: Iterator[list]) -> None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                future = executor.submit(self._append_chunk, parent_id, chunk)
+                pending[future] = (parent_id, chunks)
+
+        try:
+            schedule(block_id, _chunk_children((), children))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent_id, chunks = pending.pop(future)
+                    for path, new_id, follow_ups in future.result():
+                        created[path] = new_id
+                        for target_path, target_id, nested, start in follow_ups:
+                            schedule(target_id, _chunk_children(target_path, nested, start))
+                    schedule(parent_id, chunks)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return dict(sorted(created.items()))
+
+    def _append_chunk(
+        self, parent_id: str, chunk: list[tuple[tuple[int, ...], dict[str, Any]]]
+    ) -> list[tuple[tuple[int, ...], str, list[_FollowUp]]]:
+        split = [_split_children(block) for _, block in chunk]
+        resp = self.append_block_children(parent_id, children=[payload for payload, _ in split])
+        listings: dict[str, list[str]] = {}
+
+        def child_ids(block_id: str) -> list[str]:
+            if block_id not in listings:
+                listings[block_id] = [b["id"] for b in self.iter_block_children(block_id)]
+            return listings[block_id]
+
+        results = []
+        for (path, _), result, (_, follow_ups) in zip(chunk, resp["results"], split):
+            resolved = []
+            for suffix, nested, start in follow_ups:
+                target_id = result["id"]
+                for position in suffix:
+                    target_id = child_ids(target_id)[position]
+                resolved.append((path + suffix, target_id, nested, start))
+            results.append((path, result["id"], resolved))
+        return results
+
     def update_block(self, block_id: str, **kwargs: Any) -> dict[str, Any]:
         """PATCH /v1/blocks/{block_id} — Update a block."""
         return self._patch(f"/blocks/{block_id}", json=kwargs)
@@ -43,3 +217,202 @@ class BlocksMixin:
     def delete_block(self, block_id: str) -> dict[str, Any]:
         """DELETE /v1/blocks/{block_id} — Delete (archive) a block."""
         return self._delete(f"/blocks/{block_id}")
+
+
+class _TreeBuilder:
+    """Nests ``(parent_id, block)`` events from :meth:`BlocksMixin.iter_block_tree`.
+
+    Only blocks the walk expands (``has_children`` and above *max_depth*)
+    get a ``"children"`` list, so an unexpanded block is never mistaken for
+    an empty one.
+    """
+
+    def __init__(self, root_id: str, max_depth: int | None):
+        self.max_depth = max_depth
+        self.root: list[dict[str, Any]] = []
+        self._children = {root_id: self.root}
+        self._depth = {root_id: 0}
+
+    def add(self, parent_id: str, block: dict[str, Any]) -> None:
+        self._children[parent_id].append(block)
+        depth = self._depth[parent_id] + 1
+        if block.get("has_children") and (self.max_depth is None or depth < self.max_depth):
+            block["children"] = self._children[block["id"]] = []
+            self._depth[block["id"]] = depth
+
+
+def _build_tree(
+    root_id: str, events: Iterator[tuple[str, dict[str, Any]]], max_depth: int | None
+) -> list[dict[str, Any]]:
+    builder = _TreeBuilder(root_id, max_depth)
+    for parent_id, block in events:
+        builder.add(parent_id, block)
+    return builder.root
+
+
+def _chunk_children(
+    parent_path: tuple[int, ...], children: list[dict[str, Any]], start: int = 0
+) -> Iterator[list[tuple[tuple[int, ...], dict[str, Any]]]]:
+    for offset in range(0, len(children), MAX_APPEND_CHILDREN):
+        yield [
+            (parent_path + (start + offset + i,), block)
+            for i, block in enumerate(children[offset : offset + MAX_APPEND_CHILDREN])
+        ]
+
+
+def _strip_children(block: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Return a copy of *block* without nested children, plus those children."""
+    block_type = block.get("type")
+    payload = dict(block)
+    nested = payload.pop("children", None) or []
+    body = payload.get(block_type)
+    if isinstance(body, dict) and "children" in body:
+        body = dict(body)
+        nested = body.pop("children") or nested
+        payload[block_type] = body
+    return payload, nested
+
+
+def _with_children(payload: dict[str, Any], children: list[dict[str, Any]]) -> dict[str, Any]:
+    block_type = payload["type"]
+    return {**payload, block_type: {**payload.get(block_type, {}), "children": children}}
+
+
+def _split_children(
+    block: dict[str, Any],
+) -> tuple[dict[str, Any], list[tuple[tuple[int, ...], list[dict[str, Any]], int]]]:
+    """Split *block* into the payload for one append request and its follow-ups.
+
+    Each follow-up ``(suffix, children, start)`` appends *children* (input
+    positions from *start*) to the block reached from the created block by
+    the child positions in *suffix*.
+    """
+    payload, nested = _strip_children(block)
+    if not nested:
+        return payload, []
+    block_type = block.get("type")
+    if block_type == "table":
+        rows = nested[:MAX_APPEND_CHILDREN]
+        rest = nested[MAX_APPEND_CHILDREN:]
+        return _with_children(payload, rows), [((), rest, len(rows))] if rest else []
+    if block_type == "column_list":
+        columns, follow_ups = [], []
+        for j, column in enumerate(nested):
+            column_payload, content = _strip_children(column)
+            # A column needs one child to be created.  Blocks inside a column
+            # are already two levels deep, so they are sent without children
+            # (even a leading table's rows are appended to it afterwards), and
+            # later tables and column lists are appended to the column.
+            inline = content[:1]
+            for child in content[1:MAX_APPEND_CHILDREN]:
+                if child.get("type") in _INLINE_CHILDREN_TYPES:
+                    break
+                inline.append(child)
+            inline_payloads = []
+            for k, child in enumerate(inline):
+                child_payload, child_nested = _strip_children(child)
+                inline_payloads.append(child_payload)
+                if child_nested:
+                    follow_ups.append(((j, k), child_nested, 0))
+            if len(content) > len(inline):
+                follow_ups.append(((j,), content[len(inline) :], len(inline)))
+            columns.append(_with_children(column_payload, inline_payloads))
+        return _with_children(payload, columns), follow_ups
+    return payload, [((), nested, 0)]
+
+
+class AsyncBlocksMixin(BlocksMixin):
+    """Coroutine overrides for the :class:`BlocksMixin` methods that chain requests."""
+
+    async def iter_block_tree(
+        self,
+        block_id: str,
+        max_concurrency: int = 4,
+        max_depth: int | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Async variant of :meth:`BlocksMixin.iter_block_tree` using asyncio tasks."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending: dict[asyncio.Task, tuple[str, int]] = {}
+
+        async def fetch(parent_id: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return [b async for b in self.iter_block_children(parent_id)]
+
+        def schedule(parent_id: str, depth: int) -> None:
+            pending[asyncio.ensure_future(fetch(parent_id))] = (parent_id, depth)
+
+        try:
+            schedule(block_id, 1)
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    parent_id, depth = pending.pop(task)
+                    for block in task.result():
+                        if block.get("has_children") and (max_depth is None or depth < max_depth):
+                            schedule(block["id"], depth + 1)
+                        yield parent_id, block
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_block_tree(
+        self,
+        block_id: str,
+        max_concurrency: int = 4,
+        max_depth: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async variant of :meth:`BlocksMixin.fetch_block_tree`."""
+        builder = _TreeBuilder(block_id, max_depth)
+        async for parent_id, block in self.iter_block_tree(block_id, max_concurrency, max_depth):
+            builder.add(parent_id, block)
+        return builder.root
+
+    async def append_block_tree(
+        self,
+        block_id: str,
+        children: list[dict[str, Any]],
+        max_concurrency: int = 4,
+    ) -> dict[tuple[int, ...], str]:
+        """Async variant of :meth:`BlocksMixin.append_block_tree`."""
+        created: dict[tuple[int, ...], str] = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def append(parent_id: str, chunks: Iterator[list]) -> None:
+            subtrees = []
+            for chunk in chunks:
+                async with semaphore:
+                    results = await self._append_chunk(parent_id, chunk)
+                for path, new_id, follow_ups in results:
+                    created[path] = new_id
+                    for target_path, target_id, nested, start in follow_ups:
+                        chunks = _chunk_children(target_path, nested, start)
+                        subtrees.append(asyncio.ensure_future(append(target_id, chunks)))
+            await asyncio.gather(*subtrees)
+
+        await append(block_id, _chunk_children((), children))
+        return dict(sorted(created.items()))
+
+    async def _append_chunk(
+        self, parent_id: str, chunk: list[tuple[tuple[int, ...], dict[str, Any]]]
+    ) -> list[tuple[tuple[int, ...], str, list[_FollowUp]]]:
+        split = [_split_children(block) for _, block in chunk]
+        resp = await self.append_block_children(
+            parent_id, children=[payload for payload, _ in split]
+        )
+        listings: dict[str, list[str]] = {}
+
+        async def child_ids(block_id: str) -> list[str]:
+            if block_id not in listings:
+                listings[block_id] = [b["id"] async for b in self.iter_block_children(block_id)]
+            return listings[block_id]
+
+        results = []
+        for (path, _), result, (_, follow_ups) in zip(chunk, resp["results"], split):
+            resolved = []
+            for suffix, nested, start in follow_ups:
+                target_id = result["id"]
+                for position in suffix:
+                    target_id = (await child_ids(target_id))[position]
+                resolved.append((path + suffix, target_id, nested, start))
+            results.append((path, result["id"], resolved))
+        return results
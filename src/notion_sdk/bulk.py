@@ -0,0 +1,204 @@
+"""Bounded-concurrency bulk execution with per-item results.
+
+:func:`bulk_map` runs one request per input item on a small worker pool,
+pulling items lazily from the input iterable so a generator over a large CSV
+is never materialised.  Each item produces an :class:`ItemResult`; failures
+are reported per item instead of aborting the batch.
+
+Connection errors and 5xx responses have already been retried by the
+client's :class:`~notion_sdk.ratelimit.RetryPolicy` (or deliberately not,
+for writes that may have been applied), so by default only ``429`` is
+resubmitted here, after the server's ``Retry-After`` or a backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+import httpx
+
+from .ratelimit import RetryPolicy, parse_retry_after
+
+_BACKOFF = RetryPolicy()
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one bulk item.
+
+    ``index`` is the item's position in the input; ``result`` holds the API
+    response when ``ok`` is true, otherwise ``error`` holds the exception.
+    """
+
+    index: int
+    item: Any
+    result: Any = None
+    error: BaseException | None = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def is_transient(exc: BaseException) -> bool:
+    """True for connection errors, 429 and 5xx responses."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """True for ``429`` responses, which were certainly not applied."""
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+
+
+def retry_delay(exc: BaseException, attempt: int) -> float:
+    """Seconds to wait before resubmitting an item that failed *attempt* times."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, _BACKOFF.backoff_max)
+    return _BACKOFF.backoff(attempt)
+
+
+def _call_after(delay: float, fn: Callable[[Any], Any], item: Any) -> Any:
+    if delay > 0:
+        time.sleep(delay)
+    return fn(item)
+
+
+async def _acall_after(delay: float, fn: Callable[[Any], Awaitable[Any]], item: Any) -> Any:
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return await fn(item)
+
+
+def bulk_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int = 4,
+    retries: int = 2,
+    retry_if: Callable[[BaseException], bool] = is_throttled,
+) -> Iterator[ItemResult]:
+    """Apply *fn* to every item on *max_concurrency* threads, yielding results as they complete.
+
+    At most ``2 * max_concurrency`` items are read ahead of completion.  An
+    item whose call raises an error accepted by *retry_if* is resubmitted up
+    to *retries* more times, after :func:`retry_delay`.  Results arrive in
+    completion order; use ``ItemResult.index`` to correlate them with the
+    input.
+    """
+    source = enumerate(items)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="notion-bulk")
+    pending: dict[Future, tuple[int, Any, int]] = {}
+
+    def submit(index: int, item: Any, attempt: int, delay: float = 0.0) -> None:
+        pending[executor.submit(_call_after, delay, fn, item)] = (index, item, attempt)
+
+    def fill() -> None:
+        while len(pending) < 2 * max_concurrency:
+            nxt = next(source, None)
+            if nxt is None:
+                return
+            submit(nxt[0], nxt[1], 1)
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item, attempt = pending.pop(future)
+                exc = future.exception()
+                if exc is not None and attempt <= retries and retry_if(exc):
+                    submit(index, item, attempt + 1, retry_delay(exc, attempt))
+                    continue
+                if exc is None:
+                    yield ItemResult(index, item, result=future.result(), attempts=attempt)
+                else:
+                    yield ItemResult(index, item, error=exc, attempts=attempt)
+            fill()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def abulk_map(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    max_concurrency: int = 4,
+    retries: int = 2,
+    retry_if: Callable[[BaseException], bool] = is_throttled,
+) -> AsyncIterator[ItemResult]:
+    """Async-generator variant of :func:`bulk_map` for coroutine functions."""
+    source = enumerate(items)
+    pending: dict[asyncio.Future, tuple[int, Any, int]] = {}
+
+    def submit(index: int, item: Any, attempt: int, delay: float = 0.0) -> None:
+        pending[asyncio.ensure_future(_acall_after(delay, fn, item))] = (index, item, attempt)
+
+    def fill() -> None:
+        while len(pending) < max_concurrency:
+            nxt = next(source, None)
+            if nxt is None:
+                return
+            submit(nxt[0], nxt[1], 1)
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item, attempt = pending.pop(task)
+                exc = task.exception()
+                if exc is not None and attempt <= retries and retry_if(exc):
+                    submit(index, item, attempt + 1, retry_delay(exc, attempt))
+                    continue
+                if exc is None:
+                    yield ItemResult(index, item, result=task.result(), attempts=attempt)
+                else:
+                    yield ItemResult(index, item, error=exc, attempts=attempt)
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class _Fanout:
+    """Dedupes IDs for a batch fetch and maps results back to input positions.
+
+    Results fed in completion order come back either immediately (one
+    :class:`ItemResult` per input position of that ID) or, with *ordered*,
+    held until every earlier position is ready.
+    """
+
+    def __init__(self, ids: Iterable[str], ordered: bool):
+        self.positions: dict[str, list[int]] = defaultdict(list)
+        for position, object_id in enumerate(ids):
+            self.positions[object_id].append(position)
+        self.unique = list(self.positions)
+        self.ordered = ordered
+        self._ready: dict[int, ItemResult] = {}
+        self._next = 0
+
+    def feed(self, result: ItemResult) -> list[ItemResult]:
+        expanded = [
+            ItemResult(position, result.item, result.result, result.error, result.attempts)
+            for position in self.positions[result.item]
+        ]
+        if not self.ordered:
+            return expanded
+        for r in expanded:
+            self._ready[r.index] = r
+        out = []
+        while self._next in self._ready:
+            out.append(self._ready.pop(self._next))
+            self._next += 1
+        return out
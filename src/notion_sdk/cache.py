@@ -0,0 +1,327 @@
+"""Caches used by the client.
+
+:class:`TTLCache` is a small in-process LRU used for cheap lookups such as the
+database → data source resolution.  :class:`ResponseCache` is the optional
+read-through cache for GET responses, with pluggable storage backends.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+from urllib.parse import urlencode
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire *ttl* seconds after being set.
+
+    Holds at most *maxsize* entries; the least recently used entry is evicted
+    first.  ``ttl=None`` keeps entries until they are evicted or popped.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 300.0):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ---- response cache -------------------------------------------------------
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body.  ``expires`` is a wall-clock timestamp."""
+
+    content: bytes
+    expires: float
+    edited: str | None = None
+
+
+class MemoryBackend:
+    """LRU response store bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if len(entry.content) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._data[key] = entry
+            self._size += len(entry.content)
+            while len(self._data) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                self._size -= len(self._data.pop(key).content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+
+class SQLiteBackend:
+    """On-disk response store; survives restarts and can be shared by processes."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._conn = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content BLOB NOT NULL, "
+                "expires REAL NOT NULL, edited TEXT)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, expires, edited FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return CacheEntry(bytes(row[0]), row[1], row[2]) if row else None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, entry.content, entry.expires, entry.edited),
+            )
+
+    def delete_prefix(self, prefix: str) -> None:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key LIKE ? ESCAPE '\\'", (escaped + "%",)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# Object type -> resource paths whose cached GETs describe that object.
+_OBJECT_PATHS = {
+    "page": ("pages", "blocks"),
+    "block": ("blocks", "pages"),
+    "database": ("databases",),
+    "data_source": ("data_sources",),
+    "user": ("users",),
+}
+
+# POST endpoints that only read.
+_READ_ONLY_POSTS = ("/search",)
+
+_UUID = re.compile(r"[0-9a-f]{32}")
+
+
+def is_write(method: str, path: str) -> bool:
+    """True unless *method* on *path* only reads (GETs, queries and search)."""
+    return not (method == "GET" or path in _READ_ONLY_POSTS or path.endswith("/query"))
+
+
+def canonical_id(object_id: str) -> str:
+    """Lowercase *object_id* without dashes (Notion accepts either spelling of an ID)."""
+    bare = object_id.replace("-", "").lower()
+    return bare if _UUID.fullmatch(bare) else object_id
+
+
+def canonical_path(path: str) -> str:
+    """*path* with every object ID segment replaced by :func:`canonical_id`."""
+    return "/".join(canonical_id(segment) for segment in path.split("/"))
+
+
+class ResponseCache:
+    """Read-through cache for GET responses, keyed by path and query params.
+
+    Entries expire after a per-resource TTL (*ttls* maps the first path
+    segment, e.g. ``"pages"`` or ``"users"``, to seconds; anything else uses
+    *ttl*).  Writes sent through the same client drop every entry under the
+    written object (``PATCH /pages/X`` invalidates ``/pages/X`` and
+    ``/blocks/X...``).  Objects seen in *any* response are compared with
+    their cached copy by ``last_edited_time`` and the cached copy is dropped
+    if it is older, so a query or search result can evict a stale
+    ``get_page``.  Object IDs in paths are compared without dashes and
+    case-insensitively, so ``get_page`` with one spelling of an ID is
+    invalidated by a write with another.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryBackend | SQLiteBackend | None = None,
+        ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+    ):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._generation_lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, params: dict[str, Any] | None = None) -> str:
+        path = canonical_path(path)
+        if not params:
+            return path
+        return f"{path}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+    def lookup(self, path: str, params: dict[str, Any] | None = None) -> bytes | None:
+        entry = self.backend.get(self.key(path, params))
+        if entry is None or entry.expires <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.content
+
+    def store(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        content: bytes,
+        data: dict[str, Any],
+        generation: int | None = None,
+    ) -> None:
+        """Cache a GET response.
+
+        Pass the :attr:`generation` read before the request was sent: if a
+        write has been invalidated since, the response may predate it and is
+        not stored.
+        """
+        resource = path.strip("/").split("/", 1)[0]
+        ttl = self.ttls.get(resource, self.ttl)
+        if ttl <= 0:
+            return
+        entry = CacheEntry(content, time.time() + ttl, data.get("last_edited_time"))
+        with self._generation_lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.backend.set(self.key(path, params), entry)
+
+    def invalidate(self, method: str, path: str, data: dict[str, Any] | None = None) -> None:
+        """Drop cached reads affected by a *method* request to *path*.
+
+        *data* is the write's response, if any; its ``parent`` block/page has
+        its cached children listing dropped as well.  Moving a page also
+        drops the listing of its previous parent, read from the cached page
+        when there is one; otherwise every cached children listing is dropped.
+        """
+        if not is_write(method, path):
+            return
+        with self._generation_lock:
+            self.generation += 1
+        path = canonical_path(path)
+        parts = path.strip("/").split("/")
+        if len(parts) == 3 and parts[0] == "pages" and parts[2] == "move":
+            self._invalidate_old_parent(parts[1])
+        if len(parts) == 1:
+            # e.g. POST /comments or POST /pages: the listing may have changed.
+            self.backend.delete_prefix(f"/{parts[0]}?")
+        else:
+            resource, object_id = parts[0], parts[1]
+            self.invalidate_object(object_id, _OBJECT_PATHS.get(resource[:-1], (resource,)))
+        parent = (data or {}).get("parent") or {}
+        parent_id = parent.get("block_id") or parent.get("page_id")
+        if parent_id:
+            self._invalidate_children(parent_id)
+
+    def _invalidate_children(self, parent_id: str) -> None:
+        self.backend.delete_prefix(f"/blocks/{canonical_id(parent_id)}/children")
+
+    def _invalidate_old_parent(self, page_id: str) -> None:
+        cached = self.backend.get(f"/pages/{page_id}")
+        parent = (json.loads(cached.content).get("parent") or {}) if cached is not None else {}
+        parent_id = parent.get("block_id") or parent.get("page_id")
+        if parent_id:
+            self._invalidate_children(parent_id)
+        elif cached is None:
+            # The old parent is unknown: it could be any cached listing.
+            self.backend.delete_prefix("/blocks/")
+
+    def invalidate_object(self, object_id: str, resources: tuple[str, ...]) -> None:
+        object_id = canonical_id(object_id)
+        for resource in resources:
+            self.backend.delete_prefix(f"/{resource}/{object_id}")
+
+    def observe(self, data: dict[str, Any]) -> None:
+        """Evict cached objects that *data* shows have been edited since caching."""
+        objects = data.get("results") if data.get("object") == "list" else [data]
+        for obj in objects or ():
+            edited = obj.get("last_edited_time") if isinstance(obj, dict) else None
+            resources = _OBJECT_PATHS.get(obj.get("object")) if edited else None
+            if not resources:
+                continue
+            cached = self.backend.get(f"/{resources[0]}/{canonical_id(obj['id'])}")
+            if cached is not None and cached.edited is not None and cached.edited < edited:
+                self.invalidate_object(obj["id"], resources)
+
+    def clear(self) -> None:
+        self.backend.clear()
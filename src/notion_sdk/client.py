@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+import time
+from typing import Any, Iterator
 
 import httpx
 from dotenv import load_dotenv
@@ -14,6 +15,14 @@ from .blocks import BlocksMixin
 from .users import UsersMixin
 from .comments import CommentsMixin
 from .search import SearchMixin
+from .bulk import ItemResult, _Fanout, bulk_map
+from .cache import ResponseCache, TTLCache, is_write
+from .codec import ListStreamDecoder, get_codec
+from .hooks import Hook, _AttemptTimer, emit
+from .pagination import paginate, paginate_stream
+from .ratelimit import DEFAULT_RATE_LIMIT, RateLimiter, RetryPolicy, _queue_wait
+from .singleflight import SingleFlight
+from .transport import DEFAULT_LIMITS, DEFAULT_TIMEOUT, PooledTransport
 
 load_dotenv()
 
@@ -21,6 +30,33 @@ NOTION_BASE_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2025-09-03"
 
 
+def _resolve_api_key(api_key: str | None) -> str:
+    """Return *api_key*, falling back to the ``NOTION_API_KEY`` env var."""
+    if api_key is None:
+        api_key = os.environ.get("NOTION_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "No API key provided. Pass api_key= or set NOTION_API_KEY env var."
+            )
+    return api_key
+
+
+def _default_headers(api_key: str) -> dict[str, str]:
+    """Headers sent with every Notion API request."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Notion-Version": NOTION_VERSION,
+        "Content-Type": "application/json",
+    }
+
+
+def _make_rate_limiter(rate_limit: float | RateLimiter | None) -> RateLimiter | None:
+    """Accept a requests-per-second number, a shared :class:`RateLimiter`, or None."""
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(rate_limit)
+
+
 class NotionClient(
     PagesMixin,
     DatabasesMixin,
@@ -29,48 +65,229 @@ class NotionClient(
     CommentsMixin,
     SearchMixin,
 ):
-    """Synchronous Python client for the Notion API v2025-09-03."""
-
-    def __init__(self, api_key: str | None = None, base_url: str = NOTION_BASE_URL):
-        if api_key is None:
-            api_key = os.environ.get("NOTION_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "No API key provided. Pass api_key= or set NOTION_API_KEY env var."
-                )
-        self.api_key = api_key
+    """Synchronous Python client for the Notion API v2025-09-03.
+
+    Requests are paced by a client-wide token bucket (*rate_limit* requests per
+    second; pass a :class:`~notion_sdk.ratelimit.RateLimiter` to share one
+    budget between clients, or None to disable) and retried according to
+    *retry_policy* on 429, 5xx and connection errors.  *data_source_cache*
+    holds database → data-source ID resolutions for :meth:`query_database`;
+    the optional *response_cache* serves repeated GETs locally.  With
+    *coalesce* (the default), identical GETs issued while one is in flight
+    wait for its response instead of sending their own; see
+    ``client.single_flight.coalesced``.
+
+    Connections come from a :class:`~notion_sdk.transport.PooledTransport`
+    built from *limits* and *http2*; pass *transport* to share one pool
+    between clients (the client then leaves closing it to the caller).
+    *timeout* may be an :class:`httpx.Timeout` with per-phase values.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = NOTION_BASE_URL,
+        transport: httpx.BaseTransport | None = None,
+        rate_limit: float | RateLimiter | None = DEFAULT_RATE_LIMIT,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        data_source_cache: TTLCache | None = None,
+        response_cache: ResponseCache | None = None,
+        hooks: list[Hook] | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        codec: str | Any | None = None,
+        coalesce: bool = True,
+    ):
+        self.api_key = _resolve_api_key(api_key)
         self.base_url = base_url.rstrip("/")
+        self.rate_limiter = _make_rate_limiter(rate_limit)
+        self.retry_policy = retry_policy
+        self.data_source_cache = data_source_cache if data_source_cache is not None else TTLCache()
+        self.response_cache = response_cache
+        self.hooks = list(hooks or [])
+        self.single_flight = SingleFlight() if coalesce else None
+        self.codec = codec if codec is not None and not isinstance(codec, str) else get_codec(codec)
+        # A transport passed in may be shared with other clients; only close our own.
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else PooledTransport(limits, http2)
         self._http = httpx.Client(
             base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Notion-Version": NOTION_VERSION,
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
+            headers=_default_headers(self.api_key),
+            timeout=timeout,
+            transport=self.transport,
         )
 
     # ---- low-level helpers ------------------------------------------------
 
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request and decode the JSON response, going through :attr:`response_cache`.
+
+        Identical concurrent GETs share one request through :attr:`single_flight`.
+        """
+        # Only a request that goes through the rate limiter waits for it.
+        _queue_wait.set(0.0)
+        cache = self.response_cache
+        if cache is not None and method == "GET":
+            content = cache.lookup(path, params)
+            if content is not None:
+                return self.codec.loads(content)
+        if method != "GET" or self.single_flight is None:
+            return self._fetch(method, path, params, json)[1]
+        key = (path, str(httpx.QueryParams(params)))
+        (content, data), owner = self.single_flight.do(
+            key, lambda: self._fetch(method, path, params, json)
+        )
+        # Waiters decode their own copy so callers never share a mutable result.
+        return data if owner else self.codec.loads(content)
+
+    def _fetch(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> tuple[bytes, dict[str, Any]]:
+        """Send a request and return the raw and decoded body, updating the cache."""
+        cache = self.response_cache
+        generation = cache.generation if cache is not None else None
+        try:
+            resp = self._send(method, path, params, json)
+            resp.raise_for_status()
+        except Exception:
+            # A failed write may still have been applied server-side.
+            self._after_write(method, path)
+            raise
+        data = self.codec.loads(resp.content)
+        if cache is not None and method == "GET":
+            cache.store(path, params, resp.content, data, generation)
+        self._after_write(method, path, data)
+        if cache is not None:
+            cache.observe(data)
+        return resp.content, data
+
+    def _after_write(self, method: str, path: str, data: dict[str, Any] | None = None) -> None:
+        """Make reads issued after a write see it: drop cached and in-flight GETs."""
+        if not is_write(method, path):
+            return
+        if self.response_cache is not None:
+            self.response_cache.invalidate(method, path, data)
+        if self.single_flight is not None:
+            self.single_flight.forget()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request through the rate limiter, retrying per :attr:`retry_policy`."""
+        content = self.codec.dumps(json) if json is not None else None
+        request = self._http.build_request(method, path, params=params, content=content)
+        attempt = 0
+        waited = 0.0
+        while True:
+            wait = self.rate_limiter.acquire() if self.rate_limiter is not None else 0.0
+            waited += wait
+            timer = None
+            if self.hooks:
+                timer = _AttemptTimer()
+                request.extensions["trace"] = timer.trace
+            try:
+                resp = self._http.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if timer is not None:
+                    emit(self.hooks, timer.finish(request, attempt, wait, error=exc))
+                delay = self.retry_policy.delay_for(attempt, request=request, error=exc)
+                if delay is None:
+                    _queue_wait.set(waited)
+                    raise
+            else:
+                if timer is not None:
+                    emit(self.hooks, timer.finish(request, attempt, wait, response=resp))
+                delay = self.retry_policy.delay_for(attempt, resp, request)
+                if delay is None:
+                    break
+                resp.close()
+                if resp.status_code in (429, 503) and self.rate_limiter is not None:
+                    # Back off the whole client, not just this caller.
+                    self.rate_limiter.pause(delay)
+                    delay = 0.0
+            attempt += 1
+            if delay > 0:
+                time.sleep(delay)
+        _queue_wait.set(waited)
+        return resp
+
+    def _paginate(self, fetch: Any, *args: Any, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        return paginate(fetch, *args, **kwargs)
+
+    def _stream_list(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        key: str,
+        rest: dict[str, Any],
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the elements of *key* in one list response as its bytes arrive.
+
+        The response's other top-level fields are stored into *rest* once the
+        body has been read.  Streamed responses bypass :attr:`response_cache`.
+        """
+        resp = self._send(method, path, params, json, stream=True)
+        try:
+            if resp.is_error:
+                resp.read()
+                resp.raise_for_status()
+            decoder = ListStreamDecoder(key, self.codec.loads)
+            for chunk in resp.iter_bytes():
+                yield from decoder.feed(chunk)
+            rest.update(decoder.rest)
+        finally:
+            resp.close()
+
+    def _paginate_stream(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        key: str = "results",
+    ) -> Iterator[dict[str, Any]]:
+        return paginate_stream(self._stream_list, method, path, params, json, key)
+
+    def _bulk_map(self, fn: Any, items: Any, *args: Any) -> Iterator[ItemResult]:
+        return bulk_map(fn, items, *args)
+
+    def _fetch_many(
+        self, fetch: Any, ids: Any, max_concurrency: int, retries: int, ordered: bool
+    ) -> Iterator[ItemResult]:
+        fanout = _Fanout(ids, ordered)
+        for result in bulk_map(fetch, fanout.unique, max_concurrency, retries):
+            yield from fanout.feed(result)
+
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.get(path, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("GET", path, params=params)
 
     def _post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.post(path, json=json or {})
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("POST", path, json=json or {})
 
     def _patch(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.patch(path, json=json or {})
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("PATCH", path, json=json or {})
 
     def _delete(self, path: str) -> dict[str, Any]:
-        resp = self._http.delete(path)
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("DELETE", path)
 
     def close(self) -> None:
-        self._http.close()
+        if self._owns_transport:
+            self._http.close()
@@ -0,0 +1,153 @@
+"""Pluggable JSON encoding/decoding and incremental list decoding.
+
+The client encodes request bodies and decodes responses through a codec
+object with ``dumps(obj) -> bytes`` and ``loads(bytes) -> Any``.
+:func:`get_codec` picks the fastest installed backend (orjson, then msgspec,
+then the standard library) unless one is named explicitly.
+
+:class:`ListStreamDecoder` decodes a list response such as
+``{"object": "list", "results": [...], "next_cursor": ...}`` as bytes
+arrive, handing back each element of ``results`` as soon as it is complete
+instead of materialising the whole page.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable
+
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder().encode
+        self.loads = msgspec.json.Decoder().decode
+
+
+_BACKENDS: dict[str, Callable[[], Any]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+
+def get_codec(name: str | None = None) -> Any:
+    """Return a codec by name (``"orjson"``, ``"msgspec"``, ``"json"``) or the fastest available."""
+    if name is not None:
+        if name not in _BACKENDS:
+            raise ValueError(f"unknown JSON codec {name!r}; choose from {sorted(_BACKENDS)}")
+        return _BACKENDS[name]()
+    for factory in _BACKENDS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    raise AssertionError("unreachable: stdlib codec is always available")
+
+
+# A complete string, a structural character, or the opening quote of a
+# string that has not fully arrived yet.
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{},:"]', re.DOTALL)
+_QUOTE = 0x22
+_OPEN = (b"[", b"{")
+_CLOSE = (b"]", b"}")
+
+
+class ListStreamDecoder:
+    """Incrementally decode one top-level JSON object, streaming the elements of *key*.
+
+    Call :meth:`feed` with each chunk of bytes; it returns the elements of
+    the ``key`` array completed by that chunk.  Every other top-level field
+    is decoded into :attr:`rest` (e.g. ``has_more`` and ``next_cursor``).
+    Only the bytes of the element currently being received are buffered.
+    """
+
+    def __init__(self, key: str = "results", loads: Callable[[bytes], Any] = json.loads):
+        self.key = key
+        self.loads = loads
+        self.rest: dict[str, Any] = {}
+        self._buf = b""
+        self._pos = 0
+        self._depth = 0
+        self._field: str | None = None
+        self._expect_key = False
+        self._start: int | None = None  # start of current top-level value or array element
+        self._in_array = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        # Drop everything before the oldest byte still needed.
+        keep = self._pos if self._start is None else min(self._start, self._pos)
+        self._buf = self._buf[keep:] + chunk
+        self._pos -= keep
+        if self._start is not None:
+            self._start -= keep
+
+        items: list[Any] = []
+        buf = self._buf
+        while True:
+            m = _TOKEN.search(buf, self._pos)
+            if m is None:
+                self._pos = len(buf)
+                break
+            tok = m.group()
+            if tok == b'"':
+                self._pos = m.start()  # wait for the rest of the string
+                break
+            self._pos = m.end()
+            if tok[0] == _QUOTE:
+                if self._depth == 1 and self._expect_key:
+                    self._field = self.loads(tok)
+                continue
+            if self._depth == 1 and tok == b":":
+                self._expect_key = False
+                self._start = self._pos
+            elif tok in (b",", b"]", b"}") and self._depth == 1:
+                if self._start is not None:
+                    self.rest[self._field] = self.loads(buf[self._start : m.start()])
+                self._start = None
+                self._expect_key = True
+                if tok == b"}":
+                    self._depth = 0
+            elif tok in (b",", b"]") and self._in_array and self._depth == 2:
+                raw = buf[self._start : m.start()]
+                if raw.strip():
+                    items.append(self.loads(raw))
+                self._start = self._pos
+                if tok == b"]":
+                    self._depth = 1
+                    self._in_array = False
+                    self._start = None
+            elif tok in _OPEN:
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+                elif self._depth == 2 and tok == b"[" and self._field == self.key:
+                    self._in_array = True
+                    self._start = self._pos
+            elif tok in _CLOSE:
+                self._depth -= 1
+        return items
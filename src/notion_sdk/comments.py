@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
+
+from .pagination import MAX_PAGE_SIZE
 
 
 class CommentsMixin:
@@ -32,3 +34,14 @@ class CommentsMixin:
         if page_size is not None:
             params["page_size"] = page_size
         return self._get("/comments", params=params)
+
+    def iter_comments(
+        self,
+        block_id: str,
+        page_size: int | None = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every comment on a block, fetching pages lazily."""
+        return self._paginate(
+            self.get_comments, block_id, page_size=page_size, prefetch=prefetch
+        )
@@ -0,0 +1,545 @@
+"""Convert between markdown and Notion blocks, and render blocks as markdown or HTML.
+
+Parsing is a single pass over the input lines.  :func:`iter_markdown_blocks`
+yields each top-level block as soon as it is complete, so a large document
+can be fed to :meth:`~notion_sdk.blocks.BlocksMixin.append_block_tree` (which
+splits it into valid chunked requests) without holding a second copy::
+
+    client.append_block_tree(page_id, markdown_to_blocks(text))
+
+Rendering is streaming too.  :func:`render_markdown` and :func:`render_html`
+yield text fragments while walking the blocks depth-first.  Nested children
+are read from a ``children`` key (as produced by ``fetch_block_tree``) or, for
+blocks with ``has_children``, requested lazily from the *children* callable.
+Only the current path through the tree is held in memory::
+
+    with open("page.md", "w") as f:
+        f.writelines(render_markdown(client.iter_block_children(page_id),
+                                     children=client.iter_block_children))
+
+Supported markdown: ``#``–``###`` headings, paragraphs, ``-``/``*``/``+`` and
+numbered lists (nested by indentation), ``- [ ]`` to-dos, ``>`` quotes,
+fenced code, ``---`` dividers, images on their own line and pipe tables;
+inline ``**bold**``, ``*italic*``, ``~~strike~~``, backtick code spans and
+``[links](url)``.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Any, Callable, Iterable, Iterator
+
+from .models import plain_text
+
+# Notion rejects text objects longer than this.
+MAX_TEXT_LENGTH = 2000
+
+ChildrenFn = Callable[[str], Iterable[dict[str, Any]]]
+
+_LANGUAGES = {
+    "": "plain text",
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "sh": "shell",
+    "bash": "bash",
+    "yml": "yaml",
+    "md": "markdown",
+    "rb": "ruby",
+    "rs": "rust",
+    "c++": "c++",
+    "cpp": "c++",
+}
+_KNOWN_LANGUAGES = frozenset(
+    {
+        "c", "c#", "c++", "css", "diff", "docker", "go", "graphql", "html", "java",
+        "javascript", "json", "kotlin", "latex", "makefile", "markdown", "mermaid",
+        "php", "plain text", "powershell", "python", "r", "ruby", "rust", "scala",
+        "shell", "sql", "swift", "toml", "typescript", "xml", "yaml", "bash",
+    }
+)  # fmt: skip
+
+_HEADING = re.compile(r"(#{1,6})\s+(.*)")
+_LIST_ITEM = re.compile(r"([-*+]|\d+[.)])\s+(?:\[([ xX])\]\s+)?(.*)")
+_DIVIDER = re.compile(r"(?:-{3,}|\*{3,}|_{3,})")
+_IMAGE = re.compile(r"!\[([^\]]*)\]\((\S+?)\)")
+_TABLE_SEPARATOR = re.compile(r"\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?")
+
+_INLINE = re.compile(
+    r"\\(?P<esc>[\\`*_~\[\]()#>!+.-])"
+    r"|`(?P<code>[^`]+)`"
+    r"|\*\*(?P<bold>(?:\\.|[^*\\]|\*(?:\\.|[^*\\])+\*)+?)\*\*"
+    r"|__(?P<bold2>.+?)__"
+    r"|~~(?P<strike>.+?)~~"
+    r"|\*(?P<italic>(?:\\.|[^*\\])+)\*"
+    r"|(?<!\w)_(?P<italic2>[^_]+)_(?!\w)"
+    r"|\[(?P<label>[^\]]+)\]\((?P<url>[^)\s]+)\)"
+)
+_STYLES = {
+    "bold": "bold",
+    "bold2": "bold",
+    "strike": "strikethrough",
+    "italic": "italic",
+    "italic2": "italic",
+}
+_MD_ESCAPE = re.compile(r"([\\`*_~\[\]])")
+
+
+# ---- markdown → blocks ------------------------------------------------------
+
+
+def _text(content: str, styles: frozenset[str], url: str | None) -> Iterator[dict[str, Any]]:
+    for start in range(0, len(content), MAX_TEXT_LENGTH):
+        text: dict[str, Any] = {"content": content[start : start + MAX_TEXT_LENGTH]}
+        if url:
+            text["link"] = {"url": url}
+        item: dict[str, Any] = {"type": "text", "text": text}
+        if styles:
+            item["annotations"] = {style: True for style in styles}
+        yield item
+
+
+def parse_inline(
+    source: str, styles: frozenset[str] = frozenset(), url: str | None = None
+) -> list[dict[str, Any]]:
+    """Parse inline markdown into a Notion rich-text array."""
+    out: list[dict[str, Any]] = []
+    plain: list[str] = []
+
+    def flush() -> None:
+        if plain:
+            out.extend(_text("".join(plain), styles, url))
+            plain.clear()
+
+    pos = 0
+    for match in _INLINE.finditer(source):
+        plain.append(source[pos : match.start()])
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "esc":
+            plain.append(match["esc"])
+            continue
+        flush()
+        if kind == "code":
+            out.extend(_text(match["code"], styles | {"code"}, url))
+        elif kind == "url":
+            out.extend(parse_inline(match["label"], styles, match["url"]))
+        else:
+            out.extend(parse_inline(match[kind], styles | {_STYLES[kind]}, url))
+    plain.append(source[pos:])
+    flush()
+    return out
+
+
+def _merge_runs(runs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Join adjacent text runs that share annotations and link."""
+    merged: list[dict[str, Any]] = []
+    for run in runs:
+        last = merged[-1] if merged else None
+        if (
+            last is not None
+            and last.get("annotations") == run.get("annotations")
+            and last["text"].get("link") == run["text"].get("link")
+            and len(last["text"]["content"]) + len(run["text"]["content"]) <= MAX_TEXT_LENGTH
+        ):
+            last["text"]["content"] += run["text"]["content"]
+        else:
+            merged.append(run)
+    return merged
+
+
+def _block(kind: str, **body: Any) -> dict[str, Any]:
+    return {"object": "block", "type": kind, kind: body}
+
+
+def _table(rows: list[str]) -> dict[str, Any]:
+    header = len(rows) > 1 and _TABLE_SEPARATOR.fullmatch(rows[1].strip()) is not None
+    if header:
+        rows = rows[:1] + rows[2:]
+    cells = [[c.strip() for c in row.strip().strip("|").split("|")] for row in rows]
+    width = max(len(r) for r in cells)
+    return _block(
+        "table",
+        table_width=width,
+        has_column_header=header,
+        has_row_header=False,
+        children=[
+            _block("table_row", cells=[parse_inline(c) for c in r + [""] * (width - len(r))])
+            for r in cells
+        ],
+    )
+
+
+def iter_markdown_blocks(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Parse markdown *lines*, yielding each top-level block once it is complete.
+
+    List items nest by indentation and carry their sub-items under
+    ``block[type]["children"]``, the shape ``append_block_tree`` expects.
+    """
+    done: list[dict[str, Any]] = []
+    top: dict[str, Any] | None = None  # last top-level block; it may still grow
+    stack: list[tuple[int, dict[str, Any]]] = []  # open list items by indent
+    buffer: list[str] = []
+    buffer_kind: str | None = None
+    table: list[str] = []
+    fence: tuple[str, list[str]] | None = None
+    lazy: tuple[dict[str, Any], list[str]] | None = None  # list item and its continuation lines
+
+    def close_lazy() -> None:
+        nonlocal lazy
+        if lazy is not None:
+            item, continued = lazy
+            body = item[item["type"]]
+            body["rich_text"] = _merge_runs(
+                body["rich_text"] + parse_inline(" " + " ".join(continued))
+            )
+            lazy = None
+
+    def add(block: dict[str, Any]) -> None:
+        nonlocal top
+        close_lazy()
+        if top is not None:
+            done.append(top)
+        top = block
+
+    def flush() -> None:
+        nonlocal buffer_kind
+        if buffer_kind is not None:
+            add(_block(buffer_kind, rich_text=parse_inline(" ".join(buffer))))
+            buffer.clear()
+            buffer_kind = None
+        if table:
+            add(_table(table))
+            table.clear()
+
+    for raw in lines:
+        yield from done
+        done.clear()
+        line = raw.rstrip("\r\n").expandtabs(4)
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith("```"):
+                language, code = fence
+                add(_block("code", rich_text=list(_text("\n".join(code), frozenset(), None)),
+                           language=language))
+                fence = None
+            else:
+                fence[1].append(line)
+            continue
+        if not stripped:
+            flush()
+            continue
+        indent = len(line) - len(line.lstrip())
+
+        item = _LIST_ITEM.fullmatch(stripped)
+        if item and not _DIVIDER.fullmatch(stripped):
+            flush()
+            close_lazy()
+            marker, checked, text = item.groups()
+            if checked is not None:
+                block = _block("to_do", rich_text=parse_inline(text), checked=checked != " ")
+            elif marker[0].isdigit():
+                block = _block("numbered_list_item", rich_text=parse_inline(text))
+            else:
+                block = _block("bulleted_list_item", rich_text=parse_inline(text))
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            if stack:
+                parent = stack[-1][1]
+                parent[parent["type"]].setdefault("children", []).append(block)
+            else:
+                add(block)
+            stack.append((indent, block))
+            continue
+        if stack and indent:
+            # Indented text lazily continues the innermost open list item; its
+            # lines are parsed together once the item is complete.
+            if lazy is None or lazy[0] is not stack[-1][1]:
+                close_lazy()
+                lazy = (stack[-1][1], [])
+            lazy[1].append(stripped)
+            continue
+        close_lazy()
+        stack.clear()
+
+        if stripped.startswith("```"):
+            flush()
+            language = stripped[3:].strip().lower()
+            language = _LANGUAGES.get(language, language)
+            fence = (language if language in _KNOWN_LANGUAGES else "plain text", [])
+        elif heading := _HEADING.fullmatch(stripped):
+            flush()
+            level = min(len(heading[1]), 3)
+            add(_block(f"heading_{level}", rich_text=parse_inline(heading[2])))
+        elif _DIVIDER.fullmatch(stripped):
+            flush()
+            add(_block("divider"))
+        elif image := _IMAGE.fullmatch(stripped):
+            flush()
+            caption = parse_inline(image[1]) if image[1] else []
+            add(_block("image", type="external", external={"url": image[2]}, caption=caption))
+        elif stripped.startswith("|"):
+            if buffer_kind is not None:
+                flush()
+            table.append(stripped)
+        else:
+            kind = "quote" if stripped.startswith(">") else "paragraph"
+            text = stripped[1:].strip() if kind == "quote" else stripped
+            if kind != buffer_kind or table:
+                flush()
+                buffer_kind = kind
+            buffer.append(text)
+
+    if fence is not None:  # unterminated fence: keep what was read
+        language, code = fence
+        add(_block("code", rich_text=list(_text("\n".join(code), frozenset(), None)),
+                   language=language))
+    flush()
+    close_lazy()
+    yield from done
+    if top is not None:
+        yield top
+
+
+def markdown_to_blocks(text: str) -> list[dict[str, Any]]:
+    """Parse a markdown document into a list of top-level Notion blocks."""
+    return list(iter_markdown_blocks(text.splitlines()))
+
+
+# ---- blocks → markdown / HTML -------------------------------------------------
+
+
+def _children(block: dict[str, Any], children: ChildrenFn | None) -> Iterable[dict[str, Any]]:
+    body = block.get(block.get("type") or "") or {}
+    inline = block.get("children")
+    if inline is None and isinstance(body, dict):
+        inline = body.get("children")
+    if inline is not None:
+        return inline
+    if block.get("has_children") and children is not None:
+        return children(block["id"])
+    return ()
+
+
+def _url(body: dict[str, Any]) -> str:
+    if "url" in body:
+        return body["url"]
+    return (body.get(body.get("type") or "") or {}).get("url", "")
+
+
+_SAFE_SCHEMES = frozenset({"http", "https", "mailto"})
+_SCHEME = re.compile(r"([a-z][a-z0-9+.-]*):", re.IGNORECASE)
+_IGNORED_IN_SCHEME = re.compile(r"[\x00-\x20\x7f]+")
+
+
+def _safe_url(url: str) -> bool:
+    # Browsers drop whitespace and control characters inside a scheme, so
+    # "java\tscript:" must be caught too.  URLs without a scheme are relative.
+    scheme = _SCHEME.match(_IGNORED_IN_SCHEME.sub("", url))
+    return scheme is None or scheme.group(1).lower() in _SAFE_SCHEMES
+
+
+_MD_MARKERS = (("bold", "**"), ("italic", "*"), ("strikethrough", "~~"))
+
+
+def _md_inline(rich_text: list[dict[str, Any]] | None) -> str:
+    # Markers stay open across consecutive runs that share a style, so
+    # "**a *b* c**" renders back the way it was written.
+    parts: list[str] = []
+    opened: list[str] = []
+    for item in rich_text or ():
+        ann = item.get("annotations") or {}
+        wanted = [marker for style, marker in _MD_MARKERS if ann.get(style)]
+        for i, marker in enumerate(opened):
+            if marker not in wanted:
+                parts.extend(reversed(opened[i:]))
+                del opened[i:]
+                break
+        for marker in wanted:
+            if marker not in opened:
+                parts.append(marker)
+                opened.append(marker)
+        text = item.get("plain_text") or item.get("text", {}).get("content", "")
+        text = f"`{text}`" if ann.get("code") else _MD_ESCAPE.sub(r"\\\1", text)
+        link = item.get("href") or (item.get("text", {}).get("link") or {}).get("url")
+        parts.append(f"[{text}]({link})" if link else text)
+    parts.extend(reversed(opened))
+    return "".join(parts)
+
+
+_LIST_TYPES = frozenset({"bulleted_list_item", "numbered_list_item", "to_do", "toggle"})
+
+
+def _md_blocks(
+    blocks: Iterable[dict[str, Any]], prefix: str, children: ChildrenFn | None
+) -> Iterator[str]:
+    previous: str | None = None
+    number = 0
+    for block in blocks:
+        kind = block.get("type")
+        body = block.get(kind) or {}
+        if previous is not None and not (kind in _LIST_TYPES and previous in _LIST_TYPES):
+            yield prefix.rstrip() + "\n"
+        number = number + 1 if kind == "numbered_list_item" and previous == kind else 1
+        previous = kind
+        text = _md_inline(body.get("rich_text"))
+        nested = prefix + "  "
+        if kind == "paragraph":
+            yield f"{prefix}{text}\n"
+        elif kind in ("heading_1", "heading_2", "heading_3"):
+            yield f"{prefix}{'#' * int(kind[-1])} {text}\n"
+        elif kind == "bulleted_list_item" or kind == "toggle":
+            yield f"{prefix}- {text}\n"
+        elif kind == "numbered_list_item":
+            marker = f"{number}. "
+            nested = prefix + " " * len(marker)
+            yield f"{prefix}{marker}{text}\n"
+        elif kind == "to_do":
+            yield f"{prefix}- [{'x' if body.get('checked') else ' '}] {text}\n"
+        elif kind in ("quote", "callout"):
+            icon = (body.get("icon") or {}).get("emoji")
+            yield f"{prefix}> {icon + ' ' if icon else ''}{text}\n"
+            nested = prefix + "> "
+        elif kind == "code":
+            language = body.get("language", "")
+            code = plain_text(body.get("rich_text"))
+            yield f"{prefix}```{'' if language == 'plain text' else language}\n"
+            for line in code.split("\n"):
+                yield f"{prefix}{line}\n"
+            yield f"{prefix}```\n"
+        elif kind == "divider":
+            yield f"{prefix}---\n"
+        elif kind == "equation":
+            yield f"{prefix}$${body.get('expression', '')}$$\n"
+        elif kind == "image":
+            yield f"{prefix}![{_md_inline(body.get('caption'))}]({_url(body)})\n"
+        elif kind in ("bookmark", "embed", "link_preview", "video", "file", "pdf", "audio"):
+            yield f"{prefix}<{_url(body)}>\n"
+        elif kind in ("child_page", "child_database"):
+            yield f"{prefix}**{body.get('title', '')}**\n"
+        elif kind == "table":
+            header = body.get("has_column_header")
+            for i, row in enumerate(_children(block, children)):
+                cells = [_md_inline(cell) for cell in row.get("table_row", {}).get("cells", [])]
+                yield f"{prefix}| {' | '.join(cells)} |\n"
+                if i == 0 and header:
+                    yield f"{prefix}|{'---|' * len(cells)}\n"
+            continue
+        elif kind in ("column_list", "column", "synced_block"):
+            nested = prefix
+        elif text:
+            yield f"{prefix}{text}\n"
+        yield from _md_blocks(_children(block, children), nested, children)
+
+
+def render_markdown(
+    blocks: Iterable[dict[str, Any]], children: ChildrenFn | None = None
+) -> Iterator[str]:
+    """Render blocks as markdown, yielding one line (or blank separator) at a time."""
+    return _md_blocks(blocks, "", children)
+
+
+def _html_inline(rich_text: list[dict[str, Any]] | None) -> str:
+    parts = []
+    for item in rich_text or ():
+        text = html.escape(item.get("plain_text") or item.get("text", {}).get("content", ""))
+        ann = item.get("annotations") or {}
+        for style, tag in (
+            ("code", "code"),
+            ("bold", "strong"),
+            ("italic", "em"),
+            ("strikethrough", "s"),
+            ("underline", "u"),
+        ):
+            if ann.get(style):
+                text = f"<{tag}>{text}</{tag}>"
+        link = item.get("href") or (item.get("text", {}).get("link") or {}).get("url")
+        if link and _safe_url(link):
+            text = f'<a href="{html.escape(link)}">{text}</a>'
+        parts.append(text.replace("\n", "<br>"))
+    return "".join(parts)
+
+
+_LIST_TAGS = {"bulleted_list_item": "ul", "to_do": "ul", "numbered_list_item": "ol"}
+
+
+def _html_blocks(blocks: Iterable[dict[str, Any]], children: ChildrenFn | None) -> Iterator[str]:
+    open_list: str | None = None
+    for block in blocks:
+        kind = block.get("type")
+        body = block.get(kind) or {}
+        tag = _LIST_TAGS.get(kind)
+        if tag != open_list:
+            if open_list:
+                yield f"</{open_list}>\n"
+            if tag:
+                yield f"<{tag}>\n"
+            open_list = tag
+        text = _html_inline(body.get("rich_text"))
+        nested = _children(block, children)
+        if tag:
+            box = ""
+            if kind == "to_do":
+                box = f'<input type="checkbox" disabled{" checked" if body.get("checked") else ""}> '
+            yield f"<li>{box}{text}"
+            yield from _html_blocks(nested, children)
+            yield "</li>\n"
+        elif kind == "paragraph":
+            yield f"<p>{text}</p>\n"
+            yield from _html_blocks(nested, children)
+        elif kind in ("heading_1", "heading_2", "heading_3"):
+            yield f"<h{kind[-1]}>{text}</h{kind[-1]}>\n"
+        elif kind == "toggle":
+            yield f"<details><summary>{text}</summary>\n"
+            yield from _html_blocks(nested, children)
+            yield "</details>\n"
+        elif kind in ("quote", "callout"):
+            yield f"<blockquote>{text}\n"
+            yield from _html_blocks(nested, children)
+            yield "</blockquote>\n"
+        elif kind == "code":
+            code = html.escape(plain_text(body.get("rich_text")))
+            language = html.escape(body.get("language", "plain text"))
+            yield f'<pre><code class="language-{language}">{code}</code></pre>\n'
+        elif kind == "divider":
+            yield "<hr>\n"
+        elif kind == "image":
+            url = _url(body)
+            alt = html.escape(plain_text(body.get("caption")), quote=True)
+            if _safe_url(url):
+                yield f'<img src="{html.escape(url)}" alt="{alt}">\n'
+            else:
+                yield f"<p>{html.escape(url)}</p>\n"
+        elif kind in ("bookmark", "embed", "link_preview", "video", "file", "pdf", "audio"):
+            url = _url(body)
+            if _safe_url(url):
+                yield f'<p><a href="{html.escape(url)}">{html.escape(url)}</a></p>\n'
+            else:
+                yield f"<p>{html.escape(url)}</p>\n"
+        elif kind == "table":
+            header = body.get("has_column_header")
+            yield "<table>\n"
+            for i, row in enumerate(nested):
+                cell_tag = "th" if i == 0 and header else "td"
+                cells = "".join(
+                    f"<{cell_tag}>{_html_inline(c)}</{cell_tag}>"
+                    for c in row.get("table_row", {}).get("cells", [])
+                )
+                yield f"<tr>{cells}</tr>\n"
+            yield "</table>\n"
+        elif kind in ("column_list", "column", "synced_block"):
+            yield from _html_blocks(nested, children)
+        elif kind in ("child_page", "child_database"):
+            yield f"<p><strong>{html.escape(body.get('title', ''))}</strong></p>\n"
+        elif text:
+            yield f"<p>{text}</p>\n"
+    if open_list:
+        yield f"</{open_list}>\n"
+
+
+def render_html(
+    blocks: Iterable[dict[str, Any]], children: ChildrenFn | None = None
+) -> Iterator[str]:
+    """Render blocks as an HTML fragment, yielding one element at a time."""
+    return _html_blocks(blocks, children)
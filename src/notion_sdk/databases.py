@@ -5,11 +5,30 @@ the database object itself.  When you create a database the properties go inside
 ``initial_data_source.properties``.  After creation you retrieve properties via
 ``GET /v1/data_sources/{data_source_id}``.  Querying rows also happens on the
 data source: ``POST /v1/data_sources/{data_source_id}/query``.
+
+The database → first data source mapping used by :meth:`query_database` is
+kept in the client's ``data_source_cache`` so repeat queries cost a single
+request.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from .bulk import ItemResult
+from .pagination import MAX_PAGE_SIZE
+from .scan import (
+    amerge_partitions,
+    combine,
+    created_time_partitions,
+    merge_partitions,
+    partitions_overlap,
+    property_partitions,
+)
+from .sync import parse_time
+
+_CREATED_ASC = [{"timestamp": "created_time", "direction": "ascending"}]
 
 
 class DatabasesMixin:
@@ -45,11 +64,29 @@ class DatabasesMixin:
 
     def update_database(self, database_id: str, **kwargs: Any) -> dict[str, Any]:
         """PATCH /v1/databases/{database_id} — Update a database."""
-        return self._patch(f"/databases/{database_id}", json=kwargs)
+        # Evict once the write has finished (or failed), so a resolution that
+        # ran concurrently cannot leave the pre-update mapping behind.
+        try:
+            return self._patch(f"/databases/{database_id}", json=kwargs)
+        finally:
+            self.data_source_cache.pop(database_id)
 
     def archive_database(self, database_id: str) -> dict[str, Any]:
         """PATCH /v1/databases/{database_id} — Archive a database."""
-        return self._patch(f"/databases/{database_id}", json={"archived": True})
+        return self.update_database(database_id, archived=True)
+
+    def resolve_data_source_id(self, database_id: str) -> str:
+        """Return the ID of a database's first data source, using ``data_source_cache``."""
+        ds_id = self.data_source_cache.get(database_id)
+        if ds_id is None:
+            db = self.get_database(database_id)
+            ds_id = db["data_sources"][0]["id"]
+            self.data_source_cache.set(database_id, ds_id)
+        return ds_id
+
+    def warm_data_source_cache(self, database_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve and cache the first data source of each database up front."""
+        return {db_id: self.resolve_data_source_id(db_id) for db_id in database_ids}
 
     def query_database(
         self,
@@ -62,11 +99,11 @@ class DatabasesMixin:
         """Query a database.
 
         In v2025-09-03 this resolves the first data source automatically and
-        queries via ``POST /v1/data_sources/{ds_id}/query``.  If you already
-        know the data-source ID, use :meth:`query_data_source` directly.
+        queries via ``POST /v1/data_sources/{ds_id}/query``.  The resolution is
+        cached (see :meth:`resolve_data_source_id`).  If you already know the
+        data-source ID, use :meth:`query_data_source` directly.
         """
-        db = self.get_database(database_id)
-        ds_id = db["data_sources"][0]["id"]
+        ds_id = self.resolve_data_source_id(database_id)
         return self.query_data_source(
             ds_id,
             filter=filter,
@@ -81,6 +118,18 @@ class DatabasesMixin:
         """GET /v1/data_sources/{data_source_id} — Retrieve a data source (includes properties)."""
         return self._get(f"/data_sources/{data_source_id}")
 
+    def get_data_sources(
+        self,
+        data_source_ids: Iterable[str],
+        max_concurrency: int = 4,
+        retries: int = 2,
+        ordered: bool = True,
+    ) -> Iterator[ItemResult]:
+        """Fetch many data sources concurrently; see :meth:`~notion_sdk.pages.PagesMixin.get_pages`."""
+        return self._fetch_many(
+            self.get_data_source, data_source_ids, max_concurrency, retries, ordered
+        )
+
     def update_data_source(self, data_source_id: str, **kwargs: Any) -> dict[str, Any]:
         """PATCH /v1/data_sources/{data_source_id} — Update a data source."""
         return self._patch(f"/data_sources/{data_source_id}", json=kwargs)
@@ -105,6 +154,91 @@ class DatabasesMixin:
             body["page_size"] = page_size
         return self._post(f"/data_sources/{data_source_id}/query", json=body)
 
+    def iter_query_data_source(
+        self,
+        data_source_id: str,
+        filter: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        page_size: int | None = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every row matching a data-source query, fetching pages lazily.
+
+        With *stream*, each page is decoded incrementally and rows are
+        yielded as their bytes arrive (*prefetch* is then ignored).
+        """
+        if stream:
+            body = {"filter": filter, "sorts": sorts, "page_size": page_size}
+            return self._paginate_stream(
+                "POST",
+                f"/data_sources/{data_source_id}/query",
+                json={k: v for k, v in body.items() if v is not None},
+            )
+        return self._paginate(
+            self.query_data_source,
+            data_source_id,
+            filter=filter,
+            sorts=sorts,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def scan_data_source(
+        self,
+        data_source_id: str,
+        partitions: int = 4,
+        by: str = "created_time",
+        filter: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        ordered: bool = False,
+        max_concurrency: int | None = None,
+        page_size: int | None = MAX_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Read every matching row by paging several disjoint partitions in parallel.
+
+        Args:
+            partitions: Number of ``created_time`` ranges when *by* is
+                ``"created_time"`` (the earliest row is looked up to place the
+                boundaries).  Ignored for property partitions.
+            by: ``"created_time"`` or the name of a select, status or
+                multi_select property, which yields one partition per option
+                plus one for empty values.
+            filter / sorts: Applied within every partition.
+            ordered: Yield partitions one after another in order instead of
+                interleaving rows as they arrive.  Together with
+                ``by="created_time"`` and an ascending ``created_time`` sort
+                this yields rows in creation order.
+            max_concurrency: Partitions fetched at once (default: all).
+
+        Rows of a multi_select partitioning are de-duplicated by page ID.
+        All workers share the client's rate limiter, so the speed-up is
+        bounded by it.
+        """
+        if by == "created_time":
+            first = self.query_data_source(
+                data_source_id, filter=filter, sorts=_CREATED_ASC, page_size=1
+            )["results"]
+            start = parse_time(first[0]["created_time"]) if first else datetime.now(timezone.utc)
+            filters = created_time_partitions(start, datetime.now(timezone.utc), partitions)
+            overlapping = False
+        else:
+            schema = self.get_data_source(data_source_id)["properties"][by]
+            filters = property_partitions(by, schema)
+            overlapping = partitions_overlap(schema)
+        return merge_partitions(
+            lambda partition: self.iter_query_data_source(
+                data_source_id,
+                filter=combine(filter, partition),
+                sorts=sorts,
+                page_size=page_size,
+            ),
+            filters,
+            max_concurrency or len(filters),
+            ordered,
+            dedupe=overlapping,
+        )
+
     def list_data_source_templates(
         self,
         data_source_id: str,
@@ -121,3 +255,111 @@ class DatabasesMixin:
         if page_size is not None:
             params["page_size"] = page_size
         return self._get(f"/data_sources/{data_source_id}/templates", params=params or None)
+
+    def iter_data_source_templates(
+        self,
+        data_source_id: str,
+        name: str | None = None,
+        page_size: int | None = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every template of a data source, fetching pages lazily."""
+        return self._paginate(
+            self.list_data_source_templates,
+            data_source_id,
+            name=name,
+            page_size=page_size,
+            key="templates",
+            prefetch=prefetch,
+        )
+
+
+class AsyncDatabasesMixin(DatabasesMixin):
+    """Coroutine overrides for the :class:`DatabasesMixin` methods that chain requests.
+
+    Single-request methods are inherited unchanged: they return whatever the
+    client's ``_get``/``_post`` helpers return, which on the async client is
+    an awaitable.
+    """
+
+    async def resolve_data_source_id(self, database_id: str) -> str:
+        """Async variant of :meth:`DatabasesMixin.resolve_data_source_id`."""
+        ds_id = self.data_source_cache.get(database_id)
+        if ds_id is None:
+            db = await self.get_database(database_id)
+            ds_id = db["data_sources"][0]["id"]
+            self.data_source_cache.set(database_id, ds_id)
+        return ds_id
+
+    async def update_database(self, database_id: str, **kwargs: Any) -> dict[str, Any]:
+        """Async variant of :meth:`DatabasesMixin.update_database`."""
+        try:
+            return await self._patch(f"/databases/{database_id}", json=kwargs)
+        finally:
+            self.data_source_cache.pop(database_id)
+
+    async def archive_database(self, database_id: str) -> dict[str, Any]:
+        """Async variant of :meth:`DatabasesMixin.archive_database`."""
+        return await self.update_database(database_id, archived=True)
+
+    async def warm_data_source_cache(self, database_ids: Iterable[str]) -> dict[str, str]:
+        """Async variant of :meth:`DatabasesMixin.warm_data_source_cache`."""
+        return {db_id: await self.resolve_data_source_id(db_id) for db_id in database_ids}
+
+    async def query_database(
+        self,
+        database_id: str,
+        filter: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        start_cursor: str | None = None,
+        page_size: int | None = None,
+    ) -> dict[str, Any]:
+        """Query a database (async variant of :meth:`DatabasesMixin.query_database`)."""
+        ds_id = await self.resolve_data_source_id(database_id)
+        return await self.query_data_source(
+            ds_id,
+            filter=filter,
+            sorts=sorts,
+            start_cursor=start_cursor,
+            page_size=page_size,
+        )
+
+    async def scan_data_source(
+        self,
+        data_source_id: str,
+        partitions: int = 4,
+        by: str = "created_time",
+        filter: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        ordered: bool = False,
+        max_concurrency: int | None = None,
+        page_size: int | None = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async variant of :meth:`DatabasesMixin.scan_data_source`."""
+        if by == "created_time":
+            first = (
+                await self.query_data_source(
+                    data_source_id, filter=filter, sorts=_CREATED_ASC, page_size=1
+                )
+            )["results"]
+            start = parse_time(first[0]["created_time"]) if first else datetime.now(timezone.utc)
+            filters = created_time_partitions(start, datetime.now(timezone.utc), partitions)
+            overlapping = False
+        else:
+            schema = (await self.get_data_source(data_source_id))["properties"][by]
+            filters = property_partitions(by, schema)
+            overlapping = partitions_overlap(schema)
+        rows = amerge_partitions(
+            lambda partition: self.iter_query_data_source(
+                data_source_id,
+                filter=combine(filter, partition),
+                sorts=sorts,
+                page_size=page_size,
+            ),
+            filters,
+            max_concurrency or len(filters),
+            ordered,
+            dedupe=overlapping,
+        )
+        async for row in rows:
+            yield row
@@ -0,0 +1,120 @@
+"""Relation graph traversal.
+
+:meth:`~notion_sdk.pages.PagesMixin.walk_relations` follows ``relation``
+properties breadth-first.  Each level's unseen page IDs are fetched as one
+concurrent batch through ``get_pages``, so a walk costs *depth* rounds of
+parallel requests instead of one serial ``get_page`` per related ID::
+
+    rows = client.iter_query_data_source(projects_ds)
+    graph = client.walk_relations(rows, max_depth=2, properties=["Tasks", "Owner"])
+    for task_id in graph.neighbors(project_id, "Tasks"):
+        print(graph.pages[task_id]["url"])
+
+The returned :class:`RelationGraph` memoizes every page it fetched; pass it
+back as ``graph=`` to extend it without refetching known pages.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from .bulk import ItemResult
+
+
+def relation_ids(
+    page: dict[str, Any], properties: Iterable[str] | None = None
+) -> dict[str, list[str]]:
+    """Map each relation property of *page* (optionally only *properties*) to its target IDs."""
+    allowed = set(properties) if properties is not None else None
+    out: dict[str, list[str]] = {}
+    for name, prop in (page.get("properties") or {}).items():
+        if prop.get("type") != "relation" or (allowed is not None and name not in allowed):
+            continue
+        out[name] = [item["id"] for item in prop.get("relation") or ()]
+    return out
+
+
+@dataclass
+class RelationGraph:
+    """Pages reached by a relation walk and the edges between them.
+
+    ``pages`` maps page ID to the page dict; ``depth`` to the level it was
+    first reached at (roots are 0); ``edges`` maps a page ID to
+    ``{property name: [target IDs]}`` for every relation property, including
+    ones outside the allowlist the walk followed.  ``errors`` holds the exception for
+    IDs that could not be fetched.  ``truncated`` lists ``(page_id,
+    property)`` pairs whose relation array was cut off by the API
+    (``has_more``), so their edges are incomplete.
+    """
+
+    pages: dict[str, dict[str, Any]] = field(default_factory=dict)
+    depth: dict[str, int] = field(default_factory=dict)
+    edges: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    truncated: list[tuple[str, str]] = field(default_factory=list)
+
+    def neighbors(self, page_id: str, property: str | None = None) -> list[str]:
+        """Target IDs of *page_id*'s relations, for one property or all of them."""
+        targets = self.edges.get(page_id, {})
+        if property is not None:
+            return list(targets.get(property, ()))
+        return [t for ids in targets.values() for t in ids]
+
+    def adjacency(self) -> dict[str, set[str]]:
+        """``{page_id: {target IDs}}`` over every property."""
+        return {page_id: set(self.neighbors(page_id)) for page_id in self.edges}
+
+    def _add(self, page: dict[str, Any], level: int) -> None:
+        page_id = page["id"]
+        self.pages[page_id] = page
+        self.depth[page_id] = min(level, self.depth.get(page_id, level))
+        self.edges[page_id] = relation_ids(page)
+        for name, prop in (page.get("properties") or {}).items():
+            if name in self.edges[page_id] and prop.get("has_more"):
+                self.truncated.append((page_id, name))
+
+    def _add_results(self, results: Iterable[ItemResult], level: int) -> list[str]:
+        added = []
+        for r in results:
+            if r.ok:
+                self._add(r.result, level)
+                added.append(r.item)
+            else:
+                self.errors[r.item] = r.error
+        return added
+
+    def _next_level(
+        self, page_ids: Iterable[str], visited: set[str], properties: Iterable[str] | None
+    ) -> tuple[list[str], list[str]]:
+        """Split unvisited targets of *page_ids* (via *properties*) into (known, to fetch)."""
+        allowed = set(properties) if properties is not None else None
+        known, missing = [], []
+        for page_id in page_ids:
+            for name, targets in self.edges.get(page_id, {}).items():
+                if allowed is None or name in allowed:
+                    self._visit(targets, visited, known, missing)
+        return known, missing
+
+    def _visit(
+        self, targets: list[str], visited: set[str], known: list[str], missing: list[str]
+    ) -> None:
+        for target in targets:
+            if target in visited or target in self.errors:
+                continue
+            visited.add(target)
+            (known if target in self.pages else missing).append(target)
+
+
+def _split_start(
+    graph: RelationGraph, start: Iterable[str | dict[str, Any]]
+) -> tuple[list[str], list[str]]:
+    """Add start pages given as dicts; return (root IDs already known, root IDs to fetch)."""
+    known, missing = [], []
+    for item in start:
+        if isinstance(item, str):
+            (known if item in graph.pages else missing).append(item)
+        else:
+            graph._add(item, 0)
+            known.append(item["id"])
+    return list(dict.fromkeys(known)), list(dict.fromkeys(missing))
@@ -0,0 +1,307 @@
+"""Per-request instrumentation hooks and a built-in metrics collector.
+
+Every HTTP attempt a client makes (including retries) produces a
+:class:`RequestEvent` that is passed to each callable in the client's
+``hooks`` list::
+
+    metrics = MetricsCollector()
+    client = NotionClient(hooks=[metrics])
+    ...
+    print(metrics.summary())
+
+Hooks run on the calling thread after the attempt finishes; an exception
+raised by a hook is logged and otherwise ignored.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[["RequestEvent"], None]
+
+# Path segments that follow a resource name but are not object IDs.
+_LITERAL_SEGMENTS = frozenset({"me"})
+
+
+def endpoint_template(path: str) -> str:
+    """Replace object IDs in *path* with ``{id}``: ``/blocks/abc/children`` → ``/blocks/{id}/children``."""
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    if len(parts) >= 2 and parts[1] not in _LITERAL_SEGMENTS:
+        parts[1] = "{id}"
+    return "/" + "/".join(parts)
+
+
+@dataclass
+class RequestEvent:
+    """Timing and size information for one HTTP attempt.
+
+    ``connect`` is the time spent opening a new connection (0.0 when a pooled
+    connection was reused) and ``ttfb`` the time from the start of the attempt
+    until response headers arrived; both are None when the transport does
+    not report them.  ``total`` covers the whole attempt including the body.
+    ``queue_wait`` is the time spent waiting for the rate limiter beforehand.
+    """
+
+    method: str
+    path: str
+    endpoint: str
+    attempt: int
+    status: int | None = None
+    error: BaseException | None = None
+    total: float = 0.0
+    connect: float | None = None
+    ttfb: float | None = None
+    queue_wait: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    new_connection: bool | None = None
+
+
+class _AttemptTimer:
+    """Collects httpcore ``trace`` events for one attempt."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.connect_start: float | None = None
+        self.connect_end: float | None = None
+        self.headers_at: float | None = None
+        self.traced = False
+
+    def trace(self, name: str, info: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        self.traced = True
+        if name == "connection.connect_tcp.started":
+            self.connect_start = now
+        elif name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            self.connect_end = now
+        elif name.endswith("receive_response_headers.complete"):
+            self.headers_at = now
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self.trace(name, info)
+
+    def finish(
+        self,
+        request: Any,
+        attempt: int,
+        queue_wait: float,
+        response: Any = None,
+        error: BaseException | None = None,
+    ) -> RequestEvent:
+        """Build the :class:`RequestEvent` for an attempt that just ended."""
+        event = RequestEvent(
+            method=request.method,
+            path=request.url.path,
+            endpoint=endpoint_template(request.url.path.removeprefix("/v1")),
+            attempt=attempt,
+            status=response.status_code if response is not None else None,
+            error=error,
+            total=time.perf_counter() - self.start,
+            queue_wait=queue_wait,
+            request_bytes=len(request.content),
+            response_bytes=_response_size(response),
+        )
+        if self.traced:
+            reused = self.connect_start is None
+            event.new_connection = not reused
+            event.connect = 0.0 if reused else (self.connect_end or self.start) - self.connect_start
+            if self.headers_at is not None:
+                event.ttfb = self.headers_at - self.start
+        return event
+
+
+def _response_size(response: Any) -> int:
+    """Bytes received on the wire, falling back to the decoded body size."""
+    if response is None:
+        return 0
+    if response.num_bytes_downloaded or not response.is_stream_consumed:
+        # Streamed responses are reported before their body is read.
+        return response.num_bytes_downloaded
+    return len(response.content)
+
+
+def emit(hooks: list[Hook], event: RequestEvent) -> None:
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("notion_sdk request hook %r failed", hook)
+
+
+# ---- built-in collector ---------------------------------------------------
+
+# Histogram bucket upper bounds in seconds: 1 ms .. ~65 s, doubling.
+LATENCY_BUCKETS = tuple(0.001 * 2**i for i in range(17))
+
+
+@dataclass
+class _Histogram:
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+    n: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.n += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket containing the *q* quantile."""
+        if not self.n:
+            return None
+        rank = q * self.n
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else float("inf")
+        return float("inf")
+
+
+@dataclass
+class _EndpointStats:
+    latency: _Histogram = field(default_factory=_Histogram)
+    ttfb: _Histogram = field(default_factory=_Histogram)
+    queue_wait: float = 0.0
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    request_bytes: int = 0
+    response_bytes: int = 0
+    new_connections: int = 0
+
+
+class MetricsCollector:
+    """In-memory per-endpoint latency histograms and counters; use as a hook."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], _EndpointStats] = defaultdict(_EndpointStats)
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._stats[(event.method, event.endpoint)]
+            stats.requests += 1
+            stats.retries += event.attempt > 0
+            stats.latency.observe(event.total)
+            if event.ttfb is not None:
+                stats.ttfb.observe(event.ttfb)
+            stats.queue_wait += event.queue_wait
+            stats.request_bytes += event.request_bytes
+            stats.response_bytes += event.response_bytes
+            stats.new_connections += bool(event.new_connection)
+            if event.status is not None:
+                stats.statuses[event.status] += 1
+            if event.error is not None or (event.status or 0) >= 400:
+                stats.errors += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per-endpoint totals, keyed ``"METHOD /endpoint/{id}"``, slowest total time first."""
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda kv: -kv[1].latency.total)
+            return {
+                f"{method} {endpoint}": {
+                    "requests": s.requests,
+                    "retries": s.retries,
+                    "errors": s.errors,
+                    "statuses": dict(s.statuses),
+                    "total_seconds": s.latency.total,
+                    "mean": s.latency.total / s.latency.n,
+                    "p50": s.latency.quantile(0.5),
+                    "p90": s.latency.quantile(0.9),
+                    "p99": s.latency.quantile(0.99),
+                    "ttfb_p50": s.ttfb.quantile(0.5),
+                    "queue_wait_seconds": s.queue_wait,
+                    "request_bytes": s.request_bytes,
+                    "response_bytes": s.response_bytes,
+                    "new_connections": s.new_connections,
+                }
+                for (method, endpoint), s in items
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# ---- optional exporters ---------------------------------------------------
+
+
+class OpenTelemetryHook:
+    """Record request metrics through the OpenTelemetry metrics API.
+
+    Requires ``opentelemetry-api`` (``pip install notion-sdk[otel]``).
+    """
+
+    def __init__(self, meter: Any = None):
+        try:
+            from opentelemetry import metrics
+        except ImportError as exc:  # pragma: no cover - depends on environment
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api: pip install notion-sdk[otel]"
+            ) from exc
+        meter = meter or metrics.get_meter("notion_sdk")
+        self._duration = meter.create_histogram(
+            "notion.client.request.duration", unit="s", description="Notion API request latency"
+        )
+        self._queue_wait = meter.create_histogram(
+            "notion.client.queue_wait", unit="s", description="Time spent waiting for the rate limiter"
+        )
+        self._bytes = meter.create_counter(
+            "notion.client.response.size", unit="By", description="Response bytes received"
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        attrs = {
+            "http.request.method": event.method,
+            "notion.endpoint": event.endpoint,
+            "http.response.status_code": event.status or 0,
+            "notion.retry": event.attempt > 0,
+        }
+        self._duration.record(event.total, attrs)
+        self._queue_wait.record(event.queue_wait, attrs)
+        self._bytes.add(event.response_bytes, attrs)
+
+
+class PrometheusHook:
+    """Record request metrics as ``prometheus_client`` histograms and counters.
+
+    Requires ``prometheus-client`` (``pip install notion-sdk[prometheus]``).
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "notion_client"):
+        try:
+            from prometheus_client import REGISTRY, Counter, Histogram
+        except ImportError as exc:  # pragma: no cover - depends on environment
+            raise ImportError(
+                "PrometheusHook requires prometheus-client: pip install notion-sdk[prometheus]"
+            ) from exc
+        registry = registry or REGISTRY
+        labels = ("method", "endpoint", "status")
+        self._duration = Histogram(
+            "request_duration_seconds", "Notion API request latency", labels,
+            namespace=namespace, registry=registry, buckets=LATENCY_BUCKETS,
+        )
+        self._queue_wait = Histogram(
+            "queue_wait_seconds", "Time spent waiting for the rate limiter", labels,
+            namespace=namespace, registry=registry, buckets=LATENCY_BUCKETS,
+        )
+        self._bytes = Counter(
+            "response_bytes", "Response bytes received", labels,
+            namespace=namespace, registry=registry,
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        labels = (event.method, event.endpoint, str(event.status or "error"))
+        self._duration.labels(*labels).observe(event.total)
+        self._queue_wait.labels(*labels).observe(event.queue_wait)
+        self._bytes.labels(*labels).inc(event.response_bytes)
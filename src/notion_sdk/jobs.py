@@ -0,0 +1,166 @@
+"""Resumable jobs: checkpointed pagination and idempotent bulk writes.
+
+A :class:`Job` keeps its progress in a store from :mod:`notion_sdk.stores`
+(use :class:`~notion_sdk.stores.SQLiteStore` for large jobs), so a process
+that is restarted picks up where the previous one stopped::
+
+    job = Job(SQLiteStore("export.db"), "export-tasks")
+    for row in job.paginate(client.query_data_source, ds_id, page_size=100):
+        export(row)
+
+    results = job.run_bulk(
+        lambda row: client.create_page(**to_page(row)), rows, key=lambda row: row["sku"]
+    )
+
+:meth:`Job.paginate` saves the next cursor after every page.  If the loop
+is stopped (an exception, ``break`` or interpreter shutdown closes the
+generator), the IDs already processed on the current page are saved too and
+are skipped on resume; after a hard crash, the current page is replayed.
+
+:meth:`Job.run_bulk` records every item's key before and after its write.
+Items recorded as done are not sent again.  An item whose write started but
+was never recorded as done (the process died mid-request, or the API
+answered 5xx) may or may not have been applied; it is reported with an
+:class:`UncertainWrite` error instead of being repeated, unless
+``retry_uncertain=True``.  A ``4xx`` or a connection that was never
+established leaves nothing applied, so those items can be run again.
+
+This relies on the client not re-sending the write itself after a timeout
+or 5xx, which is what the default :class:`~notion_sdk.ratelimit.RetryPolicy`
+guarantees; do not use ``retry_unsafe_methods=True`` with it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator
+
+import httpx
+
+from .bulk import ItemResult, bulk_map
+from .ratelimit import _NOT_SENT_ERRORS
+
+
+class UncertainWrite(Exception):
+    """A previous run started this write but did not record its outcome."""
+
+
+class Job:
+    """Progress of one named job, persisted in *store* under ``job:{name}:...`` keys."""
+
+    def __init__(self, store: Any, name: str):
+        self.store = store
+        self.name = name
+
+    def _key(self, *parts: str) -> str:
+        return ":".join(("job", self.name, *parts))
+
+    def finished(self, step: str = "scan") -> bool:
+        """True once :meth:`paginate` for *step* has read its last page."""
+        return bool(self.store.get(self._key("cursor", step), {}).get("finished"))
+
+    def reset(self, step: str = "scan") -> None:
+        """Forget the pagination checkpoint of *step* so it starts over."""
+        self.store.delete(self._key("cursor", step))
+
+    def paginate(
+        self,
+        fetch: Callable[..., dict[str, Any]],
+        *args: Any,
+        step: str = "scan",
+        key: str = "results",
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Like :func:`~notion_sdk.pagination.paginate`, resuming from the checkpoint of *step*.
+
+        An item counts as processed once the loop asks for the next one.  A
+        finished step yields nothing until :meth:`reset`.
+        """
+        checkpoint = self._key("cursor", step)
+        state = self.store.get(checkpoint, {})
+        if state.get("finished"):
+            return
+        cursor = state.get("cursor")
+        done = set(state.get("done", ()))
+        saved = True
+        try:
+            while True:
+                page = fetch(*args, start_cursor=cursor, **kwargs)
+                for item in page.get(key, []):
+                    item_id = item.get("id")
+                    if item_id in done:
+                        continue
+                    saved = False
+                    yield item
+                    if item_id is not None:
+                        done.add(item_id)
+                next_cursor = page.get("next_cursor")
+                finished = not page.get("has_more") or not next_cursor
+                cursor, done = (None if finished else next_cursor), set()
+                self.store.set(checkpoint, {"cursor": cursor, "done": [], "finished": finished})
+                saved = True
+                if finished:
+                    return
+        finally:
+            if not saved:
+                self.store.set(
+                    checkpoint, {"cursor": cursor, "done": sorted(done), "finished": False}
+                )
+
+    def run_bulk(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        key: Callable[[Any], str],
+        max_concurrency: int = 4,
+        retries: int = 2,
+        retry_uncertain: bool = False,
+        step: str = "bulk",
+    ) -> Iterator[ItemResult]:
+        """Apply *fn* to each item at most once across runs, via :func:`~notion_sdk.bulk.bulk_map`.
+
+        *key* gives each item a stable idempotency key (e.g. a source row
+        ID).  Items already done yield a result with ``attempts == 0`` whose
+        ``result`` is ``{"id": <ID recorded for it>}``.
+        """
+
+        def run(item: Any) -> Any:
+            record_key = self._key(step, key(item))
+            record = self.store.get(record_key)
+            if record is not None:
+                if record["status"] == "done":
+                    return _Skipped({"id": record.get("id")})
+                if not retry_uncertain:
+                    raise UncertainWrite(f"write for {key(item)!r} may already have been applied")
+            self.store.set(record_key, {"status": "started"})
+            try:
+                result = fn(item)
+            except httpx.HTTPStatusError as exc:
+                # A 4xx (including 429) means the write was not applied, so it
+                # is safe to try again; a 5xx leaves the outcome unknown.
+                if exc.response.status_code < 500:
+                    self.store.delete(record_key)
+                raise
+            except _NOT_SENT_ERRORS:
+                # The request never reached the server.
+                self.store.delete(record_key)
+                raise
+            result_id = result.get("id") if isinstance(result, dict) else None
+            self.store.set(record_key, {"status": "done", "id": result_id})
+            return result
+
+        def retry_if(exc: BaseException) -> bool:
+            # Only writes known not to have been applied are retried here.
+            return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+
+        for r in bulk_map(run, items, max_concurrency, retries, retry_if):
+            if isinstance(r.result, _Skipped):
+                yield ItemResult(r.index, r.item, result=r.result.record, attempts=0)
+            else:
+                yield r
+
+
+class _Skipped:
+    __slots__ = ("record",)
+
+    def __init__(self, record: dict[str, Any]):
+        self.record = record
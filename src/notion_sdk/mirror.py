@@ -0,0 +1,317 @@
+"""Local SQLite replica of selected data sources and page trees.
+
+:class:`Mirror` copies rows, their property values, block trees and comments
+into a SQLite database and answers reads from it without network calls::
+
+    mirror = Mirror(client, "workspace.db")
+    mirror.refresh_data_source(ds_id)          # incremental after the first run
+    mirror.refresh_page_tree(page_id)          # skipped if the page is unchanged
+    done = mirror.pages(ds_id, where={"Status": "Done"}, order_by="Due")
+    view = mirror.query(ds_id, filter={...}, sorts=[...])   # Notion filter JSON
+
+Property values are normalised into the ``properties`` table (one row per
+value, so multi-selects and relations are queryable) with indexes on
+``(name, value_text)`` and ``(name, value_number)``.  The full JSON of every
+object is kept as well.
+
+Data-source refreshes use :class:`~notion_sdk.sync.DataSourceSync`
+watermarks stored in the same database.  Queries never return trashed rows,
+so an incremental refresh cannot notice deletions; run
+``refresh_data_source(ds_id, full=True)`` periodically to prune them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable
+
+from .filters import query_rows
+from .models import decode_property, plain_text
+from .stores import SQLiteStore
+from .sync import DataSourceSync
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    data_source_id TEXT,
+    created_time TEXT,
+    last_edited_time TEXT,
+    title TEXT,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_data_source ON pages (data_source_id, last_edited_time);
+CREATE TABLE IF NOT EXISTS properties (
+    page_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    type TEXT,
+    value_text TEXT,
+    value_number REAL,
+    PRIMARY KEY (page_id, name, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_properties_text ON properties (name, value_text);
+CREATE INDEX IF NOT EXISTS idx_properties_number ON properties (name, value_number);
+CREATE TABLE IF NOT EXISTS blocks (
+    id TEXT PRIMARY KEY,
+    parent_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT,
+    has_children INTEGER,
+    last_edited_time TEXT,
+    text TEXT,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_parent ON blocks (parent_id, position);
+CREATE TABLE IF NOT EXISTS trees (
+    root_id TEXT PRIMARY KEY,
+    last_edited_time TEXT
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    block_id TEXT NOT NULL,
+    discussion_id TEXT,
+    created_time TEXT,
+    text TEXT,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_comments_block ON comments (block_id, created_time);
+"""
+
+
+def _property_rows(page_id: str, props: dict[str, Any]) -> Iterable[tuple]:
+    for name, prop in props.items():
+        value = decode_property(prop)
+        values = value if isinstance(value, list) else [value]
+        for seq, v in enumerate(values):
+            if isinstance(v, dict):  # dates
+                v = v.get("start")
+            if v is None:
+                continue
+            if isinstance(v, (bool, int, float)):
+                yield page_id, name, seq, prop.get("type"), None, float(v)
+            else:
+                yield page_id, name, seq, prop.get("type"), str(v), None
+
+
+class Mirror:
+    """SQLite replica of data sources, page trees and comments (see module docs)."""
+
+    def __init__(self, client: Any, path: str | os.PathLike[str]):
+        self.client = client
+        self.path = os.fspath(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+        self._sync = DataSourceSync(client, SQLiteStore(self.path, table="mirror_state"))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ---- refresh ----------------------------------------------------------
+
+    def refresh_data_source(self, data_source_id: str, full: bool = False) -> int:
+        """Pull rows changed since the last refresh; return how many were written.
+
+        With *full*, every row is re-read and rows no longer returned by the
+        API (trashed or moved) are removed.
+        """
+        if full:
+            self._sync.reset(data_source_id)
+        result = self._sync.pull(data_source_id)
+        with self._lock, self._conn:
+            self._store_pages(data_source_id, result.changes)
+            if full:
+                self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep (id TEXT PRIMARY KEY)")
+                self._conn.execute("DELETE FROM keep")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO keep VALUES (?)", ((r["id"],) for r in result.changes)
+                )
+                stale = "SELECT id FROM pages WHERE data_source_id = ? AND id NOT IN (SELECT id FROM keep)"
+                self._conn.execute(
+                    f"DELETE FROM properties WHERE page_id IN ({stale})", (data_source_id,)
+                )
+                self._conn.execute(
+                    "DELETE FROM pages WHERE data_source_id = ? AND id NOT IN (SELECT id FROM keep)",
+                    (data_source_id,),
+                )
+        self._sync.commit(result)
+        return len(result.changes)
+
+    def _store_pages(self, data_source_id: str, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            props = row.get("properties") or {}
+            title = next(
+                (plain_text(p["title"]) for p in props.values() if p.get("type") == "title"), None
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    row["id"],
+                    data_source_id,
+                    row.get("created_time"),
+                    row.get("last_edited_time"),
+                    title,
+                    json.dumps(row),
+                ),
+            )
+            self._conn.execute("DELETE FROM properties WHERE page_id = ?", (row["id"],))
+            self._conn.executemany(
+                "INSERT INTO properties VALUES (?, ?, ?, ?, ?, ?)", _property_rows(row["id"], props)
+            )
+
+    def refresh_page_tree(self, page_id: str, max_concurrency: int = 4, force: bool = False) -> bool:
+        """Re-fetch a page's block tree if the page was edited since the last refresh.
+
+        Returns True if the tree was fetched.
+        """
+        page = self.client.get_page(page_id)
+        edited = page.get("last_edited_time")
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_edited_time FROM trees WHERE root_id = ?", (page_id,)
+            ).fetchone()
+        if not force and row is not None and row[0] == edited:
+            return False
+        positions: dict[str, int] = {}
+        blocks = []
+        for parent_id, block in self.client.iter_block_tree(page_id, max_concurrency=max_concurrency):
+            position = positions.get(parent_id, 0)
+            positions[parent_id] = position + 1
+            blocks.append((parent_id, position, block))
+        with self._lock, self._conn:
+            self._delete_subtree(page_id)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        b["id"],
+                        parent_id,
+                        position,
+                        b.get("type"),
+                        int(bool(b.get("has_children"))),
+                        b.get("last_edited_time"),
+                        plain_text((b.get(b.get("type")) or {}).get("rich_text")),
+                        json.dumps(b),
+                    )
+                    for parent_id, position, b in blocks
+                ),
+            )
+            self._conn.execute("INSERT OR REPLACE INTO trees VALUES (?, ?)", (page_id, edited))
+        return True
+
+    def _delete_subtree(self, root_id: str) -> None:
+        self._conn.execute(
+            "WITH RECURSIVE sub(id) AS ("
+            " SELECT id FROM blocks WHERE parent_id = ?"
+            " UNION ALL SELECT b.id FROM blocks b JOIN sub ON b.parent_id = sub.id)"
+            " DELETE FROM blocks WHERE id IN (SELECT id FROM sub)",
+            (root_id,),
+        )
+
+    def refresh_comments(self, block_id: str) -> int:
+        """Replace the stored comments of a block or page; return how many there are."""
+        comments = list(self.client.iter_comments(block_id))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM comments WHERE block_id = ?", (block_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO comments VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        c["id"],
+                        block_id,
+                        c.get("discussion_id"),
+                        c.get("created_time"),
+                        plain_text(c.get("rich_text")),
+                        json.dumps(c),
+                    )
+                    for c in comments
+                ),
+            )
+        return len(comments)
+
+    # ---- local reads ------------------------------------------------------
+
+    def _json_rows(self, sql: str, args: Iterable[Any] = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            return [json.loads(r[0]) for r in self._conn.execute(sql, tuple(args))]
+
+    def get_page(self, page_id: str) -> dict[str, Any] | None:
+        rows = self._json_rows("SELECT json FROM pages WHERE id = ?", (page_id,))
+        return rows[0] if rows else None
+
+    def pages(
+        self,
+        data_source_id: str,
+        where: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Rows of a mirrored data source, filtered by property equality via the indexes.
+
+        *where* maps property names to a value; a row matches if any of the
+        property's values (e.g. one option of a multi-select) equals it.
+        *order_by* is a property name or ``created_time``/``last_edited_time``.
+        """
+        sql = ["SELECT p.json FROM pages p"]
+        args: list[Any] = []
+        if order_by in (None, "created_time", "last_edited_time"):
+            order = f"p.{order_by or 'created_time'}"
+        else:
+            sql.append(
+                "LEFT JOIN properties o ON o.page_id = p.id AND o.name = ? AND o.seq = 0"
+            )
+            args.append(order_by)
+            order = "COALESCE(o.value_number, o.value_text)"
+        sql.append("WHERE p.data_source_id = ?")
+        args.append(data_source_id)
+        for name, value in (where or {}).items():
+            column = "value_number" if isinstance(value, (bool, int, float)) else "value_text"
+            sql.append(
+                f"AND EXISTS (SELECT 1 FROM properties w WHERE w.page_id = p.id"
+                f" AND w.name = ? AND w.{column} = ?)"
+            )
+            args += [name, float(value) if column == "value_number" else value]
+        sql.append(f"ORDER BY {order} IS NULL, {order} {'DESC' if descending else 'ASC'}")
+        if limit is not None:
+            sql.append("LIMIT ?")
+            args.append(limit)
+        return self._json_rows(" ".join(sql), args)
+
+    def query(
+        self,
+        data_source_id: str,
+        filter: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluate a ``query_data_source`` filter and sorts against mirrored rows.
+
+        See :mod:`notion_sdk.filters` for where local evaluation differs
+        from the server.
+        """
+        rows = self._json_rows("SELECT json FROM pages WHERE data_source_id = ?", (data_source_id,))
+        return query_rows(rows, filter, sorts)
+
+    def block_children(self, parent_id: str) -> list[dict[str, Any]]:
+        """Mirrored children of a block or page, in document order."""
+        return self._json_rows(
+            "SELECT json FROM blocks WHERE parent_id = ? ORDER BY position", (parent_id,)
+        )
+
+    def comments(self, block_id: str) -> list[dict[str, Any]]:
+        return self._json_rows(
+            "SELECT json FROM comments WHERE block_id = ? ORDER BY created_time", (block_id,)
+        )
+
+    def search_titles(self, text: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Mirrored pages whose title contains *text* (case-insensitive)."""
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._json_rows(
+            "SELECT json FROM pages WHERE title LIKE ? ESCAPE '\\' ORDER BY last_edited_time DESC LIMIT ?",
+            (f"%{escaped}%", limit),
+        )
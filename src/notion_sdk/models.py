@@ -0,0 +1,232 @@
+"""Compact typed wrappers for API results.
+
+Endpoint methods return raw dicts.  The classes here are optional,
+``__slots__``-based views over those dicts that keep only the fields most
+code needs.  Page properties are stored as their raw JSON and decoded to
+plain Python values only when accessed; pass ``properties=[...]`` to keep
+just the named properties and let the rest of the row be garbage-collected::
+
+    for page in wrap_all(client.iter_query_data_source(ds_id), properties=["Name", "Status"]):
+        print(page.id, page["Name"], page["Status"])
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator
+
+
+def plain_text(rich_text: list[dict[str, Any]] | None) -> str:
+    """Concatenate the ``plain_text`` of a rich-text array."""
+    return "".join(
+        part.get("plain_text") or part.get("text", {}).get("content", "")
+        for part in rich_text or ()
+    )
+
+
+def _file_url(f: dict[str, Any]) -> str | None:
+    return (f.get(f.get("type") or "") or {}).get("url")
+
+
+def decode_property(prop: dict[str, Any]) -> Any:
+    """Decode one page property value into a plain Python value.
+
+    Text-like properties become ``str``; ``select``/``status`` their option
+    name; ``multi_select`` a list of names; ``people``/``relation`` a list of
+    IDs; ``files`` a list of URLs; ``date`` the ``{"start", "end",
+    "time_zone"}`` dict; ``formula``/``rollup`` their computed value.
+    Unknown types are returned raw.
+    """
+    kind = prop.get("type")
+    value = prop.get(kind)
+    if kind in ("title", "rich_text"):
+        return plain_text(value)
+    if kind in ("select", "status"):
+        return value["name"] if value else None
+    if kind == "multi_select":
+        return [option["name"] for option in value or ()]
+    if kind in ("people", "relation"):
+        return [item["id"] for item in value or ()]
+    if kind in ("created_by", "last_edited_by"):
+        return value["id"] if value else None
+    if kind == "files":
+        return [_file_url(f) for f in value or ()]
+    if kind == "unique_id":
+        if not value:
+            return None
+        prefix = value.get("prefix")
+        return f"{prefix}-{value['number']}" if prefix else value["number"]
+    if kind == "verification":
+        return value["state"] if value else None
+    if kind == "formula":
+        return value.get(value.get("type")) if value else None
+    if kind == "rollup":
+        if not value:
+            return None
+        if value.get("type") == "array":
+            return [decode_property(item) for item in value["array"]]
+        return value.get(value.get("type"))
+    return value
+
+
+class Properties(Mapping):
+    """Read-only mapping of property name → decoded value, decoded on access."""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: dict[str, dict[str, Any]]):
+        self._raw = raw
+
+    def __getitem__(self, name: str) -> Any:
+        return decode_property(self._raw[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def raw(self, name: str) -> dict[str, Any]:
+        """The undecoded property JSON."""
+        return self._raw[name]
+
+    def __repr__(self) -> str:
+        return f"Properties({list(self._raw)})"
+
+
+class Page:
+    __slots__ = (
+        "id", "parent", "url", "created_time", "last_edited_time", "archived", "properties",
+    )
+
+    def __init__(self, data: dict[str, Any], properties: Iterable[str] | None = None):
+        self.id: str = data["id"]
+        self.parent: dict[str, Any] | None = data.get("parent")
+        self.url: str | None = data.get("url")
+        self.created_time: str | None = data.get("created_time")
+        self.last_edited_time: str | None = data.get("last_edited_time")
+        self.archived: bool = bool(data.get("archived") or data.get("in_trash"))
+        raw = data.get("properties") or {}
+        if properties is not None:
+            raw = {name: raw[name] for name in properties if name in raw}
+        self.properties = Properties(raw)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.properties[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.properties.get(name, default)
+
+    @property
+    def title(self) -> str:
+        """Plain text of the title property, whatever it is named."""
+        for prop in self.properties._raw.values():
+            if prop.get("type") == "title":
+                return plain_text(prop["title"])
+        return ""
+
+    def __repr__(self) -> str:
+        return f"Page(id={self.id!r}, title={self.title!r})"
+
+
+class Block:
+    __slots__ = (
+        "id", "type", "parent", "has_children", "created_time", "last_edited_time", "archived",
+        "content",
+    )
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.type: str = data.get("type", "")
+        self.parent: dict[str, Any] | None = data.get("parent")
+        self.has_children: bool = bool(data.get("has_children"))
+        self.created_time: str | None = data.get("created_time")
+        self.last_edited_time: str | None = data.get("last_edited_time")
+        self.archived: bool = bool(data.get("archived") or data.get("in_trash"))
+        self.content: dict[str, Any] = data.get(self.type) or {}
+
+    @property
+    def text(self) -> str:
+        """Plain text of the block's ``rich_text`` (empty for blocks without text)."""
+        return plain_text(self.content.get("rich_text"))
+
+    def __repr__(self) -> str:
+        return f"Block(id={self.id!r}, type={self.type!r})"
+
+
+class User:
+    __slots__ = ("id", "type", "name", "avatar_url", "email")
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.type: str | None = data.get("type")
+        self.name: str | None = data.get("name")
+        self.avatar_url: str | None = data.get("avatar_url")
+        self.email: str | None = (data.get("person") or {}).get("email")
+
+    def __repr__(self) -> str:
+        return f"User(id={self.id!r}, name={self.name!r})"
+
+
+class Comment:
+    __slots__ = ("id", "discussion_id", "parent", "created_time", "created_by", "text")
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.discussion_id: str | None = data.get("discussion_id")
+        self.parent: dict[str, Any] | None = data.get("parent")
+        self.created_time: str | None = data.get("created_time")
+        self.created_by: str | None = (data.get("created_by") or {}).get("id")
+        self.text: str = plain_text(data.get("rich_text"))
+
+    def __repr__(self) -> str:
+        return f"Comment(id={self.id!r})"
+
+
+class DataSource:
+    __slots__ = ("id", "title", "parent", "database_parent", "last_edited_time", "schema")
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.title: str = plain_text(data.get("title"))
+        self.parent: dict[str, Any] | None = data.get("parent")
+        self.database_parent: dict[str, Any] | None = data.get("database_parent")
+        self.last_edited_time: str | None = data.get("last_edited_time")
+        #: Property name → property schema (``{"type": "select", "select": {...}}``).
+        self.schema: dict[str, dict[str, Any]] = data.get("properties") or {}
+
+    def __repr__(self) -> str:
+        return f"DataSource(id={self.id!r}, title={self.title!r})"
+
+
+_MODELS = {
+    "page": Page,
+    "block": Block,
+    "user": User,
+    "comment": Comment,
+    "data_source": DataSource,
+}
+
+
+def wrap(data: dict[str, Any], properties: Iterable[str] | None = None) -> Any:
+    """Wrap one API object in its model class based on its ``object`` field.
+
+    *properties* projects pages down to the named properties.  Objects
+    without a model are returned unchanged.
+    """
+    model = _MODELS.get(data.get("object"))
+    if model is None:
+        return data
+    if model is Page:
+        return Page(data, properties)
+    return model(data)
+
+
+def wrap_all(
+    items: Iterable[dict[str, Any]], properties: Iterable[str] | None = None
+) -> Iterator[Any]:
+    """Lazily :func:`wrap` every object of an iterable (e.g. an ``iter_*`` result)."""
+    if properties is not None:
+        properties = tuple(properties)
+    for item in items:
+        yield wrap(item, properties)
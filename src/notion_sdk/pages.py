@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterable, Iterable, Iterator
+
+from .bulk import ItemResult
+from .graph import RelationGraph, _split_start
 
 
 class PagesMixin:
@@ -45,6 +48,53 @@ class PagesMixin:
         """GET /v1/pages/{page_id} — Retrieve a page."""
         return self._get(f"/pages/{page_id}")
 
+    def get_pages(
+        self,
+        page_ids: Iterable[str],
+        max_concurrency: int = 4,
+        retries: int = 2,
+        ordered: bool = True,
+    ) -> Iterator[ItemResult]:
+        """Fetch many pages concurrently, one :class:`~notion_sdk.bulk.ItemResult` per input ID.
+
+        Duplicate IDs are fetched once; GETs go through the response cache
+        when one is configured.  With *ordered* results come back in input
+        order (each as soon as all earlier ones are ready), otherwise in
+        completion order.  Failed IDs carry ``error`` instead of aborting the
+        batch; an ID still throttled (429) after the client's own retries is
+        resubmitted up to *retries* times.
+        """
+        return self._fetch_many(self.get_page, page_ids, max_concurrency, retries, ordered)
+
+    def walk_relations(
+        self,
+        start: Iterable[str | dict[str, Any]],
+        max_depth: int = 1,
+        properties: Iterable[str] | None = None,
+        max_concurrency: int = 4,
+        graph: RelationGraph | None = None,
+    ) -> RelationGraph:
+        """Follow relation properties breadth-first from *start*, fetching each level as one batch.
+
+        *start* holds page dicts (e.g. query results) or page IDs, which are
+        fetched first.  Relations are followed up to *max_depth* hops,
+        through the *properties* allowlist if given.  Pages already in
+        *graph* are not fetched again.  See :mod:`notion_sdk.graph`.
+        """
+        graph = graph if graph is not None else RelationGraph()
+        frontier, missing = _split_start(graph, start)
+        visited = set(frontier) | set(missing)
+        for level in range(max_depth + 1):
+            if missing:
+                fetched = self.get_pages(missing, max_concurrency, ordered=False)
+                frontier += graph._add_results(fetched, level)
+            if level == max_depth:
+                break
+            frontier, missing = graph._next_level(frontier, visited, properties)
+            if not frontier and not missing:
+                break
+        return graph
+
     def update_page(
         self,
         page_id: str,
@@ -66,6 +116,39 @@ class PagesMixin:
             body["erase_content"] = erase_content
         return self._patch(f"/pages/{page_id}", json=body)
 
+    def bulk_create_pages(
+        self,
+        pages: Iterable[dict[str, Any]],
+        max_concurrency: int = 4,
+        retries: int = 2,
+    ) -> Iterator[ItemResult]:
+        """Create many pages concurrently, streaming one :class:`~notion_sdk.bulk.ItemResult` per item.
+
+        Each item is a dict of :meth:`create_page` keyword arguments
+        (``parent``, ``properties``, ...).  *pages* is consumed lazily, so it
+        can be a generator over a file of any size.  Results arrive in
+        completion order; check ``ItemResult.ok`` to separate successes from
+        failures.  See :func:`~notion_sdk.bulk.bulk_map` for retry behaviour.
+        """
+        return self._bulk_map(
+            lambda kwargs: self.create_page(**kwargs), pages, max_concurrency, retries
+        )
+
+    def bulk_update_pages(
+        self,
+        updates: Iterable[dict[str, Any]],
+        max_concurrency: int = 4,
+        retries: int = 2,
+    ) -> Iterator[ItemResult]:
+        """Update many pages concurrently, streaming one :class:`~notion_sdk.bulk.ItemResult` per item.
+
+        Each item is a dict of :meth:`update_page` keyword arguments and must
+        include ``page_id``, e.g. ``{"page_id": "...", "properties": {...}}``.
+        """
+        return self._bulk_map(
+            lambda kwargs: self.update_page(**kwargs), updates, max_concurrency, retries
+        )
+
     def archive_page(self, page_id: str) -> dict[str, Any]:
         """PATCH /v1/pages/{page_id} — Archive (soft-delete) a page."""
         return self._patch(f"/pages/{page_id}", json={"archived": True})
@@ -84,3 +167,35 @@ class PagesMixin:
         body: dict[str, Any] = {"parent": parent}
         body.update(kwargs)
         return self._post(f"/pages/{page_id}/move", json=body)
+
+
+class AsyncPagesMixin(PagesMixin):
+    """Coroutine overrides for the :class:`PagesMixin` methods that chain requests."""
+
+    async def walk_relations(
+        self,
+        start: Iterable[str | dict[str, Any]] | AsyncIterable[str | dict[str, Any]],
+        max_depth: int = 1,
+        properties: Iterable[str] | None = None,
+        max_concurrency: int = 4,
+        graph: RelationGraph | None = None,
+    ) -> RelationGraph:
+        """Async variant of :meth:`PagesMixin.walk_relations`.
+
+        *start* may also be an async iterable such as ``iter_query_data_source``.
+        """
+        graph = graph if graph is not None else RelationGraph()
+        if isinstance(start, AsyncIterable):
+            start = [item async for item in start]
+        frontier, missing = _split_start(graph, start)
+        visited = set(frontier) | set(missing)
+        for level in range(max_depth + 1):
+            if missing:
+                fetched = [r async for r in self.get_pages(missing, max_concurrency, ordered=False)]
+                frontier += graph._add_results(fetched, level)
+            if level == max_depth:
+                break
+            frontier, missing = graph._next_level(frontier, visited, properties)
+            if not frontier and not missing:
+                break
+        return graph
@@ -0,0 +1,137 @@
+"""Lazy iteration over Notion's cursor-paginated list endpoints.
+
+List endpoints return ``{"results": [...], "has_more": bool, "next_cursor": str}``.
+:func:`paginate` turns such an endpoint into a generator that yields one item
+at a time and only requests the next page once the current one is exhausted,
+so memory stays flat no matter how many rows the endpoint returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+MAX_PAGE_SIZE = 100
+
+
+def paginate(
+    fetch: Callable[..., dict[str, Any]],
+    *args: Any,
+    key: str = "results",
+    prefetch: bool = False,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """Yield every item of a paginated endpoint.
+
+    Args:
+        fetch: Bound endpoint method accepting ``start_cursor=``, e.g.
+            ``client.get_block_children``.
+        *args: Positional arguments for *fetch*.
+        key: Name of the list in each response (``"templates"`` for
+            :meth:`list_data_source_templates`).
+        prefetch: Request the next page on a background thread while the
+            current page is being consumed.
+        **kwargs: Keyword arguments for *fetch* (``page_size``, ``filter``...).
+    """
+    if not prefetch:
+        cursor = None
+        while True:
+            page = fetch(*args, start_cursor=cursor, **kwargs)
+            yield from page.get(key, [])
+            cursor = page.get("next_cursor")
+            if not page.get("has_more") or not cursor:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-prefetch")
+    try:
+        page = fetch(*args, start_cursor=None, **kwargs)
+        while True:
+            cursor = page.get("next_cursor")
+            pending = None
+            if page.get("has_more") and cursor:
+                pending = executor.submit(fetch, *args, start_cursor=cursor, **kwargs)
+            yield from page.get(key, [])
+            if pending is None:
+                return
+            page = pending.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch: Callable[..., Awaitable[dict[str, Any]]],
+    *args: Any,
+    key: str = "results",
+    prefetch: bool = False,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async-generator variant of :func:`paginate` for coroutine endpoints."""
+    page = await fetch(*args, start_cursor=None, **kwargs)
+    while True:
+        cursor = page.get("next_cursor")
+        has_next = bool(page.get("has_more") and cursor)
+        pending = None
+        if has_next and prefetch:
+            pending = asyncio.ensure_future(fetch(*args, start_cursor=cursor, **kwargs))
+        try:
+            for item in page.get(key, []):
+                yield item
+        except BaseException:
+            if pending is not None:
+                pending.cancel()
+            raise
+        if not has_next:
+            return
+        page = await pending if pending is not None else await fetch(
+            *args, start_cursor=cursor, **kwargs
+        )
+
+
+def paginate_stream(
+    stream_list: Callable[..., Iterator[dict[str, Any]]],
+    method: str,
+    path: str,
+    params: dict[str, Any] | None = None,
+    json: dict[str, Any] | None = None,
+    key: str = "results",
+) -> Iterator[dict[str, Any]]:
+    """Yield every item of a paginated endpoint, decoding each page as it arrives.
+
+    *stream_list* is the client's ``_stream_list``: it yields the items of
+    one response incrementally and fills a dict with the remaining fields
+    (``has_more``, ``next_cursor``).  The cursor goes into the JSON body for
+    POST endpoints and into the query string otherwise.
+    """
+    while True:
+        rest: dict[str, Any] = {}
+        yield from stream_list(method, path, params, json, key, rest)
+        cursor = rest.get("next_cursor")
+        if not rest.get("has_more") or not cursor:
+            return
+        if json is not None:
+            json = {**json, "start_cursor": cursor}
+        else:
+            params = {**(params or {}), "start_cursor": cursor}
+
+
+async def apaginate_stream(
+    stream_list: Callable[..., AsyncIterator[dict[str, Any]]],
+    method: str,
+    path: str,
+    params: dict[str, Any] | None = None,
+    json: dict[str, Any] | None = None,
+    key: str = "results",
+) -> AsyncIterator[dict[str, Any]]:
+    """Async-generator variant of :func:`paginate_stream`."""
+    while True:
+        rest: dict[str, Any] = {}
+        async for item in stream_list(method, path, params, json, key, rest):
+            yield item
+        cursor = rest.get("next_cursor")
+        if not rest.get("has_more") or not cursor:
+            return
+        if json is not None:
+            json = {**json, "start_cursor": cursor}
+        else:
+            params = {**(params or {}), "start_cursor": cursor}
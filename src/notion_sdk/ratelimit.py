@@ -0,0 +1,184 @@
+"""Client-side rate limiting and retry policy.
+
+Notion allows roughly three requests per second per integration and answers
+bursts above that with ``429 Too Many Requests``.  :class:`RateLimiter` is a
+thread-safe token bucket shared by every request a client makes, and
+:class:`RetryPolicy` decides whether (and after how long) a failed request is
+sent again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+DEFAULT_RATE_LIMIT = 3.0
+
+_queue_wait: ContextVar[float] = ContextVar("notion_sdk_queue_wait", default=0.0)
+
+
+def last_queue_wait() -> float:
+    """Seconds the most recent request in this thread/task waited for the rate limiter."""
+    return _queue_wait.get()
+
+
+class RateLimiter:
+    """Token bucket pacing requests to *rate* per second.
+
+    Up to *burst* requests may go out back-to-back; after that callers are
+    spaced ``1 / rate`` seconds apart.  Reservations are made under a lock, so
+    one limiter can be shared by many threads, coroutines and clients.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE_LIMIT, burst: int | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.total_wait = 0.0
+
+    def reserve(self) -> float:
+        """Claim a slot and return how many seconds the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            delay = max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+            self.acquired += 1
+            self.total_wait += delay
+            return delay
+
+    def delay(self) -> float:
+        """Seconds a slot claimed now would wait, without claiming it."""
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._tokens, self._updated
+            if now > updated:
+                tokens, updated = min(self.burst, tokens + (now - updated) * self.rate), now
+            return max(0.0, updated - now) + max(0.0, 1 - tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Block until a slot is available; return the time spent waiting."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Coroutine variant of :meth:`acquire`."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out slots for *seconds* (used when the server sends ``Retry-After``)."""
+        with self._lock:
+            resume = time.monotonic() + seconds
+            if resume > self._updated:
+                self._updated = resume
+                self._tokens = min(self._tokens, 0.0)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Methods that can be re-sent after an ambiguous failure without changing
+# the outcome, and POST endpoints that only read.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+_READ_ONLY_POSTS = ("/query", "/search")
+
+# Failures that prove the request never reached the server.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def is_idempotent(request: httpx.Request) -> bool:
+    """True if *request* can be repeated safely (reads, deletes, queries and search)."""
+    if request.method in _IDEMPOTENT_METHODS:
+        return True
+    return request.method == "POST" and request.url.path.endswith(_READ_ONLY_POSTS)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a failed request.
+
+    ``429`` and ``503`` honour the server's ``Retry-After`` header; other
+    retryable statuses and connection errors use exponential backoff with
+    full jitter.  Both are capped at *backoff_max*.
+
+    A write that timed out or got a 5xx may already have been applied, so
+    non-idempotent requests (page/block/comment creation, updates, appends)
+    are only retried after ``429`` or a connection that was never
+    established, unless *retry_unsafe_methods* is set.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_unsafe_methods: bool = False
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def delay_for(
+        self,
+        attempt: int,
+        response: httpx.Response | None = None,
+        request: httpx.Request | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        """Return the delay before retry number *attempt* + 1, or None to give up.
+
+        Pass the *response* for HTTP errors; omit it for transport errors and
+        pass the *error* instead.  Without *request* the request is assumed
+        to be idempotent.
+        """
+        if attempt >= self.max_retries:
+            return None
+        unsafe = (
+            request is not None and not self.retry_unsafe_methods and not is_idempotent(request)
+        )
+        if response is None:
+            if unsafe and not isinstance(error, _NOT_SENT_ERRORS):
+                return None
+            return self.backoff(attempt)
+        if response.status_code not in self.retry_statuses:
+            return None
+        if unsafe and response.status_code != 429:
+            return None
+        if response.status_code in (429, 503):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                # Never let one header stall the shared rate limiter for long.
+                return min(retry_after, self.backoff_max)
+        return self.backoff(attempt)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
+
+from .pagination import MAX_PAGE_SIZE
 
 
 class SearchMixin:
@@ -29,3 +31,31 @@ class SearchMixin:
         if page_size is not None:
             body["page_size"] = page_size
         return self._post("/search", json=body)
+
+    def iter_search(
+        self,
+        query: str | None = None,
+        filter: dict[str, Any] | None = None,
+        sort: dict[str, Any] | None = None,
+        page_size: int | None = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every search result, fetching pages lazily.
+
+        With *stream*, each page is decoded incrementally (*prefetch* is then
+        ignored).
+        """
+        if stream:
+            body = {"query": query, "filter": filter, "sort": sort, "page_size": page_size}
+            return self._paginate_stream(
+                "POST", "/search", json={k: v for k, v in body.items() if v is not None}
+            )
+        return self._paginate(
+            self.search,
+            query=query,
+            filter=filter,
+            sort=sort,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
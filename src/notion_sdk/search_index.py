@@ -0,0 +1,196 @@
+"""Local full-text index over the workspace's search results.
+
+:class:`SearchIndex` crawls ``search`` into a SQLite FTS5 table (with prefix
+indexes) so "jump to page" style lookups are answered locally::
+
+    index = SearchIndex(client, "search.db")
+    index.refresh()                       # first run crawls everything
+    index.search("proj roadm")            # prefix match on every word
+    index.refresh()                       # later runs stop at the watermark
+
+Results are crawled newest-first by ``last_edited_time``, so an incremental
+refresh stops paginating as soon as it reaches objects older than the last
+refresh (minus *overlap*).  With ``content=True`` the text of each changed
+page's blocks is indexed as well, at the cost of fetching its block tree.
+Search never returns trashed objects; ``refresh(full=True)`` re-crawls and
+drops anything no longer returned.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import timedelta
+from typing import Any
+
+from .models import plain_text
+from .stores import SQLiteStore
+from .sync import format_time, parse_time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_objects (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    object TEXT,
+    title TEXT,
+    url TEXT,
+    last_edited_time TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    title, body, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+"""
+
+_WORD = re.compile(r"\w+")
+
+
+def object_title(obj: dict[str, Any]) -> str:
+    """Plain-text title of a page, database or data source."""
+    if isinstance(obj.get("title"), list):
+        return plain_text(obj["title"])
+    for prop in (obj.get("properties") or {}).values():
+        if prop.get("type") == "title":
+            return plain_text(prop.get("title"))
+    return ""
+
+
+class SearchIndex:
+    """SQLite FTS5 index of search results, refreshed by ``last_edited_time``."""
+
+    def __init__(
+        self,
+        client: Any,
+        path: str | os.PathLike[str] = ":memory:",
+        content: bool = False,
+        overlap: timedelta = timedelta(minutes=2),
+        max_concurrency: int = 4,
+    ):
+        self.client = client
+        self.path = os.fspath(path)
+        self.content = content
+        self.overlap = overlap
+        self.max_concurrency = max_concurrency
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        try:
+            with self._lock, self._conn:
+                self._conn.executescript(_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            raise RuntimeError("SearchIndex requires SQLite built with FTS5") from exc
+        self._store = SQLiteStore(self.path, table="search_state")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM search_objects").fetchone()[0]
+
+    @property
+    def watermark(self) -> str | None:
+        return self._store.get("watermark")
+
+    def refresh(self, full: bool = False) -> int:
+        """Index objects edited since the last refresh; return how many were (re)indexed."""
+        previous = None if full else self.watermark
+        stop = format_time(parse_time(previous) - self.overlap) if previous else None
+        newest = previous
+        seen: set[str] = set()
+        count = 0
+        for obj in self.client.iter_search(
+            sort={"direction": "descending", "timestamp": "last_edited_time"}
+        ):
+            edited = obj.get("last_edited_time")
+            if stop is not None and edited and parse_time(edited) < parse_time(stop):
+                break
+            if obj["id"] in seen:
+                continue
+            seen.add(obj["id"])
+            if not full and edited == self._indexed_edit(obj["id"]):
+                continue  # inside the overlap window but unchanged
+            body = self._page_text(obj["id"]) if self.content and obj.get("object") == "page" else ""
+            self._upsert(obj, body)
+            count += 1
+            if edited and (newest is None or parse_time(edited) > parse_time(newest)):
+                newest = edited
+        if full:
+            self._prune(seen)
+        if newest is not None:
+            self._store.set("watermark", newest)
+        return count
+
+    def _indexed_edit(self, object_id: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_edited_time FROM search_objects WHERE id = ?", (object_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _page_text(self, page_id: str) -> str:
+        parts = []
+        for _, block in self.client.iter_block_tree(page_id, max_concurrency=self.max_concurrency):
+            body = block.get(block.get("type") or "") or {}
+            if isinstance(body, dict) and body.get("rich_text"):
+                parts.append(plain_text(body["rich_text"]))
+        return "\n".join(parts)
+
+    def _upsert(self, obj: dict[str, Any], body: str) -> None:
+        # FTS rows share the rowid of their search_objects row, so updates
+        # and deletes are keyed lookups rather than scans.
+        title = object_title(obj)
+        fields = (obj.get("object"), title, obj.get("url"), obj.get("last_edited_time"))
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT rowid FROM search_objects WHERE id = ?", (obj["id"],)
+            ).fetchone()
+            if row is None:
+                rowid = self._conn.execute(
+                    "INSERT INTO search_objects (id, object, title, url, last_edited_time)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (obj["id"], *fields),
+                ).lastrowid
+            else:
+                rowid = row[0]
+                self._conn.execute(
+                    "UPDATE search_objects SET object = ?, title = ?, url = ?, last_edited_time = ?"
+                    " WHERE rowid = ?",
+                    (*fields, rowid),
+                )
+                self._conn.execute("DELETE FROM search_fts WHERE rowid = ?", (rowid,))
+            self._conn.execute(
+                "INSERT INTO search_fts (rowid, title, body) VALUES (?, ?, ?)", (rowid, title, body)
+            )
+
+    def _prune(self, keep: set[str]) -> None:
+        with self._lock, self._conn:
+            stale = [
+                (rowid,)
+                for rowid, object_id in self._conn.execute("SELECT rowid, id FROM search_objects")
+                if object_id not in keep
+            ]
+            self._conn.executemany("DELETE FROM search_objects WHERE rowid = ?", stale)
+            self._conn.executemany("DELETE FROM search_fts WHERE rowid = ?", stale)
+
+    def search(self, text: str, limit: int = 20, titles_only: bool = False) -> list[dict[str, Any]]:
+        """Return indexed objects matching every word of *text* as a prefix, best first.
+
+        Title matches rank above body matches.  Each result has ``id``,
+        ``object``, ``title``, ``url`` and ``last_edited_time``.
+        """
+        words = _WORD.findall(text)
+        if not words:
+            return []
+        match = " ".join(f'"{w}"*' for w in words)
+        if titles_only:
+            match = f"title : ({match})"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT o.id, o.object, o.title, o.url, o.last_edited_time"
+                " FROM search_fts f JOIN search_objects o ON o.rowid = f.rowid"
+                " WHERE search_fts MATCH ? ORDER BY bm25(search_fts, 10.0, 1.0) LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        keys = ("id", "object", "title", "url", "last_edited_time")
+        return [dict(zip(keys, row)) for row in rows]
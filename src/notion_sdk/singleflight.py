@@ -0,0 +1,106 @@
+"""Coalescing of identical concurrent requests.
+
+When several threads (or tasks) ask for the same key while a call for it is
+already running, :class:`SingleFlight` lets them wait for that call instead
+of starting their own.  The clients use it for GETs keyed by path and query
+string, so a burst of ``get_page(same_id)`` costs one request and one rate
+limit token.  After a write, :meth:`SingleFlight.forget` makes later
+callers start a fresh call rather than join one that may predate the write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time, sharing its outcome with waiters.
+
+    :attr:`coalesced` counts the calls that were answered by another caller's
+    in-flight request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return ``(result, owner)``; *owner* is True for the caller that ran *fn*.
+
+        Waiters receive the same result object (or exception) as the owner,
+        so results that will be mutated should be copied by non-owners.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            owner = call is None
+            if owner:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not owner:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, True
+
+    def forget(self) -> None:
+        """Stop sharing the calls now in flight with callers that arrive later."""
+        with self._lock:
+            self._calls.clear()
+
+
+class AsyncSingleFlight:
+    """Coroutine variant of :class:`SingleFlight` for use on one event loop.
+
+    The shared call runs as its own task, so cancelling one waiter (even the
+    one that started it) does not cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Coroutine variant of :meth:`SingleFlight.do`."""
+        future = self._calls.get(key)
+        owner = future is None
+        if owner:
+            future = self._calls[key] = asyncio.ensure_future(fn())
+            future.add_done_callback(lambda f: self._finish(key, f))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future), owner
+
+    def forget(self) -> None:
+        """See :meth:`SingleFlight.forget`."""
+        self._calls.clear()
+
+    def _finish(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # Mark the exception retrieved in case every waiter was cancelled.
+        if not future.cancelled():
+            future.exception()
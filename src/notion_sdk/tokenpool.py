@@ -0,0 +1,361 @@
+"""Spread requests over several integration tokens.
+
+Notion rate-limits each integration token separately.  A :class:`TokenPool`
+holds several tokens, each with its own :class:`~notion_sdk.ratelimit.RateLimiter`
+and health state, behind clients that share one connection pool::
+
+    pool = TokenPool([key_a, key_b, key_c], rate_limit=3.0)
+    pages = pool.client.get_pages(page_ids, max_concurrency=9)
+
+    export = pool.client_for(workspace_id)   # always the same token
+    for block in export.iter_block_children(root_id):
+        ...
+
+:attr:`TokenPool.client` sends each request on the healthiest token: one
+that is not cooling down after a ``429``, with the shortest wait for its
+rate limiter and the fewest requests in flight (then sent so far).  A
+``429`` (or ``401``) is retried at once on another token that has not been
+tried for that request; only when every token is throttled does the
+client's :class:`~notion_sdk.ratelimit.RetryPolicy` back off.
+
+Integrations are usually shared with different pages, so a request may
+succeed with one token and get ``404`` with another.  Work that must see a
+consistent set of pages should go through :meth:`TokenPool.client_for`,
+which pins a work key to one token and never moves it.
+
+Waiting for a token's rate limiter happens inside the transport, so it is
+not reported as ``queue_wait`` to the clients' hooks.  A
+:class:`~notion_sdk.cache.ResponseCache` cannot be passed to the pool: a
+response cached for one token would be served to clients of tokens that
+cannot see the page.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Collection, Hashable, Sequence
+
+import httpx
+
+from .async_client import AsyncNotionClient
+from .client import NotionClient
+from .ratelimit import DEFAULT_RATE_LIMIT, RateLimiter, parse_retry_after
+from .transport import DEFAULT_LIMITS, AsyncPooledTransport, PooledTransport
+
+DEFAULT_COOLDOWN = 30.0
+
+# Statuses that say nothing about the page, only about the token.
+_TOKEN_STATUSES = frozenset({401, 429})
+
+_ALL_REJECTED = "every token in the pool has been rejected (401)"
+
+
+def _check_client_kwargs(client_kwargs: dict[str, Any]) -> None:
+    if client_kwargs.get("response_cache") is not None:
+        raise ValueError("a response_cache cannot be shared by the tokens of a pool")
+
+
+class _Token:
+    __slots__ = (
+        "index", "api_key", "limiter", "requests", "inflight", "throttles",
+        "throttled_until", "disabled", "pins",
+    )
+
+    def __init__(self, index: int, api_key: str, rate_limit: float | None):
+        self.index = index
+        self.api_key = api_key
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.requests = 0
+        self.inflight = 0
+        self.throttles = 0
+        self.throttled_until = 0.0
+        self.disabled = False
+        self.pins = 0
+
+
+class _Tokens:
+    """Token states and the routing decisions shared by the sync and async pools."""
+
+    def __init__(self, api_keys: Sequence[str], rate_limit: float | None, cooldown: float):
+        if not api_keys:
+            raise ValueError("api_keys must not be empty")
+        self.tokens = [_Token(i, key, rate_limit) for i, key in enumerate(api_keys)]
+        self.cooldown = cooldown
+        self._affinity: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def pick(self, exclude: Collection[int] = (), for_pin: bool = False) -> _Token | None:
+        """Return the healthiest usable token not in *exclude*, or None."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [t for t in self.tokens if t.index not in exclude and not t.disabled]
+            if not candidates:
+                return None
+            return min(candidates, key=lambda t: self._score(t, now, for_pin))
+
+    def _score(self, token: _Token, now: float, for_pin: bool) -> tuple[float, ...]:
+        throttled = max(0.0, token.throttled_until - now)
+        if for_pin:
+            # Pins last long, so balance their number rather than momentary load.
+            return (throttled, token.pins, token.requests)
+        wait = token.limiter.delay() if token.limiter is not None else 0.0
+        return (throttled, wait, token.inflight, token.requests)
+
+    def pin(self, work_key: Hashable, index: int | None) -> _Token:
+        with self._lock:
+            if work_key in self._affinity and index is None:
+                return self.tokens[self._affinity[work_key]]
+        if index is None:
+            token = self.pick(for_pin=True)
+            if token is None:
+                raise RuntimeError(_ALL_REJECTED)
+        else:
+            token = self.tokens[index]
+        with self._lock:
+            old = self._affinity.get(work_key)
+            if old is not None:
+                self.tokens[old].pins -= 1
+            self._affinity[work_key] = token.index
+            token.pins += 1
+        return token
+
+    def release(self, work_key: Hashable) -> None:
+        with self._lock:
+            index = self._affinity.pop(work_key, None)
+            if index is not None:
+                self.tokens[index].pins -= 1
+
+    def start(self, token: _Token) -> None:
+        with self._lock:
+            token.requests += 1
+            token.inflight += 1
+
+    def finish(self, token: _Token, response: httpx.Response | None) -> None:
+        with self._lock:
+            token.inflight -= 1
+            if response is None:
+                return
+            if response.status_code == 429:
+                pause = parse_retry_after(response.headers.get("Retry-After"))
+                pause = self.cooldown if pause is None else pause
+                token.throttles += 1
+                token.throttled_until = max(token.throttled_until, time.monotonic() + pause)
+                if token.limiter is not None:
+                    # Pinned clients wait on the limiter; never stall them for long.
+                    token.limiter.pause(min(pause, self.cooldown))
+            elif response.status_code == 401:
+                token.disabled = True
+
+    def health(self) -> list[dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "token": t.index,
+                    "requests": t.requests,
+                    "inflight": t.inflight,
+                    "throttles": t.throttles,
+                    "throttled_for": max(0.0, t.throttled_until - now),
+                    "disabled": t.disabled,
+                    "pinned": t.pins,
+                }
+                for t in self.tokens
+            ]
+
+
+def _prepare(request: httpx.Request, token: _Token) -> None:
+    request.headers["Authorization"] = f"Bearer {token.api_key}"
+
+
+class _PoolTransport(httpx.BaseTransport):
+    """Routes each request to a token of *tokens*, or always to *pinned*."""
+
+    def __init__(self, tokens: _Tokens, inner: httpx.BaseTransport, pinned: _Token | None = None):
+        self._tokens = tokens
+        self._inner = inner
+        self._pinned = pinned
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        tried: set[int] = set()
+        while True:
+            token = self._pinned or self._tokens.pick(tried)
+            if token is None:
+                raise RuntimeError(_ALL_REJECTED)
+            tried.add(token.index)
+            if token.limiter is not None:
+                token.limiter.acquire()
+            _prepare(request, token)
+            self._tokens.start(token)
+            response = None
+            try:
+                response = self._inner.handle_request(request)
+            finally:
+                self._tokens.finish(token, response)
+            if self._pinned or response.status_code not in _TOKEN_STATUSES:
+                return response
+            if self._tokens.pick(tried) is None:
+                return response
+            response.close()
+
+
+class _AsyncPoolTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`_PoolTransport`."""
+
+    def __init__(
+        self, tokens: _Tokens, inner: httpx.AsyncBaseTransport, pinned: _Token | None = None
+    ):
+        self._tokens = tokens
+        self._inner = inner
+        self._pinned = pinned
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        tried: set[int] = set()
+        while True:
+            token = self._pinned or self._tokens.pick(tried)
+            if token is None:
+                raise RuntimeError(_ALL_REJECTED)
+            tried.add(token.index)
+            if token.limiter is not None:
+                await token.limiter.acquire_async()
+            _prepare(request, token)
+            self._tokens.start(token)
+            response = None
+            try:
+                response = await self._inner.handle_async_request(request)
+            finally:
+                self._tokens.finish(token, response)
+            if self._pinned or response.status_code not in _TOKEN_STATUSES:
+                return response
+            if self._tokens.pick(tried) is None:
+                return response
+            await response.aclose()
+
+
+class TokenPool:
+    """Several integration tokens behind one :class:`~notion_sdk.client.NotionClient`.
+
+    *rate_limit* applies to each token separately; *cooldown* is how long a
+    token is avoided after a ``429`` without ``Retry-After``, and the longest
+    its rate limiter is paused for.  A token that gets ``401`` is not used
+    again by :attr:`client`.  Other keyword arguments are passed to every
+    client the pool creates; a ``response_cache`` raises :exc:`ValueError`
+    (see the module docs).
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        cooldown: float = DEFAULT_COOLDOWN,
+        transport: httpx.BaseTransport | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        **client_kwargs: Any,
+    ):
+        _check_client_kwargs(client_kwargs)
+        self._tokens = _Tokens(api_keys, rate_limit, cooldown)
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else PooledTransport(limits, http2)
+        self._client_kwargs = client_kwargs
+        self.client = self._make_client(None)
+        self._pinned: dict[int, NotionClient] = {}
+
+    def _make_client(self, token: _Token | None) -> NotionClient:
+        first = token or self._tokens.tokens[0]
+        return NotionClient(
+            api_key=first.api_key,
+            transport=_PoolTransport(self._tokens, self.transport, token),
+            rate_limit=None,
+            **self._client_kwargs,
+        )
+
+    def client_for(self, work_key: Hashable, token: int | None = None) -> NotionClient:
+        """Return a client whose requests all use the token *work_key* is pinned to.
+
+        A new key is pinned to the healthiest token, or to the token at index
+        *token*; passing *token* for a known key moves it.
+        """
+        pinned = self._tokens.pin(work_key, token)
+        client = self._pinned.get(pinned.index)
+        if client is None:
+            client = self._pinned.setdefault(pinned.index, self._make_client(pinned))
+        return client
+
+    def release(self, work_key: Hashable) -> None:
+        """Forget the token *work_key* is pinned to."""
+        self._tokens.release(work_key)
+
+    def health(self) -> list[dict[str, Any]]:
+        """Per-token counters: requests, in flight, 429s, cooldown left, disabled, pinned keys."""
+        return self._tokens.health()
+
+    def close(self) -> None:
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> TokenPool:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncTokenPool:
+    """Async counterpart of :class:`TokenPool`.
+
+    Built on :class:`~notion_sdk.async_client.AsyncNotionClient`.
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        cooldown: float = DEFAULT_COOLDOWN,
+        transport: httpx.AsyncBaseTransport | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        **client_kwargs: Any,
+    ):
+        _check_client_kwargs(client_kwargs)
+        self._tokens = _Tokens(api_keys, rate_limit, cooldown)
+        self._owns_transport = transport is None
+        self.transport = (
+            transport if transport is not None else AsyncPooledTransport(limits, http2)
+        )
+        self._client_kwargs = client_kwargs
+        self.client = self._make_client(None)
+        self._pinned: dict[int, AsyncNotionClient] = {}
+
+    def _make_client(self, token: _Token | None) -> AsyncNotionClient:
+        first = token or self._tokens.tokens[0]
+        return AsyncNotionClient(
+            api_key=first.api_key,
+            transport=_AsyncPoolTransport(self._tokens, self.transport, token),
+            rate_limit=None,
+            **self._client_kwargs,
+        )
+
+    def client_for(self, work_key: Hashable, token: int | None = None) -> AsyncNotionClient:
+        """See :meth:`TokenPool.client_for`."""
+        pinned = self._tokens.pin(work_key, token)
+        client = self._pinned.get(pinned.index)
+        if client is None:
+            client = self._pinned.setdefault(pinned.index, self._make_client(pinned))
+        return client
+
+    def release(self, work_key: Hashable) -> None:
+        self._tokens.release(work_key)
+
+    def health(self) -> list[dict[str, Any]]:
+        return self._tokens.health()
+
+    async def close(self) -> None:
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> AsyncTokenPool:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
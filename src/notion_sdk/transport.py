@@ -0,0 +1,134 @@
+"""Pooled HTTP transports shared between clients.
+
+A client normally builds its own :class:`PooledTransport`.  To let many
+clients (e.g. one per tenant API key) reuse the same keep-alive connections
+and TLS sessions, build one transport and pass it to each of them::
+
+    shared = PooledTransport(limits=httpx.Limits(max_connections=50), http2=True)
+    clients = [NotionClient(api_key=key, transport=shared) for key in keys]
+    ...
+    for c in clients:
+        c.close()        # does not close a transport the client did not create
+    shared.close()
+
+The transport counts requests and newly opened connections, so connection
+reuse can be monitored through :meth:`PooledTransport.stats`.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import httpx
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+class _ConnectionCounter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def on_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def on_trace(self, name: str) -> None:
+        if name == "connection.connect_tcp.started":
+            with self._lock:
+                self.new_connections += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            requests, new = self.requests, self.new_connections
+        return {
+            "requests": requests,
+            "new_connections": new,
+            "reused_connections": max(0, requests - new),
+            "reuse_ratio": (requests - new) / requests if requests else None,
+        }
+
+
+def _caller_trace(request: httpx.Request) -> Any:
+    """The caller's trace callback, looking through a wrapper left by an earlier send.
+
+    A retried request is sent again as the same object, so its ``trace``
+    extension may still be the counting wrapper from the previous attempt.
+    """
+    trace = request.extensions.get("trace")
+    return getattr(trace, "caller", trace)
+
+
+class PooledTransport(httpx.BaseTransport):
+    """``httpx.HTTPTransport`` with tuned pool defaults and connection-reuse counters.
+
+    *http2* requires the ``h2`` package (``pip install notion-sdk[http2]``).
+    Extra keyword arguments are passed to :class:`httpx.HTTPTransport`.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        **kwargs: Any,
+    ):
+        self._transport = httpx.HTTPTransport(limits=limits, http2=http2, **kwargs)
+        self._counter = _ConnectionCounter()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._counter.on_request()
+        inner = _caller_trace(request)
+
+        def trace(name: str, info: dict[str, Any]) -> None:
+            self._counter.on_trace(name)
+            if inner is not None:
+                inner(name, info)
+
+        trace.caller = inner  # type: ignore[attr-defined]
+        request.extensions["trace"] = trace
+        return self._transport.handle_request(request)
+
+    def stats(self) -> dict[str, Any]:
+        """Requests sent, connections opened and the fraction of requests on a reused connection."""
+        return self._counter.stats()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`PooledTransport`."""
+
+    def __init__(
+        self,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        **kwargs: Any,
+    ):
+        self._transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2, **kwargs)
+        self._counter = _ConnectionCounter()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._counter.on_request()
+        inner = _caller_trace(request)
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            self._counter.on_trace(name)
+            if inner is not None:
+                await inner(name, info)
+
+        trace.caller = inner  # type: ignore[attr-defined]
+        request.extensions["trace"] = trace
+        return await self._transport.handle_async_request(request)
+
+    def stats(self) -> dict[str, Any]:
+        """Requests sent, connections opened and the fraction of requests on a reused connection."""
+        return self._counter.stats()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
+
+from .pagination import MAX_PAGE_SIZE
 
 
 class UsersMixin:
@@ -21,6 +23,14 @@ class UsersMixin:
             params["page_size"] = page_size
         return self._get("/users", params=params or None)
 
+    def iter_users(
+        self,
+        page_size: int | None = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every user in the workspace, fetching pages lazily."""
+        return self._paginate(self.get_users, page_size=page_size, prefetch=prefetch)
+
     def get_self(self) -> dict[str, Any]:
         """GET /v1/users/me — Retrieve the bot user."""
         return self._get("/users/me")
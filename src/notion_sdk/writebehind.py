@@ -0,0 +1,195 @@
+"""Write-behind queue that merges and batches page and block updates.
+
+:class:`WriteBehindQueue` accepts ``update_page``/``update_block`` calls,
+returns immediately with a :class:`~concurrent.futures.Future`, and sends the
+updates from a background worker::
+
+    with WriteBehindQueue(client, flush_interval=0.5) as writes:
+        writes.update_page(page_id, properties={"Status": {...}})
+        fut = writes.update_page(page_id, properties={"Points": {...}})
+        ...
+    fut.result()   # the single PATCH that carried both properties
+
+Successive updates to the same object that have not been sent yet are merged
+into one request: ``properties`` are merged by name and every other field
+keeps its latest value.  An update is sent once it has waited
+*flush_interval* seconds, when *max_pending* objects are waiting, or on
+:meth:`flush`/:meth:`close`.  Updates to one object are sent in submission
+order, one request at a time; different objects are written concurrently on
+up to *max_concurrency* threads.  ``erase_content`` updates are never merged
+with their neighbours.
+
+The queue drives a synchronous :class:`~notion_sdk.client.NotionClient`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+# Fields whose effect depends on when they are applied, so an update carrying
+# one is sent on its own.
+_BARRIER_FIELDS = frozenset({"erase_content"})
+
+
+class _Entry:
+    __slots__ = ("kind", "object_id", "kwargs", "futures", "created")
+
+    def __init__(self, kind: str, object_id: str, kwargs: dict[str, Any]):
+        self.kind = kind
+        self.object_id = object_id
+        self.kwargs = kwargs
+        self.futures: list[Future] = []
+        self.created = time.monotonic()
+
+    def merge(self, kwargs: dict[str, Any]) -> bool:
+        if _BARRIER_FIELDS & (self.kwargs.keys() | kwargs.keys()):
+            return False
+        for name, value in kwargs.items():
+            if name == "properties" and "properties" in self.kwargs:
+                self.kwargs["properties"] = {**self.kwargs["properties"], **value}
+            else:
+                self.kwargs[name] = value
+        return True
+
+
+class WriteBehindQueue:
+    """Merge, delay and batch page/block updates (see module docs).
+
+    ``submitted`` counts update calls and ``sent`` the requests made for
+    them, so ``submitted - sent`` is the number of requests saved.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        flush_interval: float = 0.5,
+        max_pending: int = 100,
+        max_concurrency: int = 4,
+    ):
+        self.client = client
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.submitted = 0
+        self.sent = 0
+        self._cond = threading.Condition()
+        self._pending: dict[tuple[str, str], list[_Entry]] = {}
+        self._count = 0
+        self._inflight: set[tuple[str, str]] = set()
+        self._flushing = 0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_concurrency, thread_name_prefix="notion-write")
+        self._worker = threading.Thread(target=self._run, name="notion-write-behind", daemon=True)
+        self._worker.start()
+
+    def __enter__(self) -> "WriteBehindQueue":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def update_page(self, page_id: str, **kwargs: Any) -> Future:
+        """Queue :meth:`~notion_sdk.pages.PagesMixin.update_page`; the future holds its response."""
+        return self._submit("page", page_id, kwargs)
+
+    def update_block(self, block_id: str, **kwargs: Any) -> Future:
+        """Queue :meth:`~notion_sdk.blocks.BlocksMixin.update_block`; the future holds its response."""
+        return self._submit("block", block_id, kwargs)
+
+    def _submit(self, kind: str, object_id: str, kwargs: dict[str, Any]) -> Future:
+        future: Future = Future()
+        key = (kind, object_id)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("write-behind queue is closed")
+            self.submitted += 1
+            entries = self._pending.setdefault(key, [])
+            if not entries or not entries[-1].merge(kwargs):
+                entries.append(_Entry(kind, object_id, dict(kwargs)))
+                self._count += 1
+            entries[-1].futures.append(future)
+            self._cond.notify_all()
+        return future
+
+    def pending(self) -> int:
+        """Number of requests waiting to be sent."""
+        with self._cond:
+            return self._count
+
+    def flush(self) -> None:
+        """Send everything queued so far and wait until it has completed."""
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while self._pending or self._inflight:
+                    self._cond.wait()
+            finally:
+                self._flushing -= 1
+
+    def close(self) -> None:
+        """Flush, then stop the background worker.  Further updates raise ``RuntimeError``."""
+        with self._cond:
+            if self._closed:
+                return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+        self._executor.shutdown(wait=True)
+
+    # ---- worker -------------------------------------------------------------
+
+    def _due(self) -> tuple[list[_Entry], float | None]:
+        """Pop the entries that should be sent now; also return how long to sleep otherwise."""
+        now = time.monotonic()
+        force = self._flushing > 0 or self._count >= self.max_pending
+        ready: list[_Entry] = []
+        wake: float | None = None
+        for key, entries in list(self._pending.items()):
+            if key in self._inflight:
+                continue
+            due = entries[0].created + self.flush_interval
+            if force or due <= now:
+                ready.append(entries.pop(0))
+                self._inflight.add(key)
+                if not entries:
+                    del self._pending[key]
+            else:
+                wake = due if wake is None else min(wake, due)
+        self._count -= len(ready)
+        return ready, None if wake is None else max(0.0, wake - now)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed and not self._pending and not self._inflight:
+                        return
+                    ready, timeout = self._due()
+                    if ready:
+                        break
+                    self._cond.wait(timeout)
+            for entry in ready:
+                self._executor.submit(self._send, entry)
+
+    def _send(self, entry: _Entry) -> None:
+        try:
+            if entry.kind == "page":
+                result = self.client.update_page(entry.object_id, **entry.kwargs)
+            else:
+                result = self.client.update_block(entry.object_id, **entry.kwargs)
+        except BaseException as exc:
+            for future in entry.futures:
+                future.set_exception(exc)
+        else:
+            for future in entry.futures:
+                future.set_result(result)
+        finally:
+            with self._cond:
+                self.sent += 1
+                self._inflight.discard((entry.kind, entry.object_id))
+                self._cond.notify_all()
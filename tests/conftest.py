@@ -1,13 +1,55 @@
-"""Shared pytest fixtures for Notion SDK integration tests."""
+"""Shared pytest fixtures for Notion SDK tests.
+
+Integration tests use :func:`client`, which talks to the real API.  Offline
+tests build clients on an :class:`httpx.MockTransport` with :func:`mock_client`
+and usually answer requests from a :class:`FakeNotion` subclass.
+"""
 
 from __future__ import annotations
 
+import json
+import threading
+from typing import Any
+
+import httpx
 import pytest
 from notion_sdk import NotionClient
 
 TEST_PAGE_ID = "2fec2a37-9fe0-81c0-a47e-cced7c656073"
 
 
+def notion_error(status: int) -> httpx.Response:
+    """An error response shaped like the API's."""
+    return httpx.Response(status, json={"object": "error", "status": status})
+
+
+class FakeNotion:
+    """A MockTransport handler standing in for the Notion API.
+
+    Every request is recorded in :attr:`requests` (under :attr:`lock`, so
+    concurrent clients are safe) and answered by :meth:`respond`, which
+    subclasses implement; it gets the request and its decoded JSON body.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        body = json.loads(request.content) if request.content else {}
+        return self.respond(request, body)
+
+    def respond(self, request: httpx.Request, body: dict[str, Any]) -> httpx.Response:
+        raise NotImplementedError
+
+    def paths(self) -> list[tuple[str, str]]:
+        """``(method, path)`` of every request so far."""
+        with self.lock:
+            return [(r.method, r.url.path) for r in self.requests]
+
+
 @pytest.fixture(scope="session")
 def client() -> NotionClient:
     """Return a configured NotionClient (reads NOTION_API_KEY from .env)."""
@@ -16,6 +58,29 @@ def client() -> NotionClient:
     c.close()
 
 
+@pytest.fixture()
+def mock_client():
+    """Factory for clients whose requests go to *handler* instead of the network.
+
+    ``mock_client(handler, client_class=AsyncNotionClient)`` builds an async
+    client; other keyword arguments are passed to the client.  Rate limiting
+    is off.  Sync clients are closed after the test.
+    """
+    clients: list[NotionClient] = []
+
+    def make(handler, client_class=NotionClient, **kwargs: Any):
+        client = client_class(
+            api_key="test", transport=httpx.MockTransport(handler), rate_limit=None, **kwargs
+        )
+        if isinstance(client, NotionClient):
+            clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
 @pytest.fixture(scope="session")
 def test_page_id() -> str:
     """The page ID the integration has access to."""
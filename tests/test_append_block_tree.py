@@ -0,0 +1,211 @@
+"""Tests for chunked, pipelined block appends (no network required)."""
+
+import asyncio
+import itertools
+import json
+import threading
+
+import httpx
+
+from notion_sdk import AsyncNotionClient, NotionClient
+
+
+class FakeBlockStore:
+    """Minimal stand-in for PATCH /v1/blocks/{id}/children."""
+
+    def __init__(self):
+        self.children: dict[str, list[str]] = {}
+        self.text: dict[str, str] = {}
+        self.requests = 0
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        parent_id = request.url.path.split("/")[3]
+        payload = json.loads(request.content)["children"]
+        assert len(payload) <= 100
+        results = []
+        with self._lock:
+            self.requests += 1
+            for block in payload:
+                assert "children" not in block and "children" not in block[block["type"]]
+                new_id = f"blk{next(self._ids)}"
+                self.children.setdefault(parent_id, []).append(new_id)
+                self.text[new_id] = block[block["type"]]["rich_text"][0]["text"]["content"]
+                results.append({"id": new_id})
+        return httpx.Response(200, json={"object": "list", "results": results})
+
+
+def _para(text, children=None):
+    block = {"type": "toggle", "toggle": {"rich_text": [{"text": {"content": text}}]}}
+    if children:
+        block["toggle"]["children"] = children
+    return block
+
+
+def _document():
+    deep = _para("d0", [_para("d1", [_para("d2", [_para("d3")])])])
+    wide = _para("w", [_para(f"w.{i}") for i in range(150)])
+    return [_para(f"top{i}") for i in range(120)] + [deep, wide]
+
+
+def _assert_structure(store, mapping):
+    top = store.children["root"]
+    assert [store.text[b] for b in top[:120]] == [f"top{i}" for i in range(120)]
+    assert [store.text[b] for b in store.children[mapping[(121,)]]] == [
+        f"w.{i}" for i in range(150)
+    ]
+    d3 = mapping[(120, 0, 0, 0)]
+    assert store.text[d3] == "d3"
+    assert store.children[mapping[(120, 0, 0)]] == [d3]
+    assert len(mapping) == 120 + 4 + 151
+
+
+def test_append_block_tree_chunks_and_nests():
+    store = FakeBlockStore()
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(store), rate_limit=None)
+    mapping = client.append_block_tree("root", _document(), max_concurrency=4)
+    _assert_structure(store, mapping)
+    # 2 top-level chunks, 3 for the deep chain, 2 for the wide toggle.
+    assert store.requests == 7
+
+
+def test_input_is_not_mutated():
+    doc = _document()
+    snapshot = json.dumps(doc)
+    client = NotionClient(
+        api_key="test", transport=httpx.MockTransport(FakeBlockStore()), rate_limit=None
+    )
+    client.append_block_tree("root", doc)
+    assert json.dumps(doc) == snapshot
+
+
+def test_async_append_block_tree():
+    store = FakeBlockStore()
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test", transport=httpx.MockTransport(store), rate_limit=None
+        ) as client:
+            return await client.append_block_tree("root", _document())
+
+    _assert_structure(store, asyncio.run(main()))
+
+
+class NestingBlockStore:
+    """PATCH and GET /v1/blocks/{id}/children, enforcing the API's nesting rules."""
+
+    def __init__(self):
+        self.children: dict[str, list[str]] = {}
+        self.types: dict[str, str] = {}
+        self.text: dict[str, str] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def _create(self, parent_id, blocks, depth):
+        assert len(blocks) <= 100 and depth <= 2
+        ids = []
+        for block in blocks:
+            new_id = f"blk{next(self._ids)}"
+            body = block[block["type"]]
+            self.types[new_id] = block["type"]
+            if body.get("rich_text"):
+                self.text[new_id] = body["rich_text"][0]["text"]["content"]
+            self.children.setdefault(parent_id, []).append(new_id)
+            if block["type"] in ("column_list", "column"):
+                assert body.get("children"), f"{block['type']} created without children"
+            if body.get("children"):
+                self._create(new_id, body["children"], depth + 1)
+            ids.append(new_id)
+        return ids
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        parent_id = request.url.path.split("/")[3]
+        with self._lock:
+            if request.method == "GET":
+                results = [{"id": i} for i in self.children.get(parent_id, [])]
+                return httpx.Response(200, json={"results": results, "has_more": False})
+            ids = self._create(parent_id, json.loads(request.content)["children"], 0)
+        return httpx.Response(200, json={"object": "list", "results": [{"id": i} for i in ids]})
+
+    def texts(self, block_id):
+        return [self.text.get(b) for b in self.children.get(block_id, [])]
+
+
+def _row(i):
+    return {"type": "table_row", "table_row": {"cells": [[{"text": {"content": str(i)}}]]}}
+
+
+def _columns_document():
+    rows = [_row(i) for i in range(250)]
+    table = {"type": "table", "table": {"table_width": 1, "children": rows}}
+    column_a = {
+        "type": "column",
+        "column": {
+            "children": [_para("a0", [_para("a0.0", [_para("a0.0.0")])])]
+            + [_para(f"a{i}") for i in range(1, 130)]
+        },
+    }
+    column_b = {"type": "column", "children": [_para("b0"), dict(table), _para("b2")]}
+    return [table, {"type": "column_list", "column_list": {"children": [column_a, column_b]}}]
+
+
+def _assert_columns(store, mapping):
+    table_id, columns_id = mapping[(0,)], mapping[(1,)]
+    assert len(store.children[table_id]) == 250
+    column_a, column_b = store.children[columns_id]
+    assert store.texts(column_a) == [f"a{i}" for i in range(130)]
+    a0 = store.children[column_a][0]
+    assert store.texts(a0) == ["a0.0"]
+    assert mapping[(1, 0, 0, 0)] == store.children[a0][0]
+    assert store.texts(mapping[(1, 0, 0, 0)]) == ["a0.0.0"]
+    # The table after b0 could not be nested inline, so it follows b0.
+    assert [store.types[b] for b in store.children[column_b]] == ["toggle", "table", "toggle"]
+    assert len(store.children[store.children[column_b][1]]) == 250
+
+
+def test_tables_and_columns_are_chunked():
+    store = NestingBlockStore()
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(store), rate_limit=None)
+    _assert_columns(store, client.append_block_tree("root", _columns_document()))
+
+
+def test_async_tables_and_columns_are_chunked():
+    store = NestingBlockStore()
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test", transport=httpx.MockTransport(store), rate_limit=None
+        ) as client:
+            return await client.append_block_tree("root", _columns_document())
+
+    _assert_columns(store, asyncio.run(main()))
+
+
+def _depth(blocks):
+    nested = [block[block["type"]].get("children") or [] for block in blocks]
+    return max((1 + _depth(children) for children in nested if children), default=0)
+
+
+def test_table_leading_a_column_is_not_nested_too_deep():
+    payloads = []
+    store = NestingBlockStore()
+
+    def handler(request):
+        if request.method == "PATCH":
+            payloads.append(json.loads(request.content)["children"])
+        return store(request)
+
+    rows = [_row(i) for i in range(3)]
+    table = {"type": "table", "table": {"table_width": 1, "children": rows}}
+    column = {"type": "column", "column": {"children": [table, _para("after")]}}
+    other = {"type": "column", "column": {"children": [_para("b0")]}}
+    doc = [{"type": "column_list", "column_list": {"children": [column, other]}}]
+
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(handler), rate_limit=None)
+    mapping = client.append_block_tree("root", doc)
+
+    assert all(_depth(payload) <= 2 for payload in payloads)
+    column_a = store.children[store.children[mapping[(0,)]][0]]
+    assert [store.types[b] for b in column_a] == ["table", "toggle"]
+    assert len(store.children[column_a[0]]) == 3
@@ -0,0 +1,69 @@
+"""Tests for AsyncNotionClient against a local httpx.MockTransport stand-in."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from notion_sdk import AsyncNotionClient
+
+from conftest import FakeNotion
+
+
+class FakeApi(FakeNotion):
+    def respond(self, request, body):
+        path = request.url.path
+        if request.method == "GET" and path == "/v1/pages/p1":
+            return httpx.Response(200, json={"object": "page", "id": "p1"})
+        if request.method == "GET" and path == "/v1/databases/db1":
+            return httpx.Response(
+                200, json={"object": "database", "id": "db1", "data_sources": [{"id": "ds1"}]}
+            )
+        if request.method == "POST" and path == "/v1/data_sources/ds1/query":
+            return httpx.Response(
+                200, json={"object": "list", "results": [{"id": "row1"}], "echo": body}
+            )
+        if request.method == "PATCH" and path == "/v1/blocks/b1/children":
+            return httpx.Response(200, json={"object": "list", "results": body["children"]})
+        return httpx.Response(404, json={"object": "error", "code": "object_not_found"})
+
+
+def test_mixin_methods_are_awaitable(mock_client):
+    async def main():
+        async with mock_client(FakeApi(), client_class=AsyncNotionClient) as client:
+            page = await client.get_page("p1")
+            appended = await client.append_block_children("b1", children=[{"type": "divider"}])
+        return page, appended
+
+    page, appended = asyncio.run(main())
+    assert page["id"] == "p1"
+    assert appended["results"] == [{"type": "divider"}]
+
+
+def test_query_database_resolves_data_source(mock_client):
+    async def main():
+        async with mock_client(FakeApi(), client_class=AsyncNotionClient) as client:
+            return await client.query_database("db1", page_size=5)
+
+    result = asyncio.run(main())
+    assert result["results"] == [{"id": "row1"}]
+    assert result["echo"] == {"page_size": 5}
+
+
+def test_concurrent_requests(mock_client):
+    async def main():
+        async with mock_client(FakeApi(), client_class=AsyncNotionClient) as client:
+            return await asyncio.gather(*(client.get_page("p1") for _ in range(20)))
+
+    pages = asyncio.run(main())
+    assert len(pages) == 20
+
+
+def test_http_errors_raise(mock_client):
+    async def main():
+        async with mock_client(FakeApi(), client_class=AsyncNotionClient) as client:
+            await client.get_page("missing")
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        asyncio.run(main())
+    assert exc_info.value.response.status_code == 404
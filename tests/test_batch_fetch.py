@@ -0,0 +1,76 @@
+"""Tests for get_pages / get_blocks / get_data_sources batch fetches."""
+
+import asyncio
+import time
+
+import httpx
+
+from notion_sdk import AsyncNotionClient
+from notion_sdk.cache import MemoryBackend, ResponseCache
+
+from conftest import FakeNotion, notion_error
+
+
+class FakeObjects(FakeNotion):
+    def __init__(self, slow=()):
+        super().__init__()
+        self.calls = []
+        self.slow = set(slow)
+
+    def respond(self, request, body):
+        _, _, kind, object_id = request.url.path.split("/")
+        with self.lock:
+            self.calls.append(object_id)
+        if object_id in self.slow:
+            time.sleep(0.1)
+        if object_id.startswith("missing"):
+            return notion_error(404)
+        return httpx.Response(200, json={"object": kind.rstrip("s"), "id": object_id})
+
+
+def test_results_in_input_order_with_duplicates_and_errors(mock_client):
+    fake = FakeObjects(slow={"a"})
+    client = mock_client(fake)
+    ids = ["a", "b", "missing-1", "b", "c"]
+    results = list(client.get_pages(ids, max_concurrency=4))
+
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert [r.item for r in results] == ids
+    assert [r.ok for r in results] == [True, True, False, True, True]
+    assert results[2].error.response.status_code == 404
+    assert results[3].result == {"object": "page", "id": "b"}
+    assert sorted(fake.calls) == ["a", "b", "c", "missing-1"]
+
+
+def test_unordered_streams_in_completion_order(mock_client):
+    fake = FakeObjects(slow={"a"})
+    client = mock_client(fake)
+    results = list(client.get_blocks(["a", "b", "c"], max_concurrency=3, ordered=False))
+    assert results[-1].item == "a"
+    assert {r.result["object"] for r in results} == {"block"}
+
+
+def test_cached_entries_are_reused(mock_client):
+    fake = FakeObjects()
+    client = mock_client(fake, response_cache=ResponseCache(MemoryBackend()))
+    client.get_data_source("ds1")
+    results = list(client.get_data_sources(["ds1", "ds2"]))
+    assert [r.result["id"] for r in results] == ["ds1", "ds2"]
+    assert fake.calls == ["ds1", "ds2"]
+
+
+def test_async_get_pages(mock_client):
+    fake = FakeObjects()
+
+    async def main():
+        async with mock_client(fake, client_class=AsyncNotionClient) as client:
+            return [r async for r in client.get_pages(["x", "y", "x", "missing-2"])]
+
+    results = asyncio.run(main())
+    assert [(r.index, r.item, r.ok) for r in results] == [
+        (0, "x", True),
+        (1, "y", True),
+        (2, "x", True),
+        (3, "missing-2", False),
+    ]
+    assert sorted(fake.calls) == ["missing-2", "x", "y"]
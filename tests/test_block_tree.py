@@ -0,0 +1,99 @@
+"""Tests for the concurrent block-tree fetcher (no network required)."""
+
+import asyncio
+import threading
+
+import httpx
+
+from notion_sdk import AsyncNotionClient, NotionClient
+
+# root -> a (toggle, 3 children), b, c (toggle -> c0 (toggle -> c00))
+TREE = {
+    "root": ["a", "b", "c"],
+    "a": ["a0", "a1", "a2"],
+    "c": ["c0"],
+    "c0": ["c00"],
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    block_id = request.url.path.split("/")[3]
+    start = int(request.url.params.get("start_cursor") or 0)
+    kids = TREE.get(block_id, [])
+    # Two children per page to exercise pagination at each level.
+    page = kids[start : start + 2]
+    more = start + 2 < len(kids)
+    return httpx.Response(
+        200,
+        json={
+            "object": "list",
+            "results": [{"id": k, "has_children": k in TREE} for k in page],
+            "has_more": more,
+            "next_cursor": str(start + 2) if more else None,
+        },
+    )
+
+
+def _ids(tree):
+    return [(b["id"], _ids(b["children"])) if "children" in b else b["id"] for b in tree]
+
+
+def test_fetch_block_tree_nests_children_in_order():
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(_handler), rate_limit=None)
+    tree = client.fetch_block_tree("root", max_concurrency=3)
+    assert _ids(tree) == [("a", ["a0", "a1", "a2"]), "b", ("c", [("c0", ["c00"])])]
+
+
+def test_max_depth_stops_expansion():
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(_handler), rate_limit=None)
+    events = list(client.iter_block_tree("root", max_depth=2))
+    assert {block["id"] for _, block in events} == {"a", "b", "c", "a0", "a1", "a2", "c0"}
+
+
+def test_fetch_block_tree_marks_only_expanded_blocks():
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(_handler), rate_limit=None)
+    tree = client.fetch_block_tree("root", max_depth=1)
+    assert _ids(tree) == ["a", "b", "c"]
+    assert tree[0]["has_children"] and "children" not in tree[0]
+
+    tree = client.fetch_block_tree("root", max_depth=2)
+    assert _ids(tree) == [("a", ["a0", "a1", "a2"]), "b", ("c", ["c0"])]
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test", transport=httpx.MockTransport(_handler), rate_limit=None
+        ) as client:
+            return await client.fetch_block_tree("root", max_depth=2)
+
+    assert _ids(asyncio.run(main())) == [("a", ["a0", "a1", "a2"]), "b", ("c", ["c0"])]
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            threading.Event().wait(0.01)
+            return _handler(request)
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(handler), rate_limit=None)
+    client.fetch_block_tree("root", max_concurrency=2)
+    assert state["peak"] <= 2
+
+
+def test_async_fetch_block_tree():
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test", transport=httpx.MockTransport(_handler), rate_limit=None
+        ) as client:
+            return await client.fetch_block_tree("root", max_concurrency=3)
+
+    tree = asyncio.run(main())
+    assert _ids(tree) == [("a", ["a0", "a1", "a2"]), "b", ("c", [("c0", ["c00"])])]
@@ -0,0 +1,117 @@
+"""Tests for bulk page creation/update (no network required)."""
+
+import asyncio
+import json
+
+import httpx
+
+from notion_sdk import AsyncNotionClient, NotionClient
+from notion_sdk.bulk import bulk_map
+from notion_sdk.ratelimit import RetryPolicy
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def _handler(seen: dict):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        name = body["properties"]["Name"]["title"][0]["text"]["content"]
+        seen[name] = seen.get(name, 0) + 1
+        if name == "bad":
+            return httpx.Response(400, json={"code": "validation_error"})
+        if name == "flaky" and seen[name] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={})
+        if name == "lost":
+            return httpx.Response(502, json={})
+        return httpx.Response(200, json={"object": "page", "id": f"id-{name}"})
+
+    return handler
+
+
+def _rows(names):
+    for name in names:
+        yield {
+            "parent": {"data_source_id": "ds1"},
+            "properties": {"Name": {"title": [{"text": {"content": name}}]}},
+        }
+
+
+def test_bulk_create_pages_separates_failures_and_retries_throttled():
+    seen = {}
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(_handler(seen)),
+        rate_limit=None,
+        retry_policy=NO_RETRY,
+    )
+    names = [f"row{i}" for i in range(20)] + ["bad", "flaky", "lost"]
+    results = list(client.bulk_create_pages(_rows(names), max_concurrency=4))
+    assert sorted(r.index for r in results) == list(range(len(names)))
+    failures = [r for r in results if not r.ok]
+    assert sorted(f.index for f in failures) == [20, 22]
+    assert seen["bad"] == 1
+    # A 502 create may have been applied, so it is not sent again.
+    assert seen["lost"] == 1
+    flaky = next(r for r in results if r.index == 21)
+    assert flaky.ok and flaky.attempts == 2 and flaky.result["id"] == "id-flaky"
+
+
+def test_bulk_update_pages_uses_page_id():
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(handler), rate_limit=None)
+    updates = ({"page_id": f"p{i}", "properties": {}} for i in range(5))
+    assert all(r.ok for r in client.bulk_update_pages(updates))
+    assert sorted(paths) == [f"/v1/pages/p{i}" for i in range(5)]
+
+
+def test_input_is_read_lazily():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = bulk_map(lambda x: x * 2, items(), max_concurrency=2)
+    next(results)
+    assert len(consumed) <= 5
+    results.close()
+
+
+def test_layers_do_not_stack_retries_for_reads():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(500, json={})
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        retry_policy=RetryPolicy(max_retries=3, backoff_base=0.001),
+    )
+    [result] = client.get_pages(["p1"])
+    assert not result.ok and result.attempts == 1
+    assert len(calls) == 4  # the client's retries only
+
+
+def test_async_bulk_create_pages():
+    seen = {}
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test",
+            transport=httpx.MockTransport(_handler(seen)),
+            rate_limit=None,
+            retry_policy=NO_RETRY,
+        ) as client:
+            return [r async for r in client.bulk_create_pages(_rows(["a", "bad", "flaky"]))]
+
+    results = asyncio.run(main())
+    assert {r.index: r.ok for r in results} == {0: True, 1: False, 2: True}
@@ -0,0 +1,174 @@
+"""Tests for TTLCache, the database → data source resolution and the response cache."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from notion_sdk import AsyncNotionClient
+from notion_sdk.cache import CacheEntry, MemoryBackend, ResponseCache, SQLiteBackend, TTLCache
+
+from conftest import FakeNotion
+
+
+def test_ttl_cache_lru_and_expiry():
+    cache = TTLCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    cache.set("d", 4, ttl=10)
+    assert cache.pop("d") == 4
+    assert len(cache) <= 2
+
+
+class FakeDatabases(FakeNotion):
+    def respond(self, request, body):
+        if request.url.path.startswith("/v1/databases/"):
+            db_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"id": db_id, "data_sources": [{"id": f"ds-{db_id}"}]})
+        return httpx.Response(200, json={"object": "list", "results": [], "has_more": False})
+
+
+def test_query_database_resolves_once(mock_client):
+    fake = FakeDatabases()
+    client = mock_client(fake)
+    client.query_database("db1")
+    client.query_database("db1", start_cursor="next")
+    assert fake.paths() == [
+        ("GET", "/v1/databases/db1"),
+        ("POST", "/v1/data_sources/ds-db1/query"),
+        ("POST", "/v1/data_sources/ds-db1/query"),
+    ]
+
+
+def test_update_and_archive_invalidate(mock_client):
+    client = mock_client(FakeDatabases())
+    assert client.warm_data_source_cache(["db1", "db2"]) == {"db1": "ds-db1", "db2": "ds-db2"}
+    client.update_database("db1", title=[])
+    client.archive_database("db2")
+    assert "db1" not in client.data_source_cache
+    assert "db2" not in client.data_source_cache
+
+
+def test_resolution_during_update_is_not_kept(mock_client):
+    client = None
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            # Another thread resolves the database while the update is in flight.
+            client.data_source_cache.set("db1", "ds-before-update")
+        return httpx.Response(200, json={"id": "db1", "data_sources": [{"id": "ds-db1"}]})
+
+    client = mock_client(handler)
+    client.update_database("db1", title=[])
+    assert "db1" not in client.data_source_cache
+
+    client = mock_client(handler, client_class=AsyncNotionClient)
+    asyncio.run(client.archive_database("db1"))
+    assert "db1" not in client.data_source_cache
+
+
+# ---- response cache ---------------------------------------------------------
+
+
+class FakeWorkspace(FakeNotion):
+    def __init__(self):
+        super().__init__()
+        self.edited = {"p1": "2025-01-01T00:00:00.000Z"}
+
+    def respond(self, request, body):
+        parts = request.url.path.split("/")
+        if request.url.path == "/v1/data_sources/ds1/query":
+            page = {"object": "page", "id": "p1", "last_edited_time": "2025-06-01T00:00:00.000Z"}
+            return httpx.Response(200, json={"object": "list", "results": [page]})
+        if request.url.path.endswith("/move"):
+            return httpx.Response(
+                200, json={"object": "page", "id": parts[3], "parent": {"page_id": "p2"}}
+            )
+        if request.method == "DELETE":
+            return httpx.Response(
+                200, json={"object": "block", "id": parts[3], "parent": {"page_id": "p1"}}
+            )
+        obj = {"object": parts[2][:-1], "id": parts[3], "last_edited_time": self.edited["p1"]}
+        return httpx.Response(200, json=obj)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cached_client(request, tmp_path, mock_client):
+    backend = MemoryBackend() if request.param == "memory" else SQLiteBackend(tmp_path / "c.db")
+    fake = FakeWorkspace()
+    cache = ResponseCache(backend, ttl=60, ttls={"users": 0})
+    return mock_client(fake, response_cache=cache), fake
+
+
+def test_reads_are_cached_and_writes_invalidate(cached_client):
+    client, fake = cached_client
+    client.get_page("p1")
+    client.get_page("p1")
+    client.get_block("p1")
+    assert fake.paths().count(("GET", "/v1/pages/p1")) == 1
+    client.update_page("p1", properties={})
+    client.get_page("p1")
+    client.get_block("p1")
+    assert fake.paths().count(("GET", "/v1/pages/p1")) == 2
+    assert fake.paths().count(("GET", "/v1/blocks/p1")) == 2
+    assert client.response_cache.hits == 1
+
+
+def test_per_resource_ttl_zero_disables_caching(cached_client):
+    client, fake = cached_client
+    client.get_self()
+    client.get_self()
+    assert fake.paths().count(("GET", "/v1/users/me")) == 2
+
+
+def test_newer_last_edited_time_evicts(cached_client):
+    client, fake = cached_client
+    client.get_page("p1")
+    client.query_data_source("ds1")
+    client.get_page("p1")
+    assert fake.paths().count(("GET", "/v1/pages/p1")) == 2
+
+
+def test_delete_invalidates_parent_children(cached_client):
+    client, fake = cached_client
+    client.get_block_children("p1")
+    client.delete_block("b1")
+    client.get_block_children("p1")
+    assert fake.paths().count(("GET", "/v1/blocks/p1/children")) == 2
+
+
+def test_id_spellings_share_cache_entries(cached_client):
+    client, fake = cached_client
+    bare = "0123456789abcdef0123456789abcdef"
+    dashed = "01234567-89AB-CDEF-0123-456789ABCDEF"
+    client.get_page(bare)
+    client.get_page(dashed)
+    assert len([c for c in fake.paths() if c[0] == "GET"]) == 1
+    client.update_page(dashed, properties={})
+    client.get_page(bare)
+    assert len([c for c in fake.paths() if c[0] == "GET"]) == 2
+
+
+@pytest.mark.parametrize("page_cached", [True, False])
+def test_move_invalidates_old_and_new_parent_children(cached_client, page_cached):
+    client, fake = cached_client
+    client.get_block_children("p1")
+    client.get_block_children("p2")
+    if page_cached:
+        # The cached page shows p1 as its parent.
+        client.response_cache.backend.set(
+            "/pages/c1",
+            CacheEntry(b'{"object": "page", "id": "c1", "parent": {"page_id": "p1"}}', 2e9),
+        )
+    client.move_page("c1", parent={"type": "page_id", "page_id": "p2"})
+    client.get_block_children("p1")
+    client.get_block_children("p2")
+    assert fake.paths().count(("GET", "/v1/blocks/p1/children")) == 2
+    assert fake.paths().count(("GET", "/v1/blocks/p2/children")) == 2
@@ -0,0 +1,109 @@
+"""Tests for JSON codecs and incremental list decoding."""
+
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+
+from notion_sdk import AsyncNotionClient, NotionClient
+from notion_sdk.codec import ListStreamDecoder, StdlibCodec, get_codec
+
+DOC = {
+    "object": "list",
+    "results": [
+        {"id": str(i), "text": 'tricky ,]}[{: "quoted" \\ ' * i, "nested": [1, {"a": []}]}
+        for i in range(30)
+    ],
+    "next_cursor": None,
+    "has_more": False,
+}
+
+
+def test_get_codec():
+    assert isinstance(get_codec("json"), StdlibCodec)
+    assert get_codec().loads(get_codec().dumps({"a": "é"})) == {"a": "é"}
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_list_stream_decoder_handles_any_chunking(indent):
+    data = json.dumps(DOC, indent=indent).encode()
+    rng = random.Random(0)
+    for _ in range(50):
+        decoder = ListStreamDecoder()
+        items, i = [], 0
+        while i < len(data):
+            n = rng.randint(1, 64)
+            items += decoder.feed(data[i : i + n])
+            i += n
+        assert items == DOC["results"]
+        assert decoder.rest == {"object": "list", "next_cursor": None, "has_more": False}
+
+
+def _streaming_handler(produced: list, asynchronous: bool = False):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        start = int(body.get("start_cursor") or 0)
+        rows = [{"id": str(i)} for i in range(start, start + 3)]
+        more = start < 3
+
+        def chunks():
+            yield b'{"object":"list","results":['
+            for n, row in enumerate(rows):
+                produced.append(row["id"])
+                yield json.dumps(row).encode() + (b"," if n < len(rows) - 1 else b"]")
+            tail = {"has_more": more, "next_cursor": str(start + 3) if more else None}
+            yield b"," + json.dumps(tail).encode()[1:]
+
+        async def achunks():
+            for chunk in chunks():
+                yield chunk
+
+        return httpx.Response(200, content=achunks() if asynchronous else chunks())
+
+    return handler
+
+
+def test_iter_query_data_source_stream_yields_rows_before_body_ends():
+    produced = []
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(_streaming_handler(produced)),
+        rate_limit=None,
+        codec="json",
+    )
+    rows = client.iter_query_data_source("ds1", stream=True)
+    assert next(rows)["id"] == "0"
+    assert produced == ["0"]
+    assert [r["id"] for r in rows] == ["1", "2", "3", "4", "5"]
+
+
+def test_request_bodies_use_codec():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.content)
+        return httpx.Response(200, json={})
+
+    client = NotionClient(
+        api_key="test", transport=httpx.MockTransport(handler), rate_limit=None, codec="json"
+    )
+    client.search(query="naïve")
+    assert seen == ['{"query":"naïve"}'.encode()]
+
+
+def test_async_stream():
+    produced = []
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test",
+            transport=httpx.MockTransport(_streaming_handler(produced, asynchronous=True)),
+            rate_limit=None,
+        ) as client:
+            return [r["id"] async for r in client.iter_query_data_source("ds1", stream=True)]
+
+    assert asyncio.run(main()) == ["0", "1", "2", "3", "4", "5"]
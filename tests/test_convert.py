@@ -0,0 +1,171 @@
+"""Tests for markdown parsing and streaming markdown/HTML rendering."""
+
+from notion_sdk.convert import (
+    MAX_TEXT_LENGTH,
+    iter_markdown_blocks,
+    markdown_to_blocks,
+    parse_inline,
+    render_html,
+    render_markdown,
+)
+from notion_sdk.models import plain_text
+
+DOC = """# Title
+
+Some **bold *nested* text** and `code` with [a link](https://example.com) and \\*stars\\*.
+wrapped line
+
+- a
+- b
+  - b1
+    1. deep
+    lazy continuation
+- [x] done
+1. one
+2. two
+
+> quoted
+> text
+
+```py
+print(1)
+
+print(2)
+```
+
+---
+
+| h1 | h2 |
+|----|----|
+| a | b |
+"""
+
+
+def _types(blocks):
+    return [b["type"] for b in blocks]
+
+
+def test_markdown_to_blocks():
+    blocks = markdown_to_blocks(DOC)
+    assert _types(blocks) == [
+        "heading_1",
+        "paragraph",
+        "bulleted_list_item",
+        "bulleted_list_item",
+        "to_do",
+        "numbered_list_item",
+        "numbered_list_item",
+        "quote",
+        "code",
+        "divider",
+        "table",
+    ]
+    para = blocks[1]["paragraph"]["rich_text"]
+    assert plain_text(para).endswith("*stars*. wrapped line")
+    styled = {item["text"]["content"]: item.get("annotations", {}) for item in para}
+    assert styled["bold "] == styled[" text"] == {"bold": True}
+    assert styled["nested"] == {"bold": True, "italic": True}
+    assert styled["code"] == {"code": True}
+    assert [i["text"].get("link") for i in para if i["text"]["content"] == "a link"] == [
+        {"url": "https://example.com"}
+    ]
+
+    b1 = blocks[3]["bulleted_list_item"]["children"][0]
+    deep = b1["bulleted_list_item"]["children"][0]
+    assert deep["type"] == "numbered_list_item"
+    assert plain_text(deep["numbered_list_item"]["rich_text"]) == "deep lazy continuation"
+    assert blocks[4]["to_do"]["checked"] is True
+    assert plain_text(blocks[7]["quote"]["rich_text"]) == "quoted text"
+    assert blocks[8]["code"]["language"] == "python"
+    assert plain_text(blocks[8]["code"]["rich_text"]) == "print(1)\n\nprint(2)"
+    table = blocks[10]["table"]
+    assert table["table_width"] == 2 and table["has_column_header"]
+    assert len(table["children"]) == 2
+
+
+def test_parsing_streams_completed_blocks():
+    consumed = []
+
+    def lines():
+        for line in ["# One", "", "para", "", "# Two", "more"]:
+            consumed.append(line)
+            yield line
+
+    stream = iter_markdown_blocks(lines())
+    assert next(stream)["type"] == "heading_1"
+    assert len(consumed) < 6
+    assert _types(stream) == ["paragraph", "heading_1", "paragraph"]
+
+
+def test_long_list_item_continuation_is_merged_once():
+    text = "- item\n" + "  more *text* here\n" * 2000
+    (item,) = markdown_to_blocks(text)
+    runs = item["bulleted_list_item"]["rich_text"]
+    assert plain_text(runs) == "item" + " more text here" * 2000
+    assert len(runs) == 2 * 2000 + 1
+
+
+def test_long_text_is_split():
+    items = parse_inline("x" * (MAX_TEXT_LENGTH + 5))
+    assert [len(i["text"]["content"]) for i in items] == [MAX_TEXT_LENGTH, 5]
+
+
+def test_markdown_round_trip():
+    blocks = markdown_to_blocks(DOC)
+    rendered = "".join(render_markdown(blocks))
+    assert markdown_to_blocks(rendered) == blocks
+    assert "- b\n  - b1\n    1. deep lazy continuation\n- [x] done\n1. one\n2. two\n" in rendered
+
+
+def test_render_fetches_children_lazily_in_document_order():
+    tree = {
+        "root": [("p1", "paragraph", False), ("t", "toggle", True), ("p2", "paragraph", False)],
+        "t": [("c1", "bulleted_list_item", True), ("c2", "bulleted_list_item", False)],
+        "c1": [("g", "paragraph", False)],
+    }
+    fetched = []
+
+    def children(block_id):
+        fetched.append(block_id)
+        for bid, kind, has_children in tree[block_id]:
+            yield {
+                "id": bid,
+                "type": kind,
+                "has_children": has_children,
+                kind: {"rich_text": [{"plain_text": bid}]},
+            }
+
+    out = render_markdown(children("root"), children=children)
+    assert next(out) == "p1\n"
+    assert fetched == ["root"]
+    assert "".join(out) == "\n- t\n  - c1\n    g\n  - c2\n\np2\n"
+    assert fetched == ["root", "t", "c1"]
+
+
+def test_render_html():
+    html = "".join(render_html(markdown_to_blocks(DOC)))
+    assert html.startswith("<h1>Title</h1>\n<p>Some <strong>bold </strong><em><strong>nested</strong></em>")
+    assert '<a href="https://example.com">a link</a>' in html
+    assert "<ul>\n<li>a</li>\n<li>b<ul>\n<li>b1<ol>\n<li>deep lazy continuation</li>\n</ol>\n" in html
+    assert '<li><input type="checkbox" disabled checked> done</li>\n</ul>\n<ol>\n' in html
+    assert '<pre><code class="language-python">print(1)\n\nprint(2)</code></pre>' in html
+    assert "<tr><th>h1</th><th>h2</th></tr>" in html
+    assert "".join(render_html([{"type": "paragraph", "paragraph": {
+        "rich_text": [{"plain_text": "<b>"}]}}])) == "<p>&lt;b&gt;</p>\n"
+
+
+def test_render_html_only_links_safe_schemes():
+    links = [("ok", "https://x.io"), ("mail", "mailto:a@b.c"), ("rel", "/p/1"),
+             ("bad", "java\tscript:alert(1)")]
+    rich_text = [{"plain_text": text, "href": url} for text, url in links]
+    html = "".join(render_html([{"type": "paragraph", "paragraph": {"rich_text": rich_text}}]))
+    assert html == (
+        '<p><a href="https://x.io">ok</a><a href="mailto:a@b.c">mail</a>'
+        '<a href="/p/1">rel</a>bad</p>\n'
+    )
+    blocks = [
+        {"type": "image", "image": {"type": "external", "external": {"url": "data:text/html,x"}}},
+        {"type": "bookmark", "bookmark": {"url": "javascript:alert(1)"}},
+    ]
+    html = "".join(render_html(blocks))
+    assert html == "<p>data:text/html,x</p>\n<p>javascript:alert(1)</p>\n"
@@ -0,0 +1,148 @@
+"""Tests for the local filter/sort evaluator."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from notion_sdk.filters import compile_filter, compile_sorts, query_rows
+
+
+def _page(pid, created, **props):
+    properties = {}
+    for name, (kind, value) in props.items():
+        properties[name] = {"type": kind, kind: value}
+    return {"id": pid, "created_time": created, "last_edited_time": created, "properties": properties}
+
+
+ROWS = [
+    _page(
+        "a",
+        "2025-06-01T10:00:00.000Z",
+        Name=("title", [{"plain_text": "Alpha task"}]),
+        Points=("number", 3),
+        Done=("checkbox", True),
+        Status=("status", {"name": "Done"}),
+        Tags=("multi_select", [{"name": "x"}, {"name": "y"}]),
+        Due=("date", {"start": "2025-06-03"}),
+        Rel=("relation", [{"id": "r1"}]),
+    ),
+    _page(
+        "b",
+        "2025-06-02T10:00:00.000Z",
+        Name=("title", [{"plain_text": "beta"}]),
+        Points=("number", None),
+        Done=("checkbox", False),
+        Status=("status", None),
+        Tags=("multi_select", [{"name": "y"}]),
+        Due=("date", {"start": "2025-06-01T23:30:00.000Z"}),
+        Rel=("relation", []),
+    ),
+    _page(
+        "c",
+        "2025-06-03T10:00:00.000Z",
+        Name=("title", [{"plain_text": "Gamma TASK"}]),
+        Points=("number", 1),
+        Done=("checkbox", False),
+        Status=("status", {"name": "Todo"}),
+        Tags=("multi_select", []),
+        Due=("date", None),
+        Rel=("relation", [{"id": "r1"}, {"id": "r2"}]),
+    ),
+]
+
+
+def _ids(filter=None, sorts=None):
+    return [r["id"] for r in query_rows(ROWS, filter, sorts)]
+
+
+@pytest.mark.parametrize(
+    "filter,expected",
+    [
+        ({"property": "Name", "title": {"contains": "task"}}, ["a", "c"]),
+        ({"property": "Name", "title": {"starts_with": "BETA"}}, ["b"]),
+        ({"property": "Name", "title": {"equals": "beta"}}, ["b"]),
+        ({"property": "Points", "number": {"greater_than": 1}}, ["a"]),
+        ({"property": "Points", "number": {"does_not_equal": 3}}, ["b", "c"]),
+        ({"property": "Points", "number": {"is_empty": True}}, ["b"]),
+        ({"property": "Done", "checkbox": {"equals": True}}, ["a"]),
+        ({"property": "Status", "status": {"equals": "Todo"}}, ["c"]),
+        ({"property": "Status", "status": {"is_not_empty": True}}, ["a", "c"]),
+        ({"property": "Tags", "multi_select": {"contains": "y"}}, ["a", "b"]),
+        ({"property": "Tags", "multi_select": {"does_not_contain": "x"}}, ["b", "c"]),
+        ({"property": "Tags", "multi_select": {"is_empty": True}}, ["c"]),
+        ({"property": "Rel", "relation": {"contains": "r2"}}, ["c"]),
+        ({"property": "Due", "date": {"equals": "2025-06-01"}}, ["b"]),
+        ({"property": "Due", "date": {"on_or_after": "2025-06-02"}}, ["a"]),
+        ({"property": "Due", "date": {"before": "2025-06-02T00:00:00Z"}}, ["b"]),
+        ({"timestamp": "created_time", "created_time": {"after": "2025-06-01"}}, ["b", "c"]),
+        (
+            {
+                "or": [
+                    {"property": "Status", "status": {"equals": "Done"}},
+                    {
+                        "and": [
+                            {"property": "Done", "checkbox": {"equals": False}},
+                            {"property": "Points", "number": {"less_than_or_equal_to": 1}},
+                        ]
+                    },
+                ]
+            },
+            ["a", "c"],
+        ),
+    ],
+)
+def test_conditions(filter, expected):
+    assert _ids(filter) == expected
+
+
+def test_formula_and_rollup():
+    row = {
+        "id": "f",
+        "properties": {
+            "F": {"type": "formula", "formula": {"type": "number", "number": 7}},
+            "R": {
+                "type": "rollup",
+                "rollup": {
+                    "type": "array",
+                    "array": [
+                        {"type": "number", "number": 2},
+                        {"type": "number", "number": 5},
+                    ],
+                },
+            },
+        },
+    }
+    match = lambda f: compile_filter(f)(row)  # noqa: E731
+    assert match({"property": "F", "formula": {"number": {"equals": 7}}})
+    assert match({"property": "R", "rollup": {"any": {"number": {"greater_than": 4}}}})
+    assert not match({"property": "R", "rollup": {"every": {"number": {"greater_than": 4}}}})
+    assert match({"property": "R", "rollup": {"none": {"number": {"greater_than": 9}}}})
+
+
+def test_relative_dates():
+    now = datetime.now(timezone.utc)
+    row = _page("r", (now - timedelta(days=3)).isoformat())
+    assert compile_filter({"timestamp": "created_time", "created_time": {"past_week": {}}})(row)
+    assert not compile_filter({"timestamp": "created_time", "created_time": {"next_week": {}}})(row)
+
+
+def test_unknown_conditions_raise():
+    with pytest.raises(ValueError):
+        compile_filter({"property": "Points", "number": {"approximately": 3}})
+    with pytest.raises(ValueError):
+        compile_filter({"property": "X", "mystery": {"equals": 1}})
+
+
+def test_sorts_put_empty_values_last_and_chain():
+    assert _ids(sorts=[{"property": "Points", "direction": "ascending"}]) == ["c", "a", "b"]
+    assert _ids(sorts=[{"property": "Points", "direction": "descending"}]) == ["a", "c", "b"]
+    assert _ids(sorts=[{"property": "Due", "direction": "ascending"}]) == ["b", "a", "c"]
+    assert _ids(sorts=[{"property": "Name", "direction": "ascending"}]) == ["a", "b", "c"]
+    assert _ids(sorts=[{"timestamp": "created_time", "direction": "descending"}]) == ["c", "b", "a"]
+    order = compile_sorts(
+        [
+            {"property": "Done", "direction": "ascending"},
+            {"property": "Points", "direction": "descending"},
+        ]
+    )
+    assert [r["id"] for r in order(ROWS)] == ["c", "b", "a"]
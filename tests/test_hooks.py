@@ -0,0 +1,87 @@
+"""Tests for request instrumentation hooks and the metrics collector."""
+
+import asyncio
+
+import httpx
+
+from notion_sdk import AsyncNotionClient, NotionClient
+from notion_sdk.hooks import MetricsCollector, endpoint_template
+from notion_sdk.ratelimit import RetryPolicy
+
+
+def _handler():
+    state = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["n"] += 1
+        if request.url.path.endswith("/children") and state["n"] == 1:
+            return httpx.Response(500, json={})
+        return httpx.Response(200, json={"object": "list", "results": [{"id": "x" * 40}]})
+
+    return handler
+
+
+def test_endpoint_template():
+    assert endpoint_template("/pages/abc") == "/pages/{id}"
+    assert endpoint_template("/blocks/abc/children") == "/blocks/{id}/children"
+    assert endpoint_template("/users/me") == "/users/me"
+    assert endpoint_template("/search") == "/search"
+
+
+def test_events_and_summary():
+    events = []
+    metrics = MetricsCollector()
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(_handler()),
+        rate_limit=None,
+        retry_policy=RetryPolicy(backoff_base=0.001),
+        hooks=[events.append, metrics],
+    )
+    client.get_block_children("b1")
+    client.search(query="hello")
+    client.get_page("p1")
+
+    assert [(e.method, e.endpoint, e.status, e.attempt) for e in events] == [
+        ("GET", "/blocks/{id}/children", 500, 0),
+        ("GET", "/blocks/{id}/children", 200, 1),
+        ("POST", "/search", 200, 0),
+        ("GET", "/pages/{id}", 200, 0),
+    ]
+    assert events[2].request_bytes == len(b'{"query":"hello"}')
+    assert all(e.response_bytes > 40 and e.total > 0 for e in events[1:])
+
+    summary = metrics.summary()
+    children = summary["GET /blocks/{id}/children"]
+    assert children["requests"] == 2 and children["retries"] == 1 and children["errors"] == 1
+    assert children["statuses"] == {500: 1, 200: 1}
+    assert summary["POST /search"]["p50"] is not None
+
+
+def test_failing_hook_does_not_break_requests():
+    def broken(event):
+        raise RuntimeError("boom")
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(_handler()),
+        rate_limit=None,
+        hooks=[broken],
+    )
+    assert client.get_page("p1")["object"] == "list"
+
+
+def test_async_client_emits_events():
+    metrics = MetricsCollector()
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test",
+            transport=httpx.MockTransport(_handler()),
+            rate_limit=None,
+            hooks=[metrics],
+        ) as client:
+            await client.get_page("p1")
+
+    asyncio.run(main())
+    assert metrics.summary()["GET /pages/{id}"]["requests"] == 1
@@ -0,0 +1,138 @@
+"""Tests for resumable jobs (checkpointed pagination and idempotent writes)."""
+
+import httpx
+import pytest
+
+from notion_sdk.jobs import Job, UncertainWrite
+from notion_sdk.ratelimit import RetryPolicy
+from notion_sdk.stores import JSONFileStore, SQLiteStore
+
+from conftest import FakeNotion, notion_error
+
+
+class FakeApi(FakeNotion):
+    def __init__(self, rows=7, page_size=3):
+        super().__init__()
+        self.rows = [f"r{i}" for i in range(rows)]
+        self.page_size = page_size
+        self.cursors = []
+        self.created = []
+        self.posts = []
+        self.fail_status = {}
+        self.unreachable = set()
+
+    def respond(self, request, body):
+        if request.url.path == "/v1/pages":
+            name = body["properties"]["Name"]
+            if name in self.unreachable:
+                self.unreachable.discard(name)
+                raise httpx.ConnectError("connection refused", request=request)
+            self.posts.append(name)
+            status = self.fail_status.pop(name, None)
+            if status:
+                return notion_error(status)
+            self.created.append(name)
+            return httpx.Response(200, json={"object": "page", "id": f"page-{name}"})
+        start = int(body.get("start_cursor") or 0)
+        self.cursors.append(body.get("start_cursor"))
+        end = start + self.page_size
+        more = end < len(self.rows)
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"id": r} for r in self.rows[start:end]],
+                "has_more": more,
+                "next_cursor": str(end) if more else None,
+            },
+        )
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return JSONFileStore(tmp_path / "job.json")
+    return SQLiteStore(tmp_path / "job.db")
+
+
+def test_paginate_resumes_mid_page_after_stop(store, mock_client):
+    fake = FakeApi()
+    client = mock_client(fake)
+    seen = []
+    for row in Job(store, "export").paginate(client.query_data_source, "ds"):
+        if row["id"] == "r4":
+            break  # stopped while processing r4
+        seen.append(row["id"])
+
+    for row in Job(store, "export").paginate(client.query_data_source, "ds"):
+        seen.append(row["id"])
+
+    assert seen == [f"r{i}" for i in range(7)]
+    assert fake.cursors == [None, "3", "3", "6"]
+    assert Job(store, "export").finished()
+    assert list(Job(store, "export").paginate(client.query_data_source, "ds")) == []
+
+
+def test_paginate_replays_current_page_after_crash(store, mock_client):
+    fake = FakeApi()
+    client = mock_client(fake)
+    rows = Job(store, "export").paginate(client.query_data_source, "ds")
+    assert [next(rows)["id"] for _ in range(5)] == ["r0", "r1", "r2", "r3", "r4"]
+    # A crash leaves only the last page-boundary checkpoint behind; `rows`
+    # is still alive, so its cleanup has not run.
+    resumed = Job(store, "export").paginate(client.query_data_source, "ds")
+    assert [r["id"] for r in resumed] == ["r3", "r4", "r5", "r6"]
+    assert Job(store, "export").finished()
+
+
+def test_reset_starts_over(store, mock_client):
+    client = mock_client(FakeApi())
+    job = Job(store, "export")
+    assert len(list(job.paginate(client.query_data_source, "ds"))) == 7
+    assert job.finished() and not job.finished("other")
+    job.reset()
+    assert len(list(job.paginate(client.query_data_source, "ds"))) == 7
+
+
+def _page(name):
+    return {"parent": {"data_source_id": "ds"}, "properties": {"Name": name}}
+
+
+def test_run_bulk_skips_done_items_and_flags_uncertain(store, mock_client):
+    fake = FakeApi()
+    client = mock_client(fake)  # the default RetryPolicy must not re-send a POST after a 5xx
+    job = Job(store, "import")
+    items = ["a", "b", "c", "d"]
+    fake.fail_status = {"c": 400, "d": 502}
+    first = {r.item: r for r in job.run_bulk(
+        lambda name: client.create_page(**_page(name)), items, key=str, max_concurrency=1
+    )}
+    assert first["a"].ok and first["b"].ok
+    assert not first["c"].ok and not first["d"].ok
+
+    second = {r.item: r for r in job.run_bulk(
+        lambda name: client.create_page(**_page(name)), items, key=str, max_concurrency=1
+    )}
+    assert second["a"].attempts == 0 and second["a"].result == {"id": "page-a"}
+    assert second["c"].ok  # the 400 was not applied, so it is retried
+    assert isinstance(second["d"].error, UncertainWrite)
+    assert fake.created == ["a", "b", "c"]
+    assert fake.posts.count("d") == 1  # the 502 was neither retried nor repeated
+
+    third = list(job.run_bulk(
+        lambda name: client.create_page(**_page(name)), ["d"], key=str, retry_uncertain=True
+    ))
+    assert third[0].ok
+    assert fake.created == ["a", "b", "c", "d"]
+
+
+def test_run_bulk_repeats_writes_that_were_never_sent(store, mock_client):
+    fake = FakeApi()
+    client = mock_client(fake, retry_policy=RetryPolicy(max_retries=0))
+    job = Job(store, "import")
+    fake.unreachable = {"a"}
+    first = list(job.run_bulk(lambda name: client.create_page(**_page(name)), ["a"], key=str))
+    assert isinstance(first[0].error, httpx.ConnectError)
+
+    second = list(job.run_bulk(lambda name: client.create_page(**_page(name)), ["a"], key=str))
+    assert second[0].ok
+    assert fake.created == ["a"]
@@ -0,0 +1,138 @@
+"""Tests for the local SQLite mirror (no network required)."""
+
+import httpx
+
+from notion_sdk.mirror import Mirror
+
+from conftest import FakeNotion
+
+
+def _row(row_id, minute, name, status, tags=(), points=None):
+    return {
+        "object": "page",
+        "id": row_id,
+        "created_time": f"2025-06-01T09:{minute:02d}:00.000Z",
+        "last_edited_time": f"2025-06-01T10:{minute:02d}:00.000Z",
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": name}]},
+            "Status": {"type": "status", "status": {"name": status} if status else None},
+            "Tags": {"type": "multi_select", "multi_select": [{"name": t} for t in tags]},
+            "Points": {"type": "number", "number": points},
+        },
+    }
+
+
+class FakeWorkspace(FakeNotion):
+    def __init__(self):
+        super().__init__()
+        self.rows = {}
+        self.page_edited = "2025-06-01T10:00:00.000Z"
+        self.children = {"p1": ["b1", "b2"], "b1": ["b10"]}
+        self.block_fetches = 0
+
+    def respond(self, request, body):
+        path = request.url.path
+        if path.endswith("/query"):
+            since = None
+            if body.get("filter"):
+                since = body["filter"]["last_edited_time"]["on_or_after"]
+            rows = sorted(self.rows.values(), key=lambda r: r["last_edited_time"])
+            rows = [r for r in rows if since is None or r["last_edited_time"] >= since]
+            return httpx.Response(200, json={"results": rows, "has_more": False})
+        if path.startswith("/v1/pages/"):
+            return httpx.Response(200, json={"id": "p1", "last_edited_time": self.page_edited})
+        if path.startswith("/v1/blocks/"):
+            self.block_fetches += 1
+            parent = path.split("/")[3]
+            kids = [
+                {
+                    "id": k,
+                    "type": "paragraph",
+                    "has_children": k in self.children,
+                    "paragraph": {"rich_text": [{"plain_text": f"text {k}"}]},
+                }
+                for k in self.children.get(parent, [])
+            ]
+            return httpx.Response(200, json={"results": kids, "has_more": False})
+        if path == "/v1/comments":
+            comment = {"id": "c1", "discussion_id": "d1", "rich_text": [{"plain_text": "hi"}]}
+            return httpx.Response(200, json={"results": [comment], "has_more": False})
+        return httpx.Response(404, json={})
+
+
+def test_rows_are_queryable_by_property(tmp_path, mock_client):
+    fake = FakeWorkspace()
+    fake.rows["a"] = _row("a", 0, "Alpha", "Done", tags=["x", "y"], points=3)
+    fake.rows["b"] = _row("b", 1, "Beta", "Todo", tags=["y"], points=1)
+    fake.rows["c"] = _row("c", 2, "Gamma", "Done", points=None)
+    mirror = Mirror(mock_client(fake), tmp_path / "mirror.db")
+    assert mirror.refresh_data_source("ds") == 3
+
+    ids = lambda rows: [r["id"] for r in rows]  # noqa: E731
+    assert ids(mirror.pages("ds", where={"Status": "Done"})) == ["a", "c"]
+    assert ids(mirror.pages("ds", where={"Tags": "y"})) == ["a", "b"]
+    assert ids(mirror.pages("ds", where={"Points": 3})) == ["a"]
+    assert ids(mirror.pages("ds", order_by="Points")) == ["b", "a", "c"]
+    assert ids(mirror.pages("ds", order_by="Points", descending=True)) == ["a", "b", "c"]
+    assert ids(mirror.search_titles("amm")) == ["c"]
+    assert mirror.get_page("b")["properties"]["Name"]["title"][0]["plain_text"] == "Beta"
+
+
+def test_incremental_refresh_and_full_prune(tmp_path, mock_client):
+    fake = FakeWorkspace()
+    fake.rows["a"] = _row("a", 0, "Alpha", "Todo")
+    fake.rows["b"] = _row("b", 1, "Beta", "Todo")
+    mirror = Mirror(mock_client(fake), tmp_path / "mirror.db")
+    mirror.refresh_data_source("ds")
+
+    fake.rows["a"] = _row("a", 5, "Alpha", "Done")
+    assert mirror.refresh_data_source("ds") == 1
+    assert [r["id"] for r in mirror.pages("ds", where={"Status": "Done"})] == ["a"]
+
+    del fake.rows["b"]
+    assert mirror.refresh_data_source("ds") == 0
+    assert mirror.get_page("b") is not None
+    mirror.refresh_data_source("ds", full=True)
+    assert mirror.get_page("b") is None
+    assert mirror.pages("ds", where={"Status": "Todo"}) == []
+
+
+def test_page_tree_is_refetched_only_when_edited(tmp_path, mock_client):
+    fake = FakeWorkspace()
+    mirror = Mirror(mock_client(fake), tmp_path / "mirror.db")
+    assert mirror.refresh_page_tree("p1")
+    assert [b["id"] for b in mirror.block_children("p1")] == ["b1", "b2"]
+    assert [b["id"] for b in mirror.block_children("b1")] == ["b10"]
+
+    fetches = fake.block_fetches
+    assert not mirror.refresh_page_tree("p1")
+    assert fake.block_fetches == fetches
+
+    fake.children = {"p1": ["b3"]}
+    fake.page_edited = "2025-06-01T11:00:00.000Z"
+    assert mirror.refresh_page_tree("p1")
+    assert [b["id"] for b in mirror.block_children("p1")] == ["b3"]
+    assert mirror.block_children("b1") == []
+
+
+def test_comments(tmp_path, mock_client):
+    mirror = Mirror(mock_client(FakeWorkspace()), tmp_path / "mirror.db")
+    assert mirror.refresh_comments("p1") == 1
+    assert [c["id"] for c in mirror.comments("p1")] == ["c1"]
+
+
+def test_query_evaluates_notion_filters_locally(tmp_path, mock_client):
+    fake = FakeWorkspace()
+    fake.rows["a"] = _row("a", 0, "Alpha", "Done", points=3)
+    fake.rows["b"] = _row("b", 1, "Beta", "Done", points=5)
+    fake.rows["c"] = _row("c", 2, "Gamma", "Todo", points=9)
+    mirror = Mirror(mock_client(fake), tmp_path / "mirror.db")
+    mirror.refresh_data_source("ds")
+    mirror.client._http = None  # any network call would now fail
+
+    rows = mirror.query(
+        "ds",
+        filter={"property": "Status", "status": {"equals": "Done"}},
+        sorts=[{"property": "Points", "direction": "descending"}],
+    )
+    assert [r["id"] for r in rows] == ["b", "a"]
@@ -0,0 +1,66 @@
+"""Tests for the typed result models."""
+
+from notion_sdk.models import Block, Page, decode_property, wrap, wrap_all
+
+ROW = {
+    "object": "page",
+    "id": "p1",
+    "last_edited_time": "2025-06-01T10:00:00.000Z",
+    "properties": {
+        "Name": {"type": "title", "title": [{"plain_text": "Hello "}, {"plain_text": "world"}]},
+        "Status": {"type": "status", "status": {"name": "Done"}},
+        "Tags": {"type": "multi_select", "multi_select": [{"name": "a"}, {"name": "b"}]},
+        "Score": {"type": "number", "number": 4.5},
+        "Due": {"type": "date", "date": {"start": "2025-06-02", "end": None}},
+        "Owner": {"type": "people", "people": [{"id": "u1"}]},
+        "Calc": {"type": "formula", "formula": {"type": "string", "string": "x"}},
+        "Sum": {"type": "rollup", "rollup": {"type": "number", "number": 7}},
+        "Key": {"type": "unique_id", "unique_id": {"prefix": "TASK", "number": 12}},
+    },
+}
+
+
+def test_page_decodes_properties_on_access():
+    page = wrap(ROW)
+    assert isinstance(page, Page)
+    assert page.title == "Hello world"
+    assert page["Status"] == "Done"
+    assert page["Tags"] == ["a", "b"]
+    assert page["Score"] == 4.5
+    assert page["Due"]["start"] == "2025-06-02"
+    assert page["Owner"] == ["u1"]
+    assert page["Calc"] == "x" and page["Sum"] == 7 and page["Key"] == "TASK-12"
+    assert page.properties.raw("Score") == {"type": "number", "number": 4.5}
+    assert not hasattr(page, "__dict__")
+
+
+def test_projection_keeps_only_requested_properties():
+    pages = list(wrap_all([ROW, ROW], properties=["Name", "Missing"]))
+    assert [list(p.properties) for p in pages] == [["Name"], ["Name"]]
+    assert pages[0].get("Status") is None
+
+
+def test_other_models():
+    block = wrap(
+        {
+            "object": "block",
+            "id": "b1",
+            "type": "paragraph",
+            "has_children": True,
+            "paragraph": {"rich_text": [{"plain_text": "text"}]},
+        }
+    )
+    assert isinstance(block, Block) and block.text == "text" and block.has_children
+    user = wrap({"object": "user", "id": "u1", "name": "Ada", "person": {"email": "a@x"}})
+    assert user.email == "a@x"
+    comment = wrap({"object": "comment", "id": "c1", "rich_text": [{"plain_text": "hi"}]})
+    assert comment.text == "hi"
+    assert wrap({"object": "list"}) == {"object": "list"}
+
+
+def test_rollup_array():
+    prop = {
+        "type": "rollup",
+        "rollup": {"type": "array", "array": [{"type": "number", "number": 1}]},
+    }
+    assert decode_property(prop) == [1]
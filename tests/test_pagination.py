@@ -0,0 +1,70 @@
+"""Tests for the lazy iter_* pagination helpers (no network required)."""
+
+import asyncio
+
+import httpx
+
+from notion_sdk import AsyncNotionClient
+
+from conftest import FakeNotion
+
+TOTAL = 250
+
+
+class PagedRows(FakeNotion):
+    """Serve TOTAL rows from /data_sources/ds1/query and /users, page_size at a time."""
+
+    def __init__(self):
+        super().__init__()
+        self.cursors = []
+
+    def respond(self, request, body):
+        params = body if request.method == "POST" else dict(request.url.params)
+        self.cursors.append(params.get("start_cursor"))
+        start = int(params.get("start_cursor") or 0)
+        size = int(params.get("page_size") or 100)
+        end = min(start + size, TOTAL)
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "results": [{"id": str(i)} for i in range(start, end)],
+                "has_more": end < TOTAL,
+                "next_cursor": str(end) if end < TOTAL else None,
+            },
+        )
+
+
+def test_iter_query_data_source_streams_all_rows(mock_client):
+    fake = PagedRows()
+    rows = list(mock_client(fake).iter_query_data_source("ds1"))
+    assert [r["id"] for r in rows] == [str(i) for i in range(TOTAL)]
+    assert fake.cursors == [None, "100", "200"]
+
+
+def test_pages_are_fetched_lazily(mock_client):
+    fake = PagedRows()
+    it = mock_client(fake).iter_users(page_size=10)
+    assert next(it)["id"] == "0"
+    assert fake.cursors == [None]
+    for _ in range(10):
+        next(it)
+    assert fake.cursors == [None, "10"]
+
+
+def test_prefetch_yields_same_items(mock_client):
+    fake = PagedRows()
+    rows = list(mock_client(fake).iter_users(page_size=30, prefetch=True))
+    assert [r["id"] for r in rows] == [str(i) for i in range(TOTAL)]
+    assert len(fake.cursors) == 9
+
+
+def test_async_iterators(mock_client):
+    async def main():
+        async with mock_client(PagedRows(), client_class=AsyncNotionClient) as client:
+            plain = [r["id"] async for r in client.iter_query_data_source("ds1")]
+            prefetched = [r["id"] async for r in client.iter_users(prefetch=True)]
+        return plain, prefetched
+
+    plain, prefetched = asyncio.run(main())
+    assert plain == prefetched == [str(i) for i in range(TOTAL)]
@@ -0,0 +1,195 @@
+"""Tests for the rate limiter and retry policy (no network required)."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from notion_sdk import AsyncNotionClient, NotionClient
+from notion_sdk.cache import MemoryBackend, ResponseCache
+from notion_sdk.ratelimit import RateLimiter, RetryPolicy, last_queue_wait, parse_retry_after
+
+FAST_RETRY = RetryPolicy(backoff_base=0.001, backoff_max=0.01)
+
+
+def test_token_bucket_paces_threads():
+    limiter = RateLimiter(rate=100, burst=5)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(25)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 5 go out immediately, the remaining 20 are spaced 10 ms apart.
+    assert time.monotonic() - start >= 0.18
+    assert limiter.acquired == 25
+    assert limiter.total_wait > 0
+
+
+def test_retry_after_is_honoured():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.05"}, json={})
+        return httpx.Response(200, json={"object": "page", "id": "p1"})
+
+    client = NotionClient(
+        api_key="test", transport=httpx.MockTransport(handler), retry_policy=FAST_RETRY
+    )
+    assert client.get_page("p1")["id"] == "p1"
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.05
+    # The Retry-After pause is spent waiting on the shared limiter.
+    assert last_queue_wait() >= 0.04
+
+
+def test_5xx_and_connection_errors_are_retried():
+    responses = iter([httpx.ConnectError("boom"), httpx.Response(502), httpx.Response(200, json={})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = next(responses)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        retry_policy=FAST_RETRY,
+    )
+    assert client.get_self() == {}
+
+
+def test_gives_up_after_max_retries():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={})
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        retry_policy=RetryPolicy(max_retries=2, backoff_base=0.001),
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_self()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_retry_after_is_capped_at_backoff_max():
+    throttled = httpx.Response(429, headers={"Retry-After": "86400"})
+    assert RetryPolicy(backoff_max=2.0).delay_for(0, throttled) == 2.0
+
+
+def _page(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"object": "page", "id": request.url.path.split("/")[3]})
+
+
+def test_queue_wait_is_reset_for_requests_that_skip_the_limiter():
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(_page),
+        rate_limit=RateLimiter(rate=20, burst=1),
+        response_cache=ResponseCache(MemoryBackend()),
+    )
+    client.get_page("p1")
+    client.get_page("p2")
+    assert last_queue_wait() >= 0.04
+    client.get_page("p1")  # served from the cache
+    assert last_queue_wait() == 0.0
+
+
+def test_async_queue_wait_reaches_the_caller():
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test",
+            transport=httpx.MockTransport(_page),
+            rate_limit=RateLimiter(rate=20, burst=1),
+        ) as client:
+            waits = []
+            for page_id in ("p1", "p2"):
+                await client.get_page(page_id)
+                waits.append(last_queue_wait())
+            return waits
+
+    first, second = asyncio.run(main())
+    assert first == 0.0 and second >= 0.04
+
+
+def test_delay_does_not_claim_a_slot():
+    limiter = RateLimiter(rate=10, burst=1)
+    assert limiter.delay() == 0.0
+    limiter.reserve()
+    assert 0.09 < limiter.delay() <= 0.1
+    assert limiter.acquired == 1
+
+
+@pytest.mark.parametrize("failure", [httpx.ReadTimeout("slow"), httpx.Response(502)])
+def test_writes_are_not_repeated_after_ambiguous_failures(failure):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if isinstance(failure, Exception):
+            raise failure
+        return failure
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        retry_policy=FAST_RETRY,
+    )
+    with pytest.raises((httpx.ReadTimeout, httpx.HTTPStatusError)):
+        client.create_page(parent={"page_id": "p"}, properties={})
+    with pytest.raises((httpx.ReadTimeout, httpx.HTTPStatusError)):
+        client.append_block_children("b", children=[])
+    assert calls == ["POST", "PATCH"]
+
+
+def test_writes_are_retried_when_never_sent_or_throttled():
+    responses = iter(
+        [httpx.ConnectError("refused"), httpx.Response(429, headers={"Retry-After": "0"}),
+         httpx.Response(200, json={"id": "p"})]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = next(responses)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        retry_policy=FAST_RETRY,
+    )
+    assert client.create_page(parent={"page_id": "p"}, properties={}) == {"id": "p"}
+
+
+def test_reads_and_opt_in_writes_are_retried_after_5xx():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(502) if len(calls) % 2 else httpx.Response(200, json={})
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        retry_policy=RetryPolicy(backoff_base=0.001, retry_unsafe_methods=True),
+    )
+    client.query_data_source("ds")
+    client.create_page(parent={"page_id": "p"}, properties={})
+    assert calls == ["POST", "POST", "POST", "POST"]
@@ -0,0 +1,131 @@
+"""Tests for the level-by-level relation graph walker."""
+
+import asyncio
+
+import httpx
+
+from notion_sdk import AsyncNotionClient
+from notion_sdk.graph import RelationGraph
+
+from conftest import FakeNotion, notion_error
+
+# project -> tasks -> owners; t2 links back to the project (a cycle).
+RELATIONS = {
+    "proj": {"Tasks": ["t1", "t2"], "Owner": ["alice"]},
+    "t1": {"Owner": ["bob"], "Project": ["proj"]},
+    "t2": {"Owner": ["alice"], "Project": ["proj"], "Blocked by": ["t3"]},
+    "t3": {"Owner": ["carol"]},
+    "alice": {},
+    "bob": {},
+    "carol": {},
+}
+
+
+def _page(page_id):
+    return {
+        "object": "page",
+        "id": page_id,
+        "properties": {
+            name: {"type": "relation", "relation": [{"id": t} for t in targets], "has_more": False}
+            for name, targets in RELATIONS[page_id].items()
+        }
+        | {"Title": {"type": "title", "title": []}},
+    }
+
+
+class FakePages(FakeNotion):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def respond(self, request, body):
+        page_id = request.url.path.split("/")[3]
+        with self.lock:
+            self.calls.append(page_id)
+        if page_id not in RELATIONS:
+            return notion_error(404)
+        return httpx.Response(200, json=_page(page_id))
+
+
+def test_walk_fetches_each_page_once_level_by_level(mock_client):
+    fake = FakePages()
+    graph = mock_client(fake).walk_relations(["proj"], max_depth=3)
+
+    assert sorted(fake.calls) == sorted(RELATIONS)
+    assert graph.depth == {
+        "proj": 0,
+        "t1": 1,
+        "t2": 1,
+        "alice": 1,
+        "bob": 2,
+        "t3": 2,
+        "carol": 3,
+    }
+    assert graph.neighbors("proj", "Tasks") == ["t1", "t2"]
+    assert graph.adjacency()["t2"] == {"alice", "proj", "t3"}
+    assert graph.errors == {}
+
+
+def test_max_depth_allowlist_and_start_pages(mock_client):
+    fake = FakePages()
+    graph = mock_client(fake).walk_relations([_page("proj")], max_depth=1, properties=["Tasks"])
+    assert sorted(fake.calls) == ["t1", "t2"]
+    assert set(graph.pages) == {"proj", "t1", "t2"}
+    # Edges outside the allowlist are recorded but not followed.
+    assert graph.neighbors("t1", "Owner") == ["bob"]
+
+
+def test_graph_is_reused_and_errors_recorded(mock_client):
+    fake = FakePages()
+    client = mock_client(fake)
+    RELATIONS["t1"]["Blocked by"] = ["ghost"]
+    try:
+        graph = client.walk_relations(["proj"], max_depth=1, properties=["Tasks"])
+        fake.calls.clear()
+        graph = client.walk_relations(
+            ["t1", "t2"], max_depth=1, properties=["Blocked by"], graph=graph
+        )
+    finally:
+        del RELATIONS["t1"]["Blocked by"]
+    # t1 and t2 are memoized; only the new level is requested.
+    assert sorted(fake.calls) == ["ghost", "t3"]
+    assert "t3" in graph.pages
+    assert graph.errors["ghost"].response.status_code == 404
+
+
+def test_truncated_relations_are_reported():
+    page = _page("proj")
+    page["properties"]["Tasks"]["has_more"] = True
+    graph = RelationGraph()
+    graph._add(page, 0)
+    assert graph.truncated == [("proj", "Tasks")]
+
+
+def test_async_walk(mock_client):
+    fake = FakePages()
+
+    async def main():
+        async with mock_client(fake, client_class=AsyncNotionClient) as client:
+            return await client.walk_relations(["proj"], max_depth=2)
+
+    graph = asyncio.run(main())
+    assert set(graph.pages) == {"proj", "t1", "t2", "alice", "bob", "t3"}
+    assert sorted(fake.calls) == sorted(graph.pages)
+
+
+def test_async_walk_from_query_results(mock_client):
+    fake = FakePages()
+
+    def handler(request):
+        if request.url.path == "/v1/data_sources/ds/query":
+            rows = [_page("proj"), _page("t3")]
+            return httpx.Response(200, json={"results": rows, "has_more": False})
+        return fake(request)
+
+    async def main():
+        async with mock_client(handler, client_class=AsyncNotionClient) as client:
+            return await client.walk_relations(client.iter_query_data_source("ds"), max_depth=1)
+
+    graph = asyncio.run(main())
+    assert set(graph.pages) == {"proj", "t1", "t2", "alice", "t3", "carol"}
+    assert sorted(fake.calls) == ["alice", "carol", "t1", "t2"]
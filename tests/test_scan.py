@@ -0,0 +1,132 @@
+"""Tests for partitioned parallel data source scans (no network required)."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from notion_sdk import AsyncNotionClient
+from notion_sdk.scan import created_time_partitions, merge_partitions, partitions_overlap
+from notion_sdk.sync import format_time, parse_time
+
+from conftest import FakeNotion
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+ROWS = [
+    {
+        "object": "page",
+        "id": f"p{i}",
+        "created_time": format_time(BASE + timedelta(hours=i)),
+        "properties": {
+            "Kind": {"type": "select", "select": {"name": "ab"[i % 2]} if i % 5 else None},
+        },
+    }
+    for i in range(237)
+]
+SCHEMA = {
+    "object": "data_source",
+    "id": "ds1",
+    "properties": {
+        "Kind": {"type": "select", "select": {"options": [{"name": "a"}, {"name": "b"}]}},
+    },
+}
+
+
+def _matches(row, f):
+    if not f:
+        return True
+    if "and" in f:
+        return all(_matches(row, c) for c in f["and"])
+    if f.get("timestamp") == "created_time":
+        created = parse_time(row["created_time"])
+        cond = f["created_time"]
+        if "on_or_after" in cond and created < parse_time(cond["on_or_after"]):
+            return False
+        if "before" in cond and created >= parse_time(cond["before"]):
+            return False
+        return True
+    value = row["properties"][f["property"]]["select"]
+    if f["select"].get("is_empty"):
+        return value is None
+    return value is not None and value["name"] == f["select"]["equals"]
+
+
+class FakeDataSource(FakeNotion):
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+
+    def respond(self, request, body):
+        if request.method == "GET":
+            return httpx.Response(200, json=SCHEMA)
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            rows = [r for r in ROWS if _matches(r, body.get("filter"))]
+            start = int(body.get("start_cursor") or 0)
+            size = body.get("page_size", 100)
+            end = start + size
+            return httpx.Response(
+                200,
+                json={
+                    "object": "list",
+                    "results": rows[start:end],
+                    "has_more": end < len(rows),
+                    "next_cursor": str(end) if end < len(rows) else None,
+                },
+            )
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_created_time_partitions_cover_everything():
+    filters = created_time_partitions(BASE, BASE + timedelta(days=10), 4)
+    assert len(filters) == 4
+    assert "before" in filters[0]["created_time"]
+    assert "on_or_after" in filters[-1]["created_time"]
+    assert created_time_partitions(BASE, BASE, 1) == [{}]
+
+
+def test_only_overlapping_partitions_are_deduplicated():
+    rows = {"x": [{"id": "1"}, {"id": "2"}], "y": [{"id": "2"}, {"id": "3"}]}
+    merged = merge_partitions(lambda f: iter(rows[f]), ["x", "y"], 1, ordered=True)
+    assert [r["id"] for r in merged] == ["1", "2", "2", "3"]
+    merged = merge_partitions(lambda f: iter(rows[f]), ["x", "y"], 1, ordered=True, dedupe=True)
+    assert [r["id"] for r in merged] == ["1", "2", "3"]
+    assert partitions_overlap({"type": "multi_select"})
+    assert not partitions_overlap({"type": "select"})
+
+
+def test_scan_by_created_time_returns_every_row_once(mock_client):
+    rows = list(mock_client(FakeDataSource()).scan_data_source("ds1", partitions=5, page_size=20))
+    assert sorted(r["id"] for r in rows) == sorted(r["id"] for r in ROWS)
+
+
+def test_ordered_scan_preserves_creation_order(mock_client):
+    rows = mock_client(FakeDataSource()).scan_data_source(
+        "ds1",
+        partitions=4,
+        ordered=True,
+        max_concurrency=2,
+        sorts=[{"timestamp": "created_time", "direction": "ascending"}],
+        page_size=25,
+    )
+    assert [r["id"] for r in rows] == [r["id"] for r in ROWS]
+
+
+def test_scan_by_select_property(mock_client):
+    fake = FakeDataSource()
+    rows = list(mock_client(fake).scan_data_source("ds1", by="Kind", max_concurrency=2))
+    assert len(rows) == len(ROWS)
+    assert fake.peak <= 2
+
+
+def test_async_scan(mock_client):
+    async def main():
+        async with mock_client(FakeDataSource(), client_class=AsyncNotionClient) as client:
+            return [r["id"] async for r in client.scan_data_source("ds1", by="Kind")]
+
+    assert sorted(asyncio.run(main())) == sorted(r["id"] for r in ROWS)
@@ -0,0 +1,106 @@
+"""Tests for the local FTS5 search index (no network required)."""
+
+import httpx
+
+from notion_sdk.search_index import SearchIndex
+
+from conftest import FakeNotion
+
+
+def _page(pid, minute, title):
+    return {
+        "object": "page",
+        "id": pid,
+        "url": f"https://notion.so/{pid}",
+        "last_edited_time": f"2025-06-01T10:{minute:02d}:00.000Z",
+        "properties": {"Name": {"type": "title", "title": [{"plain_text": title}]}},
+    }
+
+
+class FakeSearch(FakeNotion):
+    def __init__(self):
+        super().__init__()
+        self.objects = {}
+        self.pages_served = 0
+        self.blocks = {}
+
+    def respond(self, request, body):
+        if request.url.path.startswith("/v1/blocks/"):
+            page_id = request.url.path.split("/")[3]
+            results = [
+                {"id": f"{page_id}-b", "type": "paragraph", "has_children": False,
+                 "paragraph": {"rich_text": [{"plain_text": self.blocks.get(page_id, "")}]}}
+            ]
+            return httpx.Response(200, json={"results": results, "has_more": False})
+        assert body["sort"] == {"direction": "descending", "timestamp": "last_edited_time"}
+        ordered = sorted(self.objects.values(), key=lambda o: o["last_edited_time"], reverse=True)
+        start = int(body.get("start_cursor") or 0)
+        size = 2
+        self.pages_served += 1
+        more = start + size < len(ordered)
+        return httpx.Response(
+            200,
+            json={
+                "results": ordered[start : start + size],
+                "has_more": more,
+                "next_cursor": str(start + size) if more else None,
+            },
+        )
+
+
+def test_prefix_search_and_ranking(tmp_path, mock_client):
+    fake = FakeSearch()
+    fake.objects["a"] = _page("a", 0, "Project Roadmap 2025")
+    fake.objects["b"] = _page("b", 1, "Roadmap review notes")
+    fake.objects["c"] = _page("c", 2, "Café menu")
+    fake.objects["d"] = {
+        "object": "database",
+        "id": "d",
+        "title": [{"plain_text": "Projects DB"}],
+        "last_edited_time": "2025-06-01T10:03:00.000Z",
+    }
+    index = SearchIndex(mock_client(fake), tmp_path / "search.db")
+    assert index.refresh() == 4
+
+    assert [r["id"] for r in index.search("proj road")] == ["a"]
+    assert {r["id"] for r in index.search("roadm")} == {"a", "b"}
+    assert [r["id"] for r in index.search("cafe")] == ["c"]
+    assert index.search("projects")[0] == {
+        "id": "d",
+        "object": "database",
+        "title": "Projects DB",
+        "url": None,
+        "last_edited_time": "2025-06-01T10:03:00.000Z",
+    }
+    assert index.search("   ") == []
+
+
+def test_incremental_refresh_stops_at_watermark(tmp_path, mock_client):
+    fake = FakeSearch()
+    for i in range(10):
+        fake.objects[f"p{i}"] = _page(f"p{i}", i * 10 % 60, f"Page {i}")
+    index = SearchIndex(mock_client(fake), tmp_path / "search.db")
+    index.refresh()
+    assert len(index) == 10
+
+    fake.pages_served = 0
+    fake.objects["p3"] = _page("p3", 59, "Renamed three")
+    fake.objects["p3"]["last_edited_time"] = "2025-06-01T11:00:00.000Z"
+    assert index.refresh() == 1
+    assert fake.pages_served == 2  # of 5; stops at the first page past the watermark
+    assert [r["id"] for r in index.search("renamed")] == ["p3"]
+    assert index.search("page 3", titles_only=True) == []
+
+    del fake.objects["p0"]
+    index.refresh(full=True)
+    assert len(index) == 9
+
+
+def test_content_indexing(tmp_path, mock_client):
+    fake = FakeSearch()
+    fake.objects["a"] = _page("a", 0, "Meeting")
+    fake.blocks["a"] = "discussed quarterly budget"
+    index = SearchIndex(mock_client(fake), tmp_path / "search.db", content=True)
+    index.refresh()
+    assert [r["id"] for r in index.search("budg")] == ["a"]
+    assert index.search("budg", titles_only=True) == []
@@ -0,0 +1,155 @@
+"""Tests for coalescing of identical concurrent GETs."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from notion_sdk import AsyncNotionClient, NotionClient
+from notion_sdk.cache import ResponseCache
+
+
+def test_concurrent_identical_gets_share_one_request():
+    release = threading.Event()
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        release.wait(5)
+        return httpx.Response(200, json={"id": "p1", "properties": {}})
+
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(handler), rate_limit=None)
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(client.get_page, "p1") for _ in range(8)]
+        while client.single_flight.coalesced < 7:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert client.single_flight.coalesced == 7
+    assert all(r == {"id": "p1", "properties": {}} for r in results)
+    # Every caller gets its own object.
+    assert len({id(r) for r in results}) == 8
+
+
+def test_errors_reach_every_waiter_and_later_calls_retry():
+    release = threading.Event()
+    status = [404]
+
+    def handler(request):
+        release.wait(5)
+        return httpx.Response(status[0], json={"id": "p1"})
+
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(handler), rate_limit=None)
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(client.get_page, "p1") for _ in range(3)]
+        while client.single_flight.coalesced < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        for f in futures:
+            with pytest.raises(httpx.HTTPStatusError):
+                f.result()
+
+    status[0] = 200
+    assert client.get_page("p1") == {"id": "p1"}
+
+
+def test_different_params_and_writes_are_not_coalesced():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, str(request.url)))
+        return httpx.Response(200, json={"results": [], "has_more": False})
+
+    client = NotionClient(api_key="test", transport=httpx.MockTransport(handler), rate_limit=None)
+    client.get_block_children("b1", page_size=10)
+    client.get_block_children("b1", page_size=20)
+    client.update_page("p1", properties={})
+    assert len(calls) == 3
+    assert client.single_flight.coalesced == 0
+
+    off = NotionClient(api_key="test", transport=httpx.MockTransport(handler), coalesce=False)
+    assert off.single_flight is None
+
+
+def test_async_gets_are_coalesced():
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": "ds1"})
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test", transport=httpx.MockTransport(handler), rate_limit=None
+        ) as client:
+            results = await asyncio.gather(*(client.get_data_source("ds1") for _ in range(5)))
+            return client.single_flight.coalesced, results
+
+    coalesced, results = asyncio.run(main())
+    assert len(calls) == 1
+    assert coalesced == 4
+    assert results == [{"id": "ds1"}] * 5
+
+
+def test_gets_after_a_write_do_not_join_an_older_request():
+    first_get = threading.Event()
+    release = threading.Event()
+    version = [1]
+    gets = []
+
+    def handler(request):
+        if request.method == "PATCH":
+            version[0] = 2
+            return httpx.Response(200, json={"object": "page", "id": "p1", "v": 2})
+        seen = version[0]
+        gets.append(seen)
+        if len(gets) == 1:
+            first_get.set()
+            release.wait(5)
+        return httpx.Response(200, json={"object": "page", "id": "p1", "v": seen})
+
+    client = NotionClient(
+        api_key="test",
+        transport=httpx.MockTransport(handler),
+        rate_limit=None,
+        response_cache=ResponseCache(),
+    )
+    with ThreadPoolExecutor(2) as pool:
+        stale = pool.submit(client.get_page, "p1")
+        first_get.wait(5)
+        client.update_page("p1", properties={})
+        assert client.get_page("p1")["v"] == 2  # its own request, not the stale one
+        release.set()
+        assert stale.result()["v"] == 1
+    # The pre-write response was not written into the cache afterwards.
+    assert client.get_page("p1")["v"] == 2
+    assert gets == [1, 2]
+
+
+def test_async_gets_after_a_write_do_not_join_an_older_request():
+    version = [1]
+
+    async def handler(request):
+        if request.method == "PATCH":
+            version[0] = 2
+            return httpx.Response(200, json={"id": "p1", "v": 2})
+        seen = version[0]
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": "p1", "v": seen})
+
+    async def main():
+        async with AsyncNotionClient(
+            api_key="test", transport=httpx.MockTransport(handler), rate_limit=None
+        ) as client:
+            stale = asyncio.ensure_future(client.get_page("p1"))
+            await asyncio.sleep(0.01)
+            await client.update_page("p1", properties={})
+            fresh = await client.get_page("p1")
+            return (await stale)["v"], fresh["v"]
+
+    assert asyncio.run(main()) == (1, 2)
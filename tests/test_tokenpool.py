@@ -0,0 +1,147 @@
+"""Tests for the multi-token pool."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from notion_sdk.cache import MemoryBackend, ResponseCache
+from notion_sdk.ratelimit import RetryPolicy
+from notion_sdk.tokenpool import AsyncTokenPool, TokenPool
+
+
+class Server:
+    """Answers GET /pages/{id}; per-token behaviour is configurable."""
+
+    def __init__(self, throttled=(), revoked=(), scopes=None):
+        self.throttled = set(throttled)
+        self.revoked = set(revoked)
+        self.scopes = scopes or {}
+        self.calls = []
+
+    def __call__(self, request):
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        self.calls.append(token)
+        page_id = request.url.path.rsplit("/", 1)[-1]
+        if token in self.revoked:
+            return httpx.Response(401, json={"object": "error", "status": 401})
+        if token in self.throttled:
+            return httpx.Response(429, headers={"Retry-After": "60"}, json={"status": 429})
+        if token in self.scopes and page_id not in self.scopes[token]:
+            return httpx.Response(404, json={"object": "error", "status": 404})
+        return httpx.Response(200, json={"object": "page", "id": page_id, "token": token})
+
+
+def _pool(server, keys=("a", "b", "c"), **kwargs):
+    return TokenPool(
+        list(keys),
+        rate_limit=None,
+        transport=httpx.MockTransport(server),
+        retry_policy=RetryPolicy(max_retries=0),
+        **kwargs,
+    )
+
+
+def test_requests_spread_across_tokens():
+    server = Server()
+    pool = _pool(server)
+    for i in range(6):
+        pool.client.get_page(f"p{i}")
+    assert sorted(server.calls) == ["a", "a", "b", "b", "c", "c"]
+    assert [h["requests"] for h in pool.health()] == [2, 2, 2]
+
+
+def test_rate_budget_is_per_token():
+    server = Server()
+    pool = TokenPool(
+        ["a", "b"], rate_limit=1.0, transport=httpx.MockTransport(server), coalesce=False
+    )
+    for i in range(2):
+        pool.client.get_page(f"p{i}")
+    # Each token spent its one-request burst; neither had to wait.
+    assert sorted(server.calls) == ["a", "b"]
+    assert all(t.limiter.total_wait == 0 for t in pool._tokens.tokens)
+
+
+def test_throttled_token_is_avoided():
+    server = Server(throttled={"a"})
+    pool = _pool(server)
+    pages = [pool.client.get_page(f"p{i}") for i in range(4)]
+    assert all(p["token"] != "a" for p in pages)
+    assert server.calls.count("a") == 1  # one 429, then cooled down
+    health = pool.health()
+    assert health[0]["throttles"] == 1 and health[0]["throttled_for"] > 50
+
+
+def test_all_throttled_returns_429():
+    server = Server(throttled={"a", "b"})
+    pool = _pool(server, keys=("a", "b"))
+    with pytest.raises(httpx.HTTPStatusError) as info:
+        pool.client.get_page("p")
+    assert info.value.response.status_code == 429
+    assert sorted(server.calls) == ["a", "b"]
+
+
+def test_revoked_token_is_disabled():
+    server = Server(revoked={"b"})
+    pool = _pool(server, keys=("a", "b"))
+    for i in range(4):
+        pool.client.get_page(f"p{i}")
+    assert server.calls.count("b") <= 1
+    assert pool.health()[1]["disabled"]
+
+
+def test_client_for_pins_work_key_to_one_token():
+    server = Server(scopes={"a": {"p1"}, "b": {"p2"}})
+    pool = _pool(server, keys=("a", "b"))
+    first = pool.client_for("team-1", token=0)
+    assert pool.client_for("team-1") is first
+    assert first.get_page("p1")["token"] == "a"
+    with pytest.raises(httpx.HTTPStatusError):
+        first.get_page("p2")  # not retried on another token
+    assert server.calls == ["a", "a"]
+
+    other = pool.client_for("team-2")
+    assert other.get_page("p2")["token"] == "b"  # fewer pins on b
+    assert [h["pinned"] for h in pool.health()] == [1, 1]
+    pool.release("team-2")
+    assert [h["pinned"] for h in pool.health()] == [1, 0]
+
+
+def test_pinned_client_does_not_move_on_429():
+    server = Server(throttled={"a"})
+    pool = _pool(server, keys=("a", "b"))
+    with pytest.raises(httpx.HTTPStatusError):
+        pool.client_for("job", token=0).get_page("p")
+    assert server.calls == ["a"]
+
+
+def test_empty_pool_rejected():
+    with pytest.raises(ValueError):
+        TokenPool([])
+
+
+@pytest.mark.parametrize("pool_class", [TokenPool, AsyncTokenPool])
+def test_shared_response_cache_rejected(pool_class):
+    # A page cached through one token must not be served to another.
+    with pytest.raises(ValueError, match="response_cache"):
+        pool_class(["a", "b"], response_cache=ResponseCache(MemoryBackend()))
+
+
+def test_async_pool_spreads_and_avoids_throttled():
+    server = Server(throttled={"a"})
+
+    async def main():
+        async with AsyncTokenPool(
+            ["a", "b", "c"],
+            rate_limit=None,
+            transport=httpx.MockTransport(server),
+            retry_policy=RetryPolicy(max_retries=0),
+        ) as pool:
+            pages = await asyncio.gather(*(pool.client.get_page(f"p{i}") for i in range(6)))
+            pinned = await pool.client_for("k", token=2).get_page("x")
+            return pages, pinned
+
+    pages, pinned = asyncio.run(main())
+    assert {p["token"] for p in pages} == {"b", "c"}
+    assert pinned["token"] == "c"
@@ -0,0 +1,90 @@
+"""Tests for pooled/shared transports against a local HTTP server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from notion_sdk import NotionClient
+from notion_sdk.hooks import MetricsCollector
+from notion_sdk.transport import PooledTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen_auth: list = []
+
+    def do_GET(self):
+        self.seen_auth.append(self.headers["Authorization"])
+        body = json.dumps({"object": "user", "id": "me"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_shared_transport_reuses_connections_across_api_keys(server_url):
+    _Handler.seen_auth = []
+    shared = PooledTransport()
+    a = NotionClient(api_key="key-a", base_url=server_url, transport=shared, rate_limit=None)
+    b = NotionClient(api_key="key-b", base_url=server_url, transport=shared, rate_limit=None)
+    for _ in range(3):
+        a.get_self()
+        b.get_self()
+    a.close()
+    b.get_self()  # closing a client leaves the shared pool open
+
+    assert _Handler.seen_auth == ["Bearer key-a", "Bearer key-b"] * 3 + ["Bearer key-b"]
+    stats = shared.stats()
+    assert stats["requests"] == 7
+    assert stats["new_connections"] == 1
+    assert stats["reuse_ratio"] == pytest.approx(6 / 7)
+    shared.close()
+
+
+def test_default_pool_and_timeouts(server_url):
+    metrics = MetricsCollector()
+    client = NotionClient(
+        api_key="key",
+        base_url=server_url,
+        rate_limit=None,
+        limits=httpx.Limits(max_connections=2, keepalive_expiry=5.0),
+        timeout=httpx.Timeout(5.0, connect=1.0),
+        hooks=[metrics],
+    )
+    client.get_self()
+    client.get_self()
+    assert client.transport.stats()["new_connections"] == 1
+    summary = metrics.summary()["GET /users/me"]
+    assert summary["new_connections"] == 1 and summary["ttfb_p50"] is not None
+    client.close()
+
+
+def test_resending_a_request_counts_each_connection_once(server_url):
+    transport = PooledTransport(limits=httpx.Limits(max_keepalive_connections=0))
+    request = httpx.Request("GET", f"{server_url}/users/me")
+    for _ in range(3):
+        response = transport.handle_request(request)
+        response.read()
+        response.close()
+    stats = transport.stats()
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 3
+    assert stats["reuse_ratio"] == 0.0
+    transport.close()
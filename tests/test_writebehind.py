@@ -0,0 +1,96 @@
+"""Tests for the write-behind update queue."""
+
+import time
+
+import httpx
+import pytest
+
+from notion_sdk.writebehind import WriteBehindQueue
+
+from conftest import FakeNotion, notion_error
+
+
+class FakeWrites(FakeNotion):
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.writes = []
+        self.delay = delay
+
+    def respond(self, request, body):
+        time.sleep(self.delay)
+        object_id = request.url.path.split("/")[3]
+        with self.lock:
+            self.writes.append((request.url.path.split("/")[2], object_id, body))
+        if object_id == "bad":
+            return notion_error(400)
+        return httpx.Response(200, json={"id": object_id, "sent": body})
+
+
+def _prop(value):
+    return {"rich_text": [{"text": {"content": value}}]}
+
+
+def test_updates_to_one_object_are_merged(mock_client):
+    fake = FakeWrites()
+    with WriteBehindQueue(mock_client(fake), flush_interval=10) as queue:
+        f1 = queue.update_page("p1", properties={"A": _prop("1"), "B": _prop("1")})
+        f2 = queue.update_page("p1", properties={"A": _prop("2")}, icon={"emoji": "x"})
+        f3 = queue.update_block("b1", paragraph={"rich_text": []})
+        assert queue.pending() == 2
+    assert len(fake.writes) == 2
+    page = next(r for r in fake.writes if r[0] == "pages")
+    assert page[2] == {"properties": {"A": _prop("2"), "B": _prop("1")}, "icon": {"emoji": "x"}}
+    assert f1.result() is f2.result()
+    assert f3.result()["id"] == "b1"
+    assert (queue.submitted, queue.sent) == (3, 2)
+
+
+def test_timer_flushes_in_background(mock_client):
+    fake = FakeWrites()
+    queue = WriteBehindQueue(mock_client(fake), flush_interval=0.05)
+    future = queue.update_page("p1", archived=True)
+    assert fake.writes == []
+    assert future.result(timeout=2)["sent"] == {"archived": True}
+    queue.close()
+
+
+def test_size_threshold_flushes_early(mock_client):
+    fake = FakeWrites()
+    queue = WriteBehindQueue(mock_client(fake), flush_interval=60, max_pending=3)
+    futures = [queue.update_page(f"p{i}", archived=True) for i in range(3)]
+    for f in futures:
+        f.result(timeout=2)
+    assert len(fake.writes) == 3
+    queue.close()
+
+
+def test_per_object_order_and_no_merge_into_inflight(mock_client):
+    fake = FakeWrites(delay=0.05)
+    queue = WriteBehindQueue(mock_client(fake), flush_interval=0)
+    first = queue.update_page("p1", properties={"A": _prop("1")})
+    while not queue._inflight:
+        time.sleep(0.001)
+    second = queue.update_page("p1", properties={"A": _prop("2")})
+    third = queue.update_page("p1", erase_content=True)
+    queue.close()
+    assert [r[2] for r in fake.writes] == [
+        {"properties": {"A": _prop("1")}},
+        {"properties": {"A": _prop("2")}},
+        {"erase_content": True},
+    ]
+    assert first.result() is not second.result()
+    assert third.done()
+
+
+def test_errors_reach_futures_and_close_rejects_new_work(mock_client):
+    fake = FakeWrites()
+    queue = WriteBehindQueue(mock_client(fake), flush_interval=10)
+    bad = queue.update_page("bad", archived=True)
+    good = queue.update_page("ok", archived=True)
+    queue.flush()
+    with pytest.raises(httpx.HTTPStatusError):
+        bad.result()
+    assert good.result()["id"] == "ok"
+    queue.close()
+    with pytest.raises(RuntimeError):
+        queue.update_page("p1", archived=True)